@@ -0,0 +1,54 @@
+"""
+Compare scanning and FM-index pattern queries on a synthetic genome.
+
+Usage: python -m benchmarks.bench_index --size 10000000 --queries 10
+"""
+import argparse
+import random
+import time
+
+from biolib import BioLib
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size', type=int, default=10_000_000)
+    parser.add_argument('--queries', type=int, default=10)
+    parser.add_argument('--pattern-length', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    generator = random.Random(args.seed)
+    sequence = ''.join(generator.choices("ACGT", k=args.size))
+    patterns = []
+    for _ in range(args.queries):
+        start = generator.randrange(args.size - args.pattern_length)
+        patterns.append(sequence[start:start+args.pattern_length])
+
+    scan = BioLib()
+    scan.set_genome(sequence)
+    indexed = BioLib()
+    start = time.perf_counter()
+    indexed.set_genome(sequence, index=True)
+    build_time = time.perf_counter() - start
+    print(f"Index build: {build_time:.3f}s for {args.size} bases")
+
+    for method in ('count_pattern', 'match_pattern'):
+        start = time.perf_counter()
+        scan_results = [getattr(scan, method)(pattern) for pattern in patterns]
+        scan_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index_results = [getattr(indexed, method)(pattern) for pattern in patterns]
+        index_time = time.perf_counter() - start
+
+        if scan_results != index_results:
+            raise SystemExit(f"{method}: index results differ from scan results")
+        print(
+            f"{method}: scan {scan_time / len(patterns):.4f}s/query, "
+            f"index {index_time / len(patterns):.6f}s/query"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,226 @@
+"""
+Time BioLib methods on seeded synthetic genomes and flag regressions.
+
+Usage: python -m benchmarks.bench_suite --sizes 1k,1M --output results.json
+       python -m benchmarks.bench_suite --sizes 1k,1M --baseline results.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, NamedTuple
+
+import numpy as np
+
+from biolib import BioLib
+
+DEFAULT_SIZES = '1k,10k,100k,1M,10M,100M'
+SIZE_SUFFIXES = {'k': 10**3, 'M': 10**6, 'G': 10**9}
+
+
+class Case(NamedTuple):
+    """One benchmarked call; run receives a BioLib holding the genome and the genome text."""
+    name: str
+    params: dict
+    run: Callable[[BioLib, str], object]
+    max_size: int = 10**8
+    index: bool = False
+
+
+def pattern_of(sequence: str, k: int) -> str:
+    return sequence[len(sequence) // 2:len(sequence) // 2 + k]
+
+
+def windows_of(sequence: str, count: int, length: int) -> list[str]:
+    """count windows of up to length bases spread evenly over the genome."""
+    length = min(length, len(sequence) // count)
+    step = len(sequence) // count
+    return [sequence[i * step:i * step + length] for i in range(count)]
+
+
+# pure-Python scans (count_pattern, match_pattern, match_patterns) and cases
+# building per-base Python lists are capped below 100M; motif cases work on a
+# fixed number of windows, so larger genomes add nothing but setup time
+CASES = [
+    Case('count_pattern', {'k': 12}, lambda app, sequence: app.count_pattern(pattern_of(sequence, 12)),
+         max_size=10**7),
+    Case('count_pattern', {'k': 12, 'index': True}, lambda app, sequence: app.count_pattern(pattern_of(sequence, 12)),
+         max_size=10**7, index=True),
+    Case('match_pattern', {'k': 12}, lambda app, sequence: app.match_pattern(pattern_of(sequence, 12)),
+         max_size=10**7),
+    Case('count_approximate_pattern', {'k': 12, 'd': 1},
+         lambda app, sequence: app.count_approximate_pattern(pattern_of(sequence, 12), 1)),
+    Case('count_approximate_pattern', {'k': 12, 'd': 3},
+         lambda app, sequence: app.count_approximate_pattern(pattern_of(sequence, 12), 3), max_size=10**7),
+    Case('match_approximate_pattern', {'k': 20, 'd': 2},
+         lambda app, sequence: app.match_approximate_pattern(pattern_of(sequence, 20), 2)),
+    Case('match_approximate_pattern', {'k': 20, 'd': 2, 'index': True},
+         lambda app, sequence: app.match_approximate_pattern(pattern_of(sequence, 20), 2), max_size=10**7, index=True),
+    Case('count_patterns', {'patterns': 100},
+         lambda app, sequence: app.count_patterns([sequence[i:i+10] for i in range(0, 1000, 10)]), max_size=10**7),
+    Case('match_patterns', {'patterns': 100},
+         lambda app, sequence: app.match_patterns(windows_of(sequence, 100, 10)), max_size=10**6),
+    Case('frequency_map', {'k': 3}, lambda app, sequence: app.frequency_map(sequence, 3)),
+    Case('frequency_map', {'k': 12}, lambda app, sequence: app.frequency_map(sequence, 12), max_size=10**7),
+    Case('frequent_words', {'k': 9}, lambda app, sequence: app.frequent_words(sequence, 9), max_size=10**7),
+    Case('frequent_words_with_mismatches', {'k': 8, 'd': 1},
+         lambda app, sequence: app.frequent_words_with_mismatches(sequence, 8, 1), max_size=10**6),
+    Case('get_skew', {}, lambda app, sequence: app.get_skew(), max_size=10**7),
+    Case('get_minimum_skew', {}, lambda app, sequence: app.get_minimum_skew()),
+    Case('get_skew_profile', {'resolution': 1000}, lambda app, sequence: app.get_skew_profile(1000)),
+    Case('count_symbol', {'window': 1000}, lambda app, sequence: app.count_symbol('G', 1000)),
+    Case('calculate_hamming_distance', {},
+         lambda app, sequence: app.calculate_hamming_distance(*windows_of(sequence, 2, len(sequence)))),
+    Case('calculate_hamming_distances', {'length': 100},
+         lambda app, sequence: app.calculate_hamming_distances(
+             pattern_of(sequence, 100), windows_of(sequence, len(sequence) // 100, 100)), max_size=10**7),
+    Case('get_motifs_matrix', {'motifs': 1000, 'k': 12},
+         lambda app, sequence: app.get_motifs_matrix(windows_of(sequence, 1000, 12)), max_size=10**4),
+    Case('get_motifs_consensus', {'motifs': 1000, 'k': 12},
+         lambda app, sequence: app.get_motifs_consensus(windows_of(sequence, 1000, 12)), max_size=10**4),
+    Case('get_motifs_score', {'motifs': 1000, 'k': 12},
+         lambda app, sequence: app.get_motifs_score(windows_of(sequence, 1000, 12)), max_size=10**4),
+    Case('get_motifs_entropy', {'motifs': 1000, 'k': 12},
+         lambda app, sequence: app.get_motifs_entropy(windows_of(sequence, 1000, 12)), max_size=10**4),
+    Case('median_string', {'sequences': 10, 'k': 6},
+         lambda app, sequence: app.median_string(windows_of(sequence, 10, 100), 6), max_size=10**4),
+    Case('randomized_motif_search', {'sequences': 10, 'k': 12, 'restarts': 100},
+         lambda app, sequence: app.randomized_motif_search(windows_of(sequence, 10, 100), 12, 100, seed=0),
+         max_size=10**4),
+    Case('gibbs_sampler', {'sequences': 10, 'k': 12, 'iterations': 200, 'restarts': 5},
+         lambda app, sequence: app.gibbs_sampler(windows_of(sequence, 10, 100), 12, 200, 5, seed=0),
+         max_size=10**4),
+    Case('complement', {}, lambda app, sequence: app.complement(sequence)),
+    Case('reverse_complement', {}, lambda app, sequence: app.reverse_complement(sequence)),
+    Case('translate_rna_to_amino_acid', {}, lambda app, sequence: app.translate_rna_to_amino_acid()),
+    Case('translate_six_frames', {}, lambda app, sequence: app.translate_six_frames(), max_size=10**7),
+    Case('find_orfs', {'min_length': 100}, lambda app, sequence: sum(1 for _ in app.find_orfs(100)), max_size=10**7),
+    Case('build_index', {}, lambda app, sequence: app.build_index(), max_size=10**7),
+]
+
+
+def parse_size(text: str) -> int:
+    """Parse sizes such as 1000, 1k, 10M."""
+    text = text.strip()
+    if text[-1:] in SIZE_SUFFIXES:
+        return int(float(text[:-1]) * SIZE_SUFFIXES[text[-1]])
+    return int(text)
+
+
+def make_genome(size: int, seed: int) -> str:
+    return np.frombuffer(b'ACGT', dtype=np.uint8)[np.random.default_rng(seed).integers(0, 4, size)].tobytes().decode('ascii')
+
+
+def measure(case: Case, app: BioLib, sequence: str, repeats: int) -> dict:
+    """Wall times over repeats, then one traced run for peak memory (tracing slows it down)."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        case.run(app, sequence)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        case.run(app, sequence)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'min_seconds': min(times), 'median_seconds': statistics.median(times), 'peak_bytes': peak}
+
+
+def run_suite(sizes: list[int], cases: list[Case], repeats: int, seed: int, log=None) -> list[dict]:
+    results = []
+    for size in sizes:
+        sequence = make_genome(size, seed)
+        plain, indexed = BioLib(), None
+        plain.set_genome(sequence)
+        for case in cases:
+            if size > case.max_size:
+                continue
+            if case.index and indexed is None:
+                indexed = BioLib()
+                indexed.set_genome(sequence, index=True)
+            result = {'case': case.name, 'params': case.params, 'size': size}
+            result.update(measure(case, indexed if case.index else plain, sequence, repeats))
+            results.append(result)
+            if log is not None:
+                log.write(
+                    f"{case.name:32} {json.dumps(case.params):28} {size:>11} "
+                    f"{result['median_seconds']:10.5f}s {result['peak_bytes'] / 2**20:9.1f} MiB\n"
+                )
+    return results
+
+
+def result_key(result: dict) -> tuple:
+    return result['case'], json.dumps(result['params'], sort_keys=True), result['size']
+
+
+def compare_results(baseline: list[dict], current: list[dict], tolerance: float, min_seconds: float = 1e-3) -> list[dict]:
+    """
+    Results slower (median time) or heavier (peak memory) than the baseline by
+    more than tolerance. Timings under min_seconds are too noisy to flag.
+    """
+    previous = {result_key(result): result for result in baseline}
+    regressions = []
+    for result in current:
+        old = previous.get(result_key(result))
+        if old is None:
+            continue
+        time_ratio = result['median_seconds'] / max(old['median_seconds'], 1e-12)
+        memory_ratio = result['peak_bytes'] / max(old['peak_bytes'], 1)
+        slower = time_ratio > 1 + tolerance and result['median_seconds'] >= min_seconds
+        heavier = memory_ratio > 1 + tolerance and result['peak_bytes'] - old['peak_bytes'] > 1 << 20
+        if slower or heavier:
+            regressions.append({**result, 'time_ratio': time_ratio, 'memory_ratio': memory_ratio})
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="comma-separated genome sizes, e.g. 1k,1M,100M")
+    parser.add_argument('--cases', help="comma-separated case names (all by default)")
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write results as JSON")
+    parser.add_argument('--baseline', help="JSON results to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed slowdown/memory growth ratio")
+    args = parser.parse_args(argv)
+
+    cases = CASES
+    if args.cases:
+        names = set(args.cases.split(','))
+        cases = [case for case in CASES if case.name in names]
+    results = run_suite([parse_size(size) for size in args.sizes.split(',')], cases, args.repeats, args.seed, sys.stdout)
+    report = {
+        'metadata': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'repeats': args.repeats,
+            'timestamp': time.time(),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)['results']
+        regressions = compare_results(baseline, results, args.tolerance)
+        for regression in regressions:
+            print(
+                f"REGRESSION {regression['case']} {json.dumps(regression['params'])} size={regression['size']}: "
+                f"time x{regression['time_ratio']:.2f}, memory x{regression['memory_ratio']:.2f}"
+            )
+        if regressions:
+            raise SystemExit(1)
+        print(f"No regressions against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
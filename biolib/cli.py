@@ -1,5 +1,13 @@
+import argparse
 import cmd
+import csv
+import json
+import sys
+from typing import Iterator, NamedTuple, TextIO
+
 from biolib import BioLib
+from biolib.core.reads import parse_reads
+from biolib.queries import execute
 
 
 class BioLibCLI(cmd.Cmd):
@@ -23,6 +31,20 @@ class BioLibCLI(cmd.Cmd):
         """Alias for set_genome"""
         return self.do_set_genome(line)
 
+    def do_load_genome(self, line):
+        """
+        Load a genome from a FASTA or .2bit file, reading bases lazily.
+        Alias: lg
+        """
+        path = input('Input genome file path: ')
+        name = input('Input record name (empty for first): ')
+        self.app.load_genome(path, name=name or None)
+        print("Genome loaded successfully")
+
+    def do_lg(self, line):
+        """Alias for load_genome"""
+        return self.do_load_genome(line)
+
     def do_count_pattern(self, line):
         """
         Get count of pattern occurrences in a text
@@ -158,8 +180,111 @@ class BioLibCLI(cmd.Cmd):
         print()
         return stop
 
-def main():
+def read_genome(handle: TextIO, name: str | None = None) -> str:
+    """A genome from FASTA text (the named or first record) or from a bare sequence."""
+    lines = (line for line in handle if line.strip())
+    first = next(lines, '')
+    if first.startswith('>'):
+        for read in parse_reads([first] + list(lines)):
+            if name is None or read.name.split()[0] == name:
+                return read.sequence
+        raise ValueError(f"No FASTA record named {name}")
+    return ''.join(line.strip() for line in [first, *lines])
+
+
+class InvalidQuery(NamedTuple):
+    """A query line that could not be parsed, reported as that query's error."""
+    error: str
+
+
+def parse_queries(handle: TextIO) -> Iterator[dict | InvalidQuery]:
+    """
+    Yield queries from a JSON array, JSON Lines or a TSV file with a header
+    row naming the query fields (operation, pattern, max_difference, ...).
+    A malformed JSON line yields an InvalidQuery and the batch goes on; a
+    malformed JSON array yields a single InvalidQuery.
+    """
+    lines = enumerate(handle, 1)
+    first_number, first = next(((number, line) for number, line in lines if line.strip()), (0, ''))
+    if first.lstrip().startswith('['):
+        try:
+            queries = json.loads(first + ''.join(line for _, line in lines))
+        except json.JSONDecodeError as error:
+            yield InvalidQuery(f"Invalid JSON on line {first_number + error.lineno - 1}: {error.msg}")
+            return
+        yield from queries
+    elif first.lstrip().startswith('{'):
+        for number, line in [(first_number, first), *lines]:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as error:
+                yield InvalidQuery(f"Invalid JSON on line {number}: {error.msg}")
+    elif first:
+        rows = [first, *(line for _, line in lines if line.strip())]
+        for row in csv.DictReader(rows, delimiter='\t'):
+            yield {key: value for key, value in row.items() if value not in (None, '')}
+
+
+def write_result(output: TextIO, output_format: str, number: int, query: dict, result: dict):
+    if output_format == 'jsonl':
+        output.write(json.dumps({'query': number, 'operation': query.get('operation'), **result}) + '\n')
+        return
+    value = result.get('result', '')
+    if isinstance(value, (list, dict)):
+        value = json.dumps(value)
+    output.write(f"{number}\t{query.get('operation', '')}\t{value}\t{result.get('error', '')}\n")
+
+
+def run(argv: list[str]) -> int:
+    """Run a batch of queries against one genome, loaded once, streaming results out."""
+    parser = argparse.ArgumentParser(prog='biolib-cli run', description="Run a batch of BioLib queries.")
+    parser.add_argument('--genome', required=True, help="FASTA or .2bit file, or - for FASTA/plain sequence on stdin")
+    parser.add_argument('--name', help="record to use from the genome file (first by default)")
+    parser.add_argument('--genome-type', choices=['linear', 'circular'], default='linear')
+    parser.add_argument('--index', action='store_true', help="build a suffix index before querying")
+    parser.add_argument('--queries', required=True, help="JSON, JSON Lines or TSV query file, or - for stdin")
+    parser.add_argument('--format', choices=['jsonl', 'tsv'], default='jsonl', dest='output_format')
+    parser.add_argument('--output', help="result file (stdout by default)")
+    args = parser.parse_args(argv)
+    if args.genome == '-' and args.queries == '-':
+        parser.error("the genome and the queries cannot both come from stdin")
+
+    app = BioLib()
+    if args.genome == '-':
+        app.set_genome(read_genome(sys.stdin, args.name), args.genome_type, index=args.index)
+    else:
+        app.load_genome(args.genome, args.genome_type, args.name, index=args.index)
+
+    queries = sys.stdin if args.queries == '-' else open(args.queries)
+    output = sys.stdout if args.output is None else open(args.output, 'w')
+    failed = 0
+    try:
+        if args.output_format == 'tsv':
+            output.write("query\toperation\tresult\terror\n")
+        for number, query in enumerate(parse_queries(queries)):
+            if isinstance(query, InvalidQuery):
+                result = {'error': query.error}
+            else:
+                result = execute(app, query) if isinstance(query, dict) else {'error': "Query must be an object"}
+            failed += 'error' in result
+            write_result(output, args.output_format, number, query if isinstance(query, dict) else {}, result)
+            output.flush()
+    finally:
+        if queries is not sys.stdin:
+            queries.close()
+        if output is not sys.stdout:
+            output.close()
+    return 1 if failed else 0
+
+
+def main(argv: list[str] | None = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['run']:
+        sys.exit(run(argv[1:]))
     BioLibCLI().cmdloop()
 
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,328 +1,434 @@
-import math
+import weakref
+from typing import Iterator
 
-from biolib.core.genome import Genome, GenomeFactory
+import numpy as np
 
-1
-class BioLib:
-    genome: Genome
+from biolib.core import complement, hamming, kmers, motifs, orfs, reads, skew, translation
+from biolib.core.cache import DEFAULT_MAX_BYTES, IndexCache, hash_genome
+from biolib.core.edits import Edit, KmerCounts, PatternCount, SkewSummary
+from biolib.core.encoding import to_bytes_array
+from biolib.core.genome import CHUNK_SIZE, CircularGenome, Genome, GenomeFactory
+from biolib.core.index import SuffixIndex, build_suffix_array
+from biolib.core.instrumentation import instrument_methods
+from biolib.core.memo import DEFAULT_MEMO_SIZE, MemoStats, ResultCache, memoized
+from biolib.core.motifs import MotifSet
+from biolib.core.multipattern import AhoCorasick
+from biolib.core.parallel import ParallelScanner
+
+
+def check_pattern(pattern: str):
+    if not pattern:
+        raise ValueError("Pattern must not be empty")
 
-    def set_genome(self, sequence: str, genome_type: str = 'linear'):
-        self.genome = GenomeFactory.create_genome(genome_type, sequence)
 
+@instrument_methods
+class BioLib:
+    genome: Genome
+    index: SuffixIndex | None = None
+    workers: int = 1
+    parallel_min_length: int = 1 << 20
+    cache: IndexCache | None = None
+    genome_key: str | None = None
+    memo: ResultCache | None = None
+    scanner: ParallelScanner | None = None
+    # closes the scanner if this BioLib is collected first; detached by close()
+    scanner_finalizer: weakref.finalize | None = None
+
+    def set_genome(self, sequence: str, genome_type: str = 'linear', index: bool = False, storage: str = 'plain'):
+        self.genome = GenomeFactory.create_genome(genome_type, sequence, storage)
+        self.genome_changed(index)
+
+    def load_genome(self, path: str, genome_type: str = 'linear', name: str | None = None, index: bool = False):
+        self.genome = GenomeFactory.from_file(genome_type, path, name)
+        self.genome_changed(index)
+
+    def genome_changed(self, index: bool):
+        """Reset derived state; an index found in the cache is loaded even when not requested."""
+        self.close()
+        self.index = None
+        self.genome_key = None
+        if self.memo is not None:
+            self.memo.clear()
+        if index or (self.cache is not None and self.cache.get(self.get_genome_key(), 'suffix_array') is not None):
+            self.build_index()
+
+    def apply_edits(self, edits: list[Edit]):
+        """
+        Apply VCF-like edits in place; tracked statistics are updated, the index
+        and memo dropped. Each call copies the sequence once, so batch edits.
+        """
+        self.genome.apply_edits(edits)
+        self.genome_edited()
+
+    def apply_substitution(self, position: int, bases: str):
+        self.genome.apply_substitution(position, bases)
+        self.genome_edited()
+
+    def apply_insertion(self, position: int, bases: str):
+        self.genome.apply_insertion(position, bases)
+        self.genome_edited()
+
+    def apply_deletion(self, position: int, length: int):
+        self.genome.apply_deletion(position, length)
+        self.genome_edited()
+
+    def genome_edited(self):
+        self.close()
+        self.index = None
+        self.genome_key = None
+        if self.memo is not None:
+            self.memo.clear()
+
+    def track_pattern(self, pattern: str):
+        """Keep the count of pattern up to date through edits."""
+        self.genome.add_tracker(('pattern', pattern), PatternCount(self.genome.iter_chunks(len(pattern)-1), pattern))
+
+    def track_kmers(self, pattern_length: int, canonical: bool = False):
+        """Keep the k-mer counts up to date through edits."""
+        chunks = self.genome.iter_chunks(pattern_length-1)
+        self.genome.add_tracker(('kmers', pattern_length, canonical), KmerCounts(chunks, pattern_length, canonical))
+
+    def track_skew(self):
+        """Keep skew block sums up to date through edits, for get_minimum_skew."""
+        self.genome.add_tracker(('skew',), SkewSummary(self.genome.get_storage()))
+
+    def set_cache(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache = IndexCache(directory, max_bytes)
+
+    def enable_memoization(self, max_size: int = DEFAULT_MEMO_SIZE):
+        """Memoize repeated queries against the current genome; set_genome clears the memo."""
+        self.memo = ResultCache(max_size)
+
+    def disable_memoization(self):
+        self.memo = None
+
+    def get_memo_stats(self) -> MemoStats | None:
+        return self.memo.stats() if self.memo is not None else None
+
+    def get_genome_key(self) -> str:
+        if self.genome_key is None:
+            self.genome_key = hash_genome(self.genome.iter_chunks(), type(self.genome).__name__)
+        return self.genome_key
+
+    def cached(self, name: str, build) -> np.ndarray:
+        """Artifact of the current genome, from the on-disk cache when one is set."""
+        if self.cache is None:
+            return build()
+        return self.cache.get_or_build(self.get_genome_key(), name, build)
+
+    def build_index(self):
+        """Build a suffix index; unlike other queries this decodes the whole genome into one string."""
+        text = self.genome.get_sequence()
+        suffix_array = self.cached('suffix_array', lambda: build_suffix_array(text.encode('ascii')))
+        self.index = SuffixIndex(text, suffix_array)
+
+    def set_workers(self, workers: int):
+        self.close()
+        self.workers = workers
+
+    def close(self):
+        """Stop the genome's process pool and free its shared memory."""
+        if self.scanner_finalizer is not None:
+            # runs scanner.close once and drops the finalizer's reference to the scanner
+            self.scanner_finalizer()
+            self.scanner_finalizer = None
+        self.scanner = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_scanner(self) -> ParallelScanner | None:
+        """
+        The process-pool scanner of the genome when workers are set and it is
+        long enough; created on first use and kept until the genome changes.
+        Like the serial scans, it scans circular genomes linearly.
+        """
+        if self.workers <= 1 or self.genome.get_sequence_length() < self.parallel_min_length:
+            return None
+        if self.scanner is None:
+            self.scanner = ParallelScanner(self.genome.get_storage(), self.workers)
+            self.scanner_finalizer = weakref.finalize(self, self.scanner.close)
+        return self.scanner
+
+    @memoized
     def count_pattern(self, pattern: str) -> int:
+        check_pattern(pattern)
+        tracker = self.genome.get_tracker(('pattern', pattern))
+        if tracker is not None:
+            return tracker.count
+        if self.index is not None:
+            return self.index.count(pattern)
+        scanner = self.get_scanner()
+        if scanner is not None:
+            return scanner.count_pattern(pattern)
         count = 0
         pattern_length = len(pattern)
-        for i in range(len(self.genome.get_sequence())-pattern_length+1):
-            if self.genome.get_sequence()[i:i+pattern_length] == pattern:
-                count += 1
+        for _, chunk in self.genome.iter_chunks(pattern_length-1):
+            for i in range(len(chunk)-pattern_length+1):
+                if chunk[i:i+pattern_length] == pattern:
+                    count += 1
         return count
 
-    def count_approximate_pattern(self, pattern: str, max_difference: int) -> int:
-        count = 0
-        pattern_length = len(pattern)
-        for i in range(len(self.genome.get_sequence())-pattern_length+1):
-            if self.calculate_hamming_distance(self.genome.get_sequence()[i:i+pattern_length], pattern) <= max_difference:
-                count += 1
-        return count
+    @memoized
+    def count_approximate_pattern(self, pattern: str, max_difference: int, method: str = 'auto') -> int:
+        return len(self.match_approximate_pattern(pattern, max_difference, method))
 
+    @memoized
     def match_pattern(self, pattern: str) -> list[int]:
+        check_pattern(pattern)
+        if self.index is not None:
+            return self.index.locate(pattern)
+        scanner = self.get_scanner()
+        if scanner is not None:
+            return scanner.match_pattern(pattern)
         positions = []
         pattern_length = len(pattern)
-        for i in range(len(self.genome.get_sequence())-pattern_length+1):
-            if self.genome.get_sequence()[i:i+pattern_length] == pattern:
-                positions.append(i)
+        for start, chunk in self.genome.iter_chunks(pattern_length-1):
+            for i in range(len(chunk)-pattern_length+1):
+                if chunk[i:i+pattern_length] == pattern:
+                    positions.append(start+i)
         return positions
 
-    def match_approximate_pattern(self, pattern: str, max_difference: int) -> list[int]:
+    @memoized
+    def match_approximate_pattern(self, pattern: str, max_difference: int, method: str = 'auto') -> list[int]:
+        check_pattern(pattern)
+        if self.index is not None and hamming.resolve_method(len(pattern), max_difference, method) == 'seed':
+            storage = self.genome.get_storage()
+            return hamming.match_approximate(storage, pattern, max_difference, method, self.index.locate).tolist()
+        scanner = self.get_scanner()
+        if scanner is not None:
+            return scanner.match_approximate_pattern(pattern, max_difference, method)
         positions = []
-        pattern_length = len(pattern)
-        for i in range(len(self.genome.get_sequence())-pattern_length+1):
-            if self.calculate_hamming_distance(self.genome.get_sequence()[i:i+pattern_length], pattern) <= max_difference:
-                positions.append(i)
+        for start, chunk in self.genome.iter_chunks(len(pattern)-1):
+            positions.extend((hamming.match_approximate(chunk, pattern, max_difference, method) + start).tolist())
+        return positions
+
+    def match_patterns(self, patterns: list[str], reverse_complement: bool = False) -> dict[str, list[int]]:
+        """
+        Positions of every pattern, found in a single pass over the genome.
+        With reverse_complement, hits of a pattern's reverse complement count too.
+        """
+        keywords = {}
+        patterns = list(dict.fromkeys(patterns))
+        for pattern in patterns:
+            check_pattern(pattern)
+            keywords.setdefault(pattern, []).append(pattern)
+            if reverse_complement:
+                complement = self.reverse_complement(pattern)
+                if complement != pattern:
+                    keywords.setdefault(complement, []).append(pattern)
+        automaton = AhoCorasick(keywords)
+        matches = []
+        state = 0
+        for start, chunk in self.genome.iter_chunks():
+            state = automaton.scan(chunk, state, start, matches)
+
+        positions = {pattern: [] for pattern in patterns}
+        for end, keyword_id in matches:
+            keyword = automaton.keywords[keyword_id]
+            for pattern in keywords[keyword]:
+                positions[pattern].append(end - len(keyword))
+        if reverse_complement:
+            for pattern, pattern_positions in positions.items():
+                positions[pattern] = sorted(set(pattern_positions))
         return positions
 
-    def frequency_map(self, text: str, pattern_length: int) -> dict[str, int]:
+    def count_patterns(self, patterns: list[str], reverse_complement: bool = False) -> dict[str, int]:
+        return {
+            pattern: len(positions)
+            for pattern, positions in self.match_patterns(patterns, reverse_complement).items()
+        }
+
+    @memoized
+    def frequency_map(self, text: str, pattern_length: int, canonical: bool = False) -> dict[str, int]:
+        if 0 < pattern_length <= kmers.MAX_KMER_LENGTH:
+            scanner = self.get_scanner()
+            if scanner is not None and text == scanner.sequence:
+                return scanner.frequency_map(pattern_length, canonical)
+            if self.workers > 1 and len(text) >= self.parallel_min_length:
+                with ParallelScanner(text, self.workers) as scanner:
+                    return scanner.frequency_map(pattern_length, canonical)
+            return kmers.frequency_map(text, pattern_length, canonical)
         frequency_map = {}
         text_length = len(text)
 
-        for i in range(text_length-pattern_length-1):
+        for i in range(text_length-pattern_length+1):
             pattern = text[i:i+pattern_length]
+            if canonical:
+                pattern = kmers.canonical_kmer(pattern)
             frequency_map[pattern] = frequency_map.get(pattern, 0) + 1
         return frequency_map
 
 
-    def frequent_words(self, text: str, pattern_length: int) -> list[str]:
+    def frequent_words(self, text: str, pattern_length: int, canonical: bool = False) -> list[str]:
+        if 0 < pattern_length <= kmers.MAX_KMER_LENGTH:
+            return kmers.frequent_words(text, pattern_length, canonical)
         words = []
-        frequency_map = self.frequency_map(text, pattern_length)
+        frequency_map = self.frequency_map(text, pattern_length, canonical)
         max_frequency = max(frequency_map.values())
         for pattern, count in frequency_map.items():
             if count == max_frequency:
                 words.append(pattern)
         return words
 
-    def complement(self, text: str):
-        complements = {
-            'A': 'T',
-            'T': 'A',
-            'C': 'G',
-            'G': 'C',
-        }
-        complemented_text = ''
-        for char in text:
-            if char in complements.keys():
-                complemented_text += complements[char]
-            else:
-                complemented_text += char
+    def kmer_counts(self, pattern_length: int, canonical: bool = False) -> tuple[np.ndarray, np.ndarray]:
+        """Distinct integer-encoded k-mers of the genome and their counts."""
+        tracker = self.genome.get_tracker(('kmers', pattern_length, canonical))
+        if tracker is not None:
+            return tracker.result()
+        name = f"kmers-{pattern_length}" + ("-canonical" if canonical else "")
+        table = self.cached(name, lambda: np.vstack(
+            kmers.count_chunk_kmers(self.genome.iter_chunks(pattern_length-1), pattern_length, canonical)
+        ).astype(np.uint64))
+        return table[0], table[1].astype(np.int64)
+
+    def neighbors(self, pattern: str, max_difference: int) -> list[str]:
+        """All k-mers within Hamming distance max_difference of pattern."""
+        k = len(pattern)
+        return [kmers.decode_kmer(value, k) for value in kmers.iter_neighbors(kmers.encode_kmer(pattern), k, max_difference)]
+
+    def frequent_words_with_mismatches(self, text: str, pattern_length: int, max_difference: int,
+                                       reverse_complement: bool = False) -> list[str]:
+        return kmers.frequent_words_with_mismatches(text, pattern_length, max_difference, reverse_complement)
+
+    def median_string(self, sequences: list[str], pattern_length: int) -> tuple[str, int]:
+        return motifs.median_string(sequences, pattern_length)
+
+    def process_reads(self, path: str, operations: list, batch_size: int = reads.DEFAULT_BATCH_SIZE) -> list:
+        """
+        Stream the reads of a FASTA/FASTQ file (optionally gzipped) through
+        operations such as reads.PatternCount, batch by batch.
+        """
+        return reads.process_reads(reads.read_file(path), operations, batch_size)
 
-        return complemented_text
+    def complement(self, text: str):
+        return complement.complement(text)
 
     def reverse_complement(self, text: str):
-        return self.complement(text[::-1])
-
-    def count_symbol(self, symbol):
-        symbol_matches = []
-        sequence_length = self.genome.get_sequence_length()
-        extended_sequence = self.genome.get_extended_sequence()
-        symbol_matches[0] = self.count_pattern(extended_sequence[:sequence_length//2], symbol)
+        return complement.reverse_complement(text)
 
-        for i in range(1, sequence_length):
-            symbol_matches[i] = symbol_matches[i-1]
-            if extended_sequence[i-1] == symbol:
-                symbol_matches[i] -= 1
-            if extended_sequence[i+(sequence_length//2)-1] == symbol:
-                symbol_matches[i] += 1
+    def count_symbol(self, symbol: str, window: int | None = None) -> np.ndarray:
+        return self.count_symbols([symbol], window)[0]
 
+    def count_symbols(self, symbols: list[str], window: int | None = None) -> np.ndarray:
+        """
+        Count each symbol in every window of the extended sequence, one row per symbol.
+        Circular genomes have a window starting at each position (wrapping around),
+        linear ones only windows that fit. The window defaults to half the genome.
+        """
+        sequence_length = self.genome.get_sequence_length()
+        if window is None:
+            window = max(sequence_length//2, 1)
+        if window < 1:
+            raise ValueError("Window must be at least 1")
+        if isinstance(self.genome, CircularGenome):
+            positions = sequence_length
+            extended_sequence = self.genome.get_extended_view(window-1)
+        else:
+            positions = max(sequence_length-window+1, 0)
+            extended_sequence = self.genome.get_extended_view()
+
+        symbol_codes = np.array([ord(symbol) for symbol in symbols], dtype=np.uint8)
+        symbol_matches = np.zeros((len(symbols), positions), dtype=np.int64)
+        for start in range(0, positions, CHUNK_SIZE):
+            stop = min(start+CHUNK_SIZE, positions)
+            data = to_bytes_array(extended_sequence[start:stop+window-1])
+            running = np.zeros((len(symbols), len(data)+1), dtype=np.int64)
+            np.cumsum(data == symbol_codes[:, None], axis=1, out=running[:, 1:])
+            symbol_matches[:, start:stop] = running[:, window:window+stop-start] - running[:, :stop-start]
         return symbol_matches
 
     def get_skew(self):
-        skew = [0]
-        modifiers = {
-            'C': -1,
-            'G': 1,
-        }
-        for i, nucleotide in enumerate(self.genome.get_sequence()):
-            skew.append(skew[i] + modifiers.get(nucleotide, 0))
-        return skew
+        return self.cached('skew', lambda: skew.skew_array(self.genome.iter_chunks())).tolist()
 
     def get_minimum_skew(self):
-        positions = []
-        minimum_skew = 0
-        skew = self.get_skew()
-        for i, skew_value in enumerate(skew):
-            if skew_value < minimum_skew:
-                minimum_skew = skew_value
-                positions = [i]
-            elif skew_value == minimum_skew:
-                positions.append(i)
-        return positions
-
-    def calculate_hamming_distance(self, sequence_1, sequence_2):
-        hamming_distance = 0
-        for i, nucleotide in enumerate(sequence_1):
-            if nucleotide != sequence_2[i]:
-                hamming_distance += 1
-        return hamming_distance
-
-    def get_motifs_matrix(self, motifs):
-        count = {}
-        k = len(motifs[0])
-        for symbol in "ACGT":
-            count[symbol] = [0 for j in range(k)]
-
-        t = len(motifs)
-        for i in range(t):
-            for j in range(k):
-                symbol = motifs[i][j]
-                count[symbol][j] += 1
+        tracker = self.genome.get_tracker(('skew',))
+        if tracker is not None:
+            return tracker.minimum_skew()
+        scanner = self.get_scanner()
+        if scanner is not None:
+            return scanner.get_minimum_skew()
+        return skew.minimum_skew(self.genome.iter_chunks())
 
-        return count
+    def get_skew_profile(self, resolution: int) -> skew.SkewProfile:
+        return skew.skew_profile(self.genome.iter_chunks(), resolution)
 
-    def get_profile_matrix(self, motifs):
-        t = len(motifs)
-        profile = {}
-        motifs_matrix = self.get_motifs_matrix(motifs)
-        for nucleotide, counts in motifs_matrix.items():
-            profile[nucleotide] = []
-            for count in counts:
-                profile[nucleotide].append(count / t)
-
-        return profile
-
-    def get_motifs_consensus(self, motifs):
-        k = len(motifs[0])
-        count = self.get_motifs_matrix(motifs)
-        consensus = ""
-        for j in range(k):
-            m = 0
-            frequentSymbol = ""
-            for symbol in "ACGT":
-                if count[symbol][j] > m:
-                    m = count[symbol][j]
-                    frequentSymbol = symbol
-            consensus += frequentSymbol
-        return consensus
-
-    def get_motifs_score(self, motifs):
-        consensus = self.get_motifs_consensus(motifs)
-        score = 0
-
-        for i, nucleotide in enumerate(consensus):
-            for j, motif in enumerate(motifs):
-                if motif[i] != nucleotide:
-                    score += 1
-
-        return score
-
-    def get_motifs_entropy(self, motifs):
-        profile = self.get_profile_matrix(motifs)
-        entropy = 0
-        for symbol in "ACGT":
-            for count in profile[symbol]:
-                if count != 0:
-                    entropy -= count * math.log2(count)
-        return entropy
-
-
-    def translate_rna_to_amino_acid(self):
-        # amino acid code in a format of {codon_1: {codon_2: {codon_3: amino_acid}}}
-        amino_acid_code = {
-            'A': {
-                'A': {
-                    'A': 'K',
-                    'C': 'N',
-                    'G': 'K',
-                    'U': 'N',
-                },
-                'C': {
-                    'A': 'T',
-                    'C': 'T',
-                    'G': 'T',
-                    'U': 'T',
-                },
-                'G': {
-                    'A': 'R',
-                    'C': 'S',
-                    'G': 'R',
-                    'U': 'S',
-                },
-                'U': {
-                    'A': 'I',
-                    'C': 'I',
-                    'G': 'M',
-                    'U': 'I',
-                },
-            },
-            'C': {
-                'A': {
-                    'A': 'Q',
-                    'C': 'H',
-                    'G': 'Q',
-                    'U': 'H',
-                },
-                'C': {
-                    'A': 'P',
-                    'C': 'P',
-                    'G': 'P',
-                    'U': 'P',
-                },
-                'G': {
-                    'A': 'R',
-                    'C': 'R',
-                    'G': 'R',
-                    'U': 'R',
-                },
-                'U': {
-                    'A': 'L',
-                    'C': 'L',
-                    'G': 'L',
-                    'U': 'L',
-                },
-            },
-            'G': {
-                'A': {
-                    'A': 'E',
-                    'C': 'D',
-                    'G': 'E',
-                    'U': 'D',
-                },
-                'C': {
-                    'A': 'A',
-                    'C': 'A',
-                    'G': 'A',
-                    'U': 'A',
-                },
-                'G': {
-                    'A': 'G',
-                    'C': 'G',
-                    'G': 'G',
-                    'U': 'G',
-                },
-                'U': {
-                    'A': 'V',
-                    'C': 'V',
-                    'G': 'V',
-                    'U': 'V',
-                },
-            },
-            'U': {
-                'A': {
-                    'A': '*',
-                    'C': 'Y',
-                    'G': '*',
-                    'U': 'Y',
-                },
-                'C': {
-                    'A': 'S',
-                    'C': 'S',
-                    'G': 'S',
-                    'U': 'S',
-                },
-                'G': {
-                    'A': '*',
-                    'C': 'C',
-                    'G': 'W',
-                    'U': 'C',
-                },
-                'U': {
-                    'A': 'L',
-                    'C': 'F',
-                    'G': 'L',
-                    'U': 'F',
-                },
-            },
-        }
-        amino_acids = {
-            'A': ('Alanine', 'Ala'),
-            'C': ('Cysteine', 'Cys'),
-            'D': ('Aspartic acid', 'Asp'),
-            'E': ('Glutamic acid', 'Glu'),
-            'F': ('Phenylalanine', 'Phe'),
-            'G': ('Glycine', 'Gly'),
-            'H': ('Histodie', 'His'),
-            'I': ('Isoleucine', 'Ile'),
-            'K': ('Lysine', 'Lys'),
-            'L': ('Leucine', 'Leu'),
-            'M': ('Methionine', 'Met'),
-            'N': ('Asparagine', 'Asn'),
-            'P': ('Proline', 'Pro'),
-            'Q': ('Glutamine', 'Gln'),
-            'R': ('Arginine', 'Arg'),
-            'S': ('Serine', 'Ser'),
-            'T': ('Threonine', 'Thr'),
-            'V': ('Valine', 'Val'),
-            'W': ('Tryptophan', 'Trp'),
-            'Y': ('Tyrosine', 'Tyr'),
-            '*': ('Stop codon', 'Stop'),
-        }
-        rna_sequence = self.genome.get_sequence().upper()
-        amino_acid_sequence = ''
-        for i in range(0, len(rna_sequence), 3):
-            codon = rna_sequence[i:i+3]
-            amino_acid_sequence += amino_acid_code[codon[0]][codon[1]][codon[2]]
-        return amino_acid_sequence
-
-    def gibbs_sampler(self):
-        pass
+    def calculate_hamming_distance(self, sequence_1, sequence_2):
+        return hamming.hamming_distance(sequence_1, sequence_2)
+
+    def calculate_hamming_distances(self, sequence: str, sequences: list[str], method: str = 'auto',
+                                    memory_budget: int = hamming.DEFAULT_MEMORY_BUDGET) -> np.ndarray:
+        """Hamming distance from sequence to each of sequences."""
+        return hamming.distance_matrix([sequence], sequences, method, memory_budget)[0]
+
+    def hamming_distance_matrix(self, sequences: list[str], targets: list[str] | None = None, method: str = 'auto',
+                                memory_budget: int = hamming.DEFAULT_MEMORY_BUDGET) -> np.ndarray:
+        """Distances from every sequence to every target, or between all pairs of sequences."""
+        return hamming.distance_matrix(sequences, targets, method, memory_budget)
+
+    def hamming_pairs_within(self, sequences: list[str], max_difference: int, targets: list[str] | None = None,
+                             method: str = 'auto', memory_budget: int = hamming.DEFAULT_MEMORY_BUDGET) -> dict[str, np.ndarray]:
+        """Pairs of sequences (or sequence and target) at most max_difference apart, as index and distance columns."""
+        return hamming.pairs_within(sequences, max_difference, targets, method, memory_budget)
+
+    def get_motifs_matrix(self, motifs: list[str]) -> dict[str, list[int]]:
+        return MotifSet(motifs).counts_dict()
+
+    def get_profile_matrix(self, motifs: list[str]) -> dict[str, list[float]]:
+        return MotifSet(motifs).profile_dict()
+
+    def get_motifs_consensus(self, motifs: list[str]) -> str:
+        return MotifSet(motifs).consensus()
+
+    def get_motifs_score(self, motifs: list[str]) -> int:
+        return MotifSet(motifs).score()
+
+    def get_motifs_entropy(self, motifs: list[str]) -> float:
+        return MotifSet(motifs).entropy()
+
+    def translate_rna_to_amino_acid(self, genetic_code: int = 1) -> str:
+        # chunks start on codon boundaries and carry the 2 bases that finish their last codon
+        chunk_size = CHUNK_SIZE - CHUNK_SIZE % 3
+        return ''.join(
+            translation.translate(chunk, genetic_code=genetic_code)
+            for _, chunk in self.genome.iter_chunks(2, chunk_size)
+        )
+
+    def translate_six_frames(self, genetic_code: int = 1) -> list[str]:
+        codes = self.genome.encode(translation.NUCLEOTIDE_TABLE)
+        return translation.translate_six_frames_codes(codes, genetic_code)
+
+    def translate_batch(self, sequences: list[str], genetic_code: int = 1) -> list[str]:
+        return translation.translate_batch(sequences, genetic_code)
+
+    def find_orfs(self, min_length: int, genetic_code: int = 1) -> Iterator[orfs.Orf]:
+        """
+        Stream open reading frames of at least min_length codons on both strands.
+        ORFs of circular genomes may wrap around the origin.
+        """
+        return orfs.find_orfs_in_codes(
+            self.genome.encode(translation.NUCLEOTIDE_TABLE), min_length, genetic_code,
+            isinstance(self.genome, CircularGenome)
+        )
+
+    def translate_orfs(self, genome_orfs: list[orfs.Orf], genetic_code: int = 1) -> list[str]:
+        return orfs.translate_orfs(self.genome.get_storage(), genome_orfs, genetic_code)
+
+    def randomized_motif_search(self, sequences: list[str], k: int, restarts: int = 1000, pseudocount: float = 1.0,
+                                seed: int | None = None) -> motifs.MotifSearchResult:
+        return motifs.randomized_motif_search(sequences, k, restarts, pseudocount, seed, self.workers)
+
+    def gibbs_sampler(self, sequences: list[str], k: int, iterations: int = 1000, restarts: int = 20,
+                      pseudocount: float = 1.0, seed: int | None = None,
+                      patience: int | None = None) -> motifs.MotifSearchResult:
+        """
+        Best motifs over restarts of Gibbs sampling; restarts run on the worker
+        pool and a fixed seed gives the same result for any number of workers.
+        """
+        return motifs.gibbs_sampler(sequences, k, iterations, restarts, pseudocount, seed, self.workers, patience)
 
 
 
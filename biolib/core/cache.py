@@ -0,0 +1,108 @@
+import hashlib
+import os
+import tempfile
+from typing import Callable, Iterable
+
+import numpy as np
+
+DEFAULT_MAX_BYTES = 1 << 32
+
+
+def hash_genome(chunks: Iterable[tuple[int, str]], genome_type: str) -> str:
+    """Content hash of a genome, streamed chunk by chunk, plus its type."""
+    digest = hashlib.sha256()
+    for _, text in chunks:
+        digest.update(text.encode('ascii'))
+    digest.update(b'\x00' + genome_type.encode('ascii'))
+    return digest.hexdigest()
+
+
+class IndexCache:
+    """
+    On-disk store of arrays derived from a genome, such as suffix arrays,
+    k-mer count tables or skew arrays. Entries live in one .npy file per
+    artifact under a directory per genome key and are opened memory-mapped,
+    so processes sharing the directory share the pages. Files are written
+    atomically, and the least recently used ones are removed once the cache
+    grows past max_bytes.
+    """
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key: str, name: str) -> str:
+        return os.path.join(self.directory, key, name + '.npy')
+
+    def get(self, key: str, name: str) -> np.ndarray | None:
+        path = self.path(key, name)
+        try:
+            array = np.load(path, mmap_mode='r')
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            return None
+        return array
+
+    def put(self, key: str, name: str, array: np.ndarray) -> np.ndarray:
+        path = self.path(key, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as output:
+                np.save(output, array)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self.evict(keep=path)
+        return array
+
+    def get_or_build(self, key: str, name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+        array = self.get(key, name)
+        if array is None:
+            array = self.put(key, name, build())
+        return array
+
+    def entries(self) -> list[tuple[float, int, str]]:
+        """(last use, size, path) of every cached file."""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for file in files:
+                if not file.endswith('.npy'):
+                    continue
+                path = os.path.join(root, file)
+                try:
+                    status = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((status.st_mtime, status.st_size, path))
+        return entries
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self, keep: str | None = None):
+        """Remove least recently used files until the cache fits in max_bytes."""
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            try:
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass
+
+    def clear(self):
+        for _, _, path in self.entries():
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
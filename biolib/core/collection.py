@@ -0,0 +1,164 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from biolib.core import kmers, skew
+from biolib.core.genome import CircularGenome, Genome, GenomeFactory
+from biolib.core.hamming import find_all
+from biolib.core.parallel import attach
+
+TASKS_PER_WORKER = 4
+
+
+def genome_text(buffer, start: int, end: int) -> str:
+    return bytes(buffer[start:end]).decode('ascii')
+
+
+def genome_match_pattern(buffer, start: int, end: int, pattern: str) -> list[int]:
+    return find_all(genome_text(buffer, start, end), pattern, end - start - len(pattern) + 1)
+
+
+def genome_minimum_skew(buffer, start: int, end: int) -> list[int]:
+    return skew.minimum_skew([(0, genome_text(buffer, start, end))])
+
+
+def genome_frequency_map(buffer, start: int, end: int, k: int, canonical: bool) -> dict[str, int]:
+    return kmers.frequency_map(genome_text(buffer, start, end), k, canonical)
+
+
+GENOME_OPERATIONS = {
+    'match_pattern': genome_match_pattern,
+    'minimum_skew': genome_minimum_skew,
+    'frequency_map': genome_frequency_map,
+}
+
+
+def run_genomes(buffer, bounds: list[tuple[int, int]], operation: str, args: tuple) -> list:
+    function = GENOME_OPERATIONS[operation]
+    return [function(buffer, start, end, *args) for start, end in bounds]
+
+
+def run_shared_genomes(name: str, bounds: list[tuple[int, int]], operation: str, args: tuple) -> list:
+    return run_genomes(attach(name).buf, bounds, operation, args)
+
+
+class GenomeCollection:
+    """
+    Many genomes held in one compact byte buffer with an offset table.
+    Batch queries run over all genomes at once, in a process pool over a
+    shared copy of the buffer when workers are set, and return columnar
+    results: parallel arrays with one row per genome or per hit. Each genome
+    gives the same results as a BioLib holding it alone.
+    """
+    def __init__(self, genomes: list[Genome], names: list[str] | None = None, workers: int = 1):
+        if names is not None and len(names) != len(genomes):
+            raise ValueError("Expected one name per genome")
+        lengths = np.array([genome.get_sequence_length() for genome in genomes], dtype=np.int64)
+        self.offsets = np.zeros(len(genomes) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.buffer = np.empty(int(self.offsets[-1]), dtype=np.uint8)
+        for genome, start in zip(genomes, self.offsets.tolist()):
+            for chunk_start, text in genome.iter_chunks():
+                data = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+                self.buffer[start+chunk_start:start+chunk_start+len(data)] = data
+        self.circular = np.array([isinstance(genome, CircularGenome) for genome in genomes], dtype=bool)
+        self.names = list(names) if names is not None else [str(i) for i in range(len(genomes))]
+        self.workers = workers
+        self.memory = None
+        self.executor = None
+
+    @classmethod
+    def from_sequences(cls, sequences: list[str], genome_type: str = 'linear', names: list[str] | None = None,
+                       workers: int = 1) -> 'GenomeCollection':
+        genomes = [GenomeFactory.create_genome(genome_type, sequence) for sequence in sequences]
+        if any(genome is None for genome in genomes):
+            raise ValueError(f"Unknown genome type: {genome_type}")
+        return cls(genomes, names, workers)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.memory is not None:
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+    def get_lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def get_sequence(self, index: int) -> str:
+        return self.buffer[self.offsets[index]:self.offsets[index+1]].tobytes().decode('ascii')
+
+    def get_genome(self, index: int) -> Genome:
+        return GenomeFactory.create_genome('circular' if self.circular[index] else 'linear', self.get_sequence(index))
+
+    def share(self):
+        """Copy the buffer into shared memory and start the pool, once."""
+        if self.memory is not None:
+            return
+        self.memory = shared_memory.SharedMemory(create=True, size=max(len(self.buffer), 1))
+        np.ndarray(len(self.buffer), dtype=np.uint8, buffer=self.memory.buf)[:] = self.buffer
+        self.executor = ProcessPoolExecutor(self.workers)
+
+    def map(self, operation: str, *args) -> list:
+        """Run operation on every genome and return the per-genome results in order."""
+        bounds = list(zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist()))
+        if self.workers <= 1 or len(self) < 2:
+            return run_genomes(self.buffer, bounds, operation, args)
+        self.share()
+        # contiguous groups of genomes holding about the same number of bases
+        tasks = min(self.workers * TASKS_PER_WORKER, len(self))
+        targets = np.linspace(0, self.offsets[-1], tasks + 1)[1:-1]
+        splits = [0] + np.unique(np.searchsorted(self.offsets[1:-1], targets) + 1).tolist() + [len(self)]
+        futures = [
+            self.executor.submit(run_shared_genomes, self.memory.name, bounds[low:high], operation, args)
+            for low, high in zip(splits[:-1], splits[1:]) if low < high
+        ]
+        return [result for future in futures for result in future.result()]
+
+    def hits(self, results: list[list[int]]) -> dict[str, np.ndarray]:
+        counts = np.array([len(positions) for positions in results], dtype=np.int64)
+        return {
+            'genome': np.repeat(np.arange(len(self)), counts),
+            'position': np.fromiter((p for positions in results for p in positions), dtype=np.int64, count=int(counts.sum())),
+        }
+
+    def count_pattern(self, pattern: str) -> np.ndarray:
+        """Occurrences of pattern in each genome, one count per genome."""
+        return np.array([len(positions) for positions in self.match_pattern_results(pattern)], dtype=np.int64)
+
+    def match_pattern_results(self, pattern: str) -> list[list[int]]:
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+        return self.map('match_pattern', pattern)
+
+    def match_pattern(self, pattern: str) -> dict[str, np.ndarray]:
+        """Every occurrence as parallel genome index and position columns."""
+        return self.hits(self.match_pattern_results(pattern))
+
+    def get_minimum_skew(self) -> dict[str, np.ndarray]:
+        """Minimum skew positions of every genome as genome index and position columns."""
+        return self.hits(self.map('minimum_skew'))
+
+    def frequency_map(self, pattern_length: int, canonical: bool = False) -> dict[str, np.ndarray]:
+        """k-mer counts of every genome as genome index, k-mer and count columns."""
+        results = self.map('frequency_map', pattern_length, canonical)
+        sizes = np.array([len(frequencies) for frequencies in results], dtype=np.int64)
+        return {
+            'genome': np.repeat(np.arange(len(self)), sizes),
+            'kmer': np.array([kmer for frequencies in results for kmer in frequencies], dtype=f'<U{max(pattern_length, 1)}'),
+            'count': np.fromiter(
+                (count for frequencies in results for count in frequencies.values()), dtype=np.int64, count=int(sizes.sum())
+            ),
+        }
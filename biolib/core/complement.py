@@ -0,0 +1,37 @@
+IUPAC_COMPLEMENTS = {
+    'A': 'T',
+    'C': 'G',
+    'G': 'C',
+    'T': 'A',
+    'U': 'A',
+    'R': 'Y',
+    'Y': 'R',
+    'S': 'S',
+    'W': 'W',
+    'K': 'M',
+    'M': 'K',
+    'B': 'V',
+    'V': 'B',
+    'D': 'H',
+    'H': 'D',
+    'N': 'N',
+}
+
+# lowercase input complements to uppercase, anything else is left unchanged
+_COMPLEMENTS = {**IUPAC_COMPLEMENTS, **{key.lower(): value for key, value in IUPAC_COMPLEMENTS.items()}}
+COMPLEMENT_TABLE = str.maketrans(_COMPLEMENTS)
+BYTES_COMPLEMENT_TABLE = bytes.maketrans(
+    ''.join(_COMPLEMENTS).encode('ascii'),
+    ''.join(_COMPLEMENTS.values()).encode('ascii'),
+)
+
+
+def complement(text: str) -> str:
+    try:
+        return text.encode('ascii').translate(BYTES_COMPLEMENT_TABLE).decode('ascii')
+    except UnicodeEncodeError:
+        return text.translate(COMPLEMENT_TABLE)
+
+
+def reverse_complement(text: str) -> str:
+    return complement(text)[::-1]
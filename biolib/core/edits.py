@@ -0,0 +1,181 @@
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from biolib.core import kmers, skew
+from biolib.core.hamming import find_all
+
+SKEW_BLOCK_SIZE = 1 << 16
+
+
+class Edit(NamedTuple):
+    """
+    VCF-like edit: reference, the bases at position (0-based, no padding
+    base), is replaced by alternate. An empty reference inserts before
+    position, an empty alternate deletes.
+    """
+    position: int
+    reference: str
+    alternate: str
+
+
+def check_edits(sequence: str, edits: Iterable[Edit]) -> list[Edit]:
+    """Edits in position order, checked against sequence; they must not overlap."""
+    edits = sorted(edits, key=lambda edit: edit.position)
+    end = 0
+    for edit in edits:
+        if edit.position < end or edit.position + len(edit.reference) > len(sequence):
+            raise ValueError(f"Edit at {edit.position} overlaps another edit or runs past the sequence end")
+        if sequence[edit.position:edit.position+len(edit.reference)] != edit.reference:
+            raise ValueError(f"Reference {edit.reference!r} does not match the sequence at {edit.position}")
+        end = edit.position + len(edit.reference)
+    return edits
+
+
+def apply_edits(sequence: str, edits: list[Edit]) -> str:
+    """Sequence with checked edits applied, built in one join."""
+    pieces, start = [], 0
+    for edit in edits:
+        pieces.append(sequence[start:edit.position])
+        pieces.append(edit.alternate)
+        start = edit.position + len(edit.reference)
+    pieces.append(sequence[start:])
+    return ''.join(pieces)
+
+
+def affected_segments(edits: list[Edit], context: int, length: int) -> list[tuple[int, int, int, int]]:
+    """
+    (old start, old end, new start, new end) of the regions holding every
+    window of context + 1 bases that overlaps an edit, before and after the
+    edits; regions sharing windows are merged.
+    """
+    segments, shift = [], 0
+    for edit in edits:
+        start = max(edit.position - context, 0)
+        end = min(edit.position + len(edit.reference) + context, length)
+        if segments and start < segments[-1][1]:
+            old_start, _, new_start, _ = segments.pop()
+        else:
+            old_start, new_start = start, start + shift
+        shift += len(edit.alternate) - len(edit.reference)
+        segments.append((old_start, end, new_start, end + shift))
+    return segments
+
+
+class KmerCounts:
+    """
+    k-mer counts of a genome, first counted from its chunks overlapping by
+    k - 1 bases and then updated from the windows overlapping each edit.
+    """
+    def __init__(self, chunks: Iterable[tuple[int, str]], k: int, canonical: bool = False):
+        self.k = k
+        self.canonical = canonical
+        values, counts = kmers.count_chunk_kmers(chunks, k, canonical)
+        self.counts = dict(zip(values.tolist(), counts.tolist()))
+
+    def update(self, old: str, new: str, edits: list[Edit]):
+        for old_start, old_end, new_start, new_end in affected_segments(edits, self.k - 1, len(old)):
+            for text, sign in ((old[old_start:old_end], -1), (new[new_start:new_end], 1)):
+                values, counts = kmers.count_kmers(text, self.k, self.canonical)
+                for value, count in zip(values.tolist(), counts.tolist()):
+                    total = self.counts.get(value, 0) + sign * count
+                    if total:
+                        self.counts[value] = total
+                    else:
+                        del self.counts[value]
+
+    def result(self) -> tuple[np.ndarray, np.ndarray]:
+        """Distinct k-mers in order and their counts, as from kmers.count_kmers."""
+        values = np.array(sorted(self.counts), dtype=np.uint64)
+        return values, np.array([self.counts[value] for value in values.tolist()], dtype=np.int64)
+
+
+class PatternCount:
+    """
+    Occurrences of pattern in a genome, first counted from its chunks
+    overlapping by len(pattern) - 1 bases and then updated from the windows
+    overlapping each edit.
+    """
+    def __init__(self, chunks: Iterable[tuple[int, str]], pattern: str):
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+        self.pattern = pattern
+        self.count = sum(self.occurrences(text) for _, text in chunks)
+
+    def occurrences(self, text: str) -> int:
+        return len(find_all(text, self.pattern, len(text)))
+
+    def update(self, old: str, new: str, edits: list[Edit]):
+        for old_start, old_end, new_start, new_end in affected_segments(edits, len(self.pattern) - 1, len(old)):
+            self.count += self.occurrences(new[new_start:new_end]) - self.occurrences(old[old_start:old_end])
+
+
+class SkewSummary:
+    """
+    Skew of a genome kept as blocks of up to block_size bases, each with its
+    total skew change and running minimum (see skew.chunk_minimum). An edit
+    recomputes only the blocks it touches; queries combine the block prefix sums.
+    sequence may be lazy storage: blocks are decoded one at a time.
+    """
+    def __init__(self, sequence, block_size: int = SKEW_BLOCK_SIZE):
+        self.block_size = block_size
+        self.sequence = sequence
+        self.lengths, self.blocks = self.split(sequence)
+
+    def split(self, text) -> tuple[list[int], list[tuple[int, int, list[int]]]]:
+        lengths, blocks = [], []
+        for start in range(0, len(text), self.block_size):
+            piece = text[start:start+self.block_size]
+            lengths.append(len(piece))
+            blocks.append(skew.chunk_minimum(piece))
+        return lengths, blocks
+
+    def starts(self) -> np.ndarray:
+        starts = np.zeros(len(self.lengths) + 1, dtype=np.int64)
+        np.cumsum(self.lengths, out=starts[1:])
+        return starts
+
+    def update(self, old: str, new: str, edits: list[Edit]):
+        self.sequence = new
+        starts = self.starts()
+        if len(self.lengths) == 0:
+            self.lengths, self.blocks = self.split(new)
+            return
+        # runs of blocks touched by the edits, as (first block, last block, size change)
+        runs = []
+        for edit in edits:
+            first = max(int(np.searchsorted(starts, edit.position, side='right')) - 1, 0)
+            first = min(first, len(self.lengths) - 1)
+            last = int(np.searchsorted(starts, edit.position + len(edit.reference) - 1, side='right')) - 1
+            last = max(first, min(last, len(self.lengths) - 1))
+            change = len(edit.alternate) - len(edit.reference)
+            if runs and first <= runs[-1][1]:
+                run_first, run_last, run_change = runs.pop()
+                runs.append((run_first, max(run_last, last), run_change + change))
+            else:
+                runs.append((first, last, change))
+        lengths, blocks, previous, shift = [], [], 0, 0
+        for first, last, change in runs:
+            lengths.extend(self.lengths[previous:first])
+            blocks.extend(self.blocks[previous:first])
+            start = int(starts[first]) + shift
+            end = int(starts[last+1]) + shift + change
+            run_lengths, run_blocks = self.split(new[start:end])
+            lengths.extend(run_lengths)
+            blocks.extend(run_blocks)
+            previous, shift = last + 1, shift + change
+        lengths.extend(self.lengths[previous:])
+        blocks.extend(self.blocks[previous:])
+        self.lengths, self.blocks = lengths, blocks
+
+    def minimum_skew(self) -> list[int]:
+        """Positions of the minimum skew, as skew.minimum_skew."""
+        return skew.merge_minimum(zip(self.starts().tolist(), self.blocks))
+
+    def skew_at(self, position: int) -> int:
+        """Running skew after the first position bases."""
+        starts = self.starts()
+        block = int(np.searchsorted(starts, position, side='right')) - 1
+        total = sum(block_total for block_total, _, _ in self.blocks[:block])
+        start = int(starts[min(block, len(self.lengths))])
+        return total + int(skew.skew_steps(self.sequence[start:position]).sum(dtype=np.int64))
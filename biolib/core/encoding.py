@@ -0,0 +1,51 @@
+import numpy as np
+
+NUCLEOTIDES = 'ACGT'
+INVALID_CODE = 4
+
+# byte -> 2-bit nucleotide code, INVALID_CODE for anything that is not ACGT
+ENCODE_TABLE = np.full(256, INVALID_CODE, dtype=np.uint8)
+for code, nucleotide in enumerate(NUCLEOTIDES):
+    ENCODE_TABLE[ord(nucleotide)] = code
+
+DECODE_TABLE = np.frombuffer(NUCLEOTIDES.encode('ascii'), dtype=np.uint8)
+
+UPPER_TABLE = np.arange(256, dtype=np.uint8)
+UPPER_TABLE[ord('a'):ord('z')+1] -= 32
+
+
+def to_bytes_array(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+
+
+def encode(text: str) -> np.ndarray:
+    """Encode text into 2-bit codes, with INVALID_CODE for non-ACGT symbols."""
+    return ENCODE_TABLE[to_bytes_array(text)]
+
+
+def encode_range(sequence, start: int, stop: int) -> np.ndarray:
+    """Encode sequence[start:stop], using the storage's own codes when it has them."""
+    if hasattr(sequence, 'codes'):
+        return sequence.codes(start, stop)
+    return encode(sequence[start:stop])
+
+
+def decode(codes: np.ndarray) -> str:
+    return DECODE_TABLE[codes].tobytes().decode('ascii')
+
+
+def find_runs(mask: np.ndarray, symbols: np.ndarray | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return start and end positions of runs where mask is set.
+    When symbols is given, a run also breaks wherever the symbol changes.
+    """
+    boundary = np.ones(len(mask) + 1, dtype=bool)
+    if symbols is not None:
+        boundary[1:-1] = symbols[1:] != symbols[:-1]
+    else:
+        boundary[1:-1] = False
+    padded = np.zeros(len(mask) + 2, dtype=bool)
+    padded[1:-1] = mask
+    starts = np.flatnonzero(padded[1:-1] & (~padded[:-2] | boundary[:-1]))
+    ends = np.flatnonzero(padded[1:-1] & (~padded[2:] | boundary[1:])) + 1
+    return starts, ends
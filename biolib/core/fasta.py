@@ -0,0 +1,208 @@
+import mmap
+import os
+import struct
+from typing import NamedTuple, TextIO
+
+import numpy as np
+
+from biolib.core.complement import reverse_complement
+from biolib.core.packed import PackedSequence, slice_with
+
+TWO_BIT_SIGNATURE = 0x1A412743
+TWO_BIT_ALPHABET = 'TCAG'
+
+
+class FaiEntry(NamedTuple):
+    name: str
+    length: int
+    offset: int
+    line_bases: int
+    line_width: int
+
+
+def read_fai(path: str) -> dict[str, FaiEntry]:
+    entries = {}
+    with open(path) as handle:
+        for line in handle:
+            fields = line.rstrip('\n').split('\t')
+            if len(fields) < 5:
+                continue
+            name, length, offset, line_bases, line_width = fields[:5]
+            entries[name] = FaiEntry(name, int(length), int(offset), int(line_bases), int(line_width))
+    return entries
+
+
+def write_fai(path: str, entries: dict[str, FaiEntry]):
+    with open(path, 'w') as handle:
+        for entry in entries.values():
+            handle.write('\t'.join(str(field) for field in entry) + '\n')
+
+
+def build_fai(data) -> dict[str, FaiEntry]:
+    """Scan FASTA bytes once and build the same records samtools faidx writes."""
+    entries = {}
+    position = 0
+    size = len(data)
+    current = None
+    while position < size:
+        line_end = data.find(b'\n', position)
+        line_end = size if line_end == -1 else line_end + 1
+        line = data[position:line_end]
+        if line.startswith(b'>'):
+            if current is not None:
+                entries[current.name] = current
+            name = line[1:].split()[0].decode('ascii') if line[1:].split() else ''
+            current = FaiEntry(name, 0, line_end, 0, 0)
+        elif current is not None:
+            bases = len(line.rstrip(b'\r\n'))
+            if current.line_bases == 0 and bases:
+                current = current._replace(line_bases=bases, line_width=len(line))
+            current = current._replace(length=current.length + bases)
+        position = line_end
+    if current is not None:
+        entries[current.name] = current
+    return entries
+
+
+class MappedFastaSequence:
+    """Lazy view of one FASTA record; slices read only the bytes they cover."""
+    def __init__(self, data, entry: FaiEntry):
+        self.data = data
+        self.entry = entry
+
+    def __len__(self):
+        return self.entry.length
+
+    def __str__(self):
+        return self.decode(0, self.entry.length)
+
+    def __repr__(self):
+        return f"MappedFastaSequence(name={self.entry.name!r}, length={self.entry.length})"
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return slice_with(self.decode, range(*key.indices(self.entry.length)))
+        if key < 0:
+            key += self.entry.length
+        if not 0 <= key < self.entry.length:
+            raise IndexError("sequence index out of range")
+        return self.decode(key, key + 1)
+
+    def byte_offset(self, position: int) -> int:
+        lines, column = divmod(position, self.entry.line_bases or 1)
+        return self.entry.offset + lines * self.entry.line_width + column
+
+    def decode(self, start: int, stop: int) -> str:
+        if start >= stop:
+            return ''
+        raw = self.data[self.byte_offset(start):self.byte_offset(stop)]
+        return raw.replace(b'\n', b'').replace(b'\r', b'').decode('ascii')
+
+
+def map_file(path: str):
+    with open(path, 'rb') as handle:
+        return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def load_fai(path: str, data) -> dict[str, FaiEntry]:
+    """Read the .fai index of a FASTA file, building (and saving, when possible) a missing one."""
+    fai_path = path + '.fai'
+    if os.path.exists(fai_path):
+        return read_fai(fai_path)
+    entries = build_fai(data)
+    try:
+        write_fai(fai_path, entries)
+    except OSError:
+        pass
+    return entries
+
+
+def open_fasta(path: str, name: str | None = None, use_mmap: bool = True) -> MappedFastaSequence | str:
+    """Open one record of a FASTA file through its .fai index."""
+    data = map_file(path)
+    entries = load_fai(path, data)
+    if not entries:
+        raise ValueError(f"No FASTA records found in {path}")
+    entry = entries[name] if name is not None else next(iter(entries.values()))
+    sequence = MappedFastaSequence(data, entry)
+    return sequence if use_mmap else str(sequence)
+
+
+def reverse_complement_fasta(path: str, output: TextIO, line_width: int = 60, chunk_size: int = 1 << 20):
+    """
+    Write the reverse complement of every record of a FASTA file to output.
+    Records are read backwards chunk by chunk from the mapped file, so memory
+    use does not depend on record length.
+    """
+    data = map_file(path)
+    for entry in load_fai(path, data).values():
+        sequence = MappedFastaSequence(data, entry)
+        header_start = data.rfind(b'>', 0, entry.offset)
+        output.write(data[header_start:entry.offset].decode('ascii').rstrip('\r\n') + '\n')
+        carry = ''
+        for end in range(entry.length, 0, -chunk_size):
+            text = carry + reverse_complement(sequence[max(end-chunk_size, 0):end])
+            usable = len(text) - len(text) % line_width
+            for i in range(0, usable, line_width):
+                output.write(text[i:i+line_width] + '\n')
+            carry = text[usable:]
+        if carry:
+            output.write(carry + '\n')
+
+
+def read_two_bit_index(data) -> tuple[str, dict[str, int]]:
+    signature, = struct.unpack('<I', data[:4])
+    byte_order = '<' if signature == TWO_BIT_SIGNATURE else '>'
+    signature, version, sequence_count, _ = struct.unpack(byte_order + 'IIII', data[:16])
+    if signature != TWO_BIT_SIGNATURE:
+        raise ValueError("Not a .2bit file")
+    offset_format = byte_order + ('Q' if version == 1 else 'I')
+    offset_size = struct.calcsize(offset_format)
+
+    records = {}
+    position = 16
+    for _ in range(sequence_count):
+        name_size = data[position]
+        name = data[position+1:position+1+name_size].decode('ascii')
+        position += 1 + name_size
+        records[name], = struct.unpack(offset_format, data[position:position+offset_size])
+        position += offset_size
+    return byte_order, records
+
+
+def open_two_bit(path: str, name: str | None = None) -> PackedSequence:
+    """Open one record of a UCSC .2bit file as a PackedSequence over the mapped bytes."""
+    data = map_file(path)
+    byte_order, records = read_two_bit_index(data)
+    if not records:
+        raise ValueError(f"No .2bit records found in {path}")
+    position = records[name] if name is not None else next(iter(records.values()))
+    words = np.dtype(byte_order + 'u4')
+
+    def read_words(count):
+        nonlocal position
+        values = np.frombuffer(data, dtype=words, count=count, offset=position).astype(np.int64)
+        position += 4 * count
+        return values
+
+    length, n_block_count = read_words(2).tolist()
+    n_starts = read_words(n_block_count)
+    n_ends = n_starts + read_words(n_block_count)
+    mask_block_count, = read_words(1).tolist()
+    mask_starts = read_words(mask_block_count)
+    mask_ends = mask_starts + read_words(mask_block_count)
+    position += 4
+    packed = np.frombuffer(data, dtype=np.uint8, count=-(-length // 4), offset=position)
+    return PackedSequence.from_packed(
+        packed, length, n_starts, n_ends, b'N' * n_block_count, mask_starts, mask_ends, TWO_BIT_ALPHABET
+    )
+
+
+def open_sequence(path: str, name: str | None = None, use_mmap: bool = True):
+    """Open a FASTA or .2bit file lazily, detecting the format from its first bytes."""
+    with open(path, 'rb') as handle:
+        magic = handle.read(4)
+    if len(magic) == 4 and TWO_BIT_SIGNATURE in struct.unpack('<I', magic) + struct.unpack('>I', magic):
+        sequence = open_two_bit(path, name)
+        return sequence if use_mmap else str(sequence)
+    return open_fasta(path, name, use_mmap)
@@ -1,36 +1,140 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
+from biolib.core.edits import Edit, apply_edits, check_edits
+from biolib.core.encoding import to_bytes_array
+from biolib.core.fasta import MappedFastaSequence, open_sequence
+from biolib.core.instrumentation import instrumented
+from biolib.core.packed import CircularView, PackedSequence
+
+CHUNK_SIZE = 1 << 22
+
 
 class Genome(ABC):
-    __sequence: str
+    __sequence: str | PackedSequence | MappedFastaSequence
     __sequence_length: int
-    def __init__(self, sequence: str):
+    __trackers: dict
+    def __init__(self, sequence: str | PackedSequence | MappedFastaSequence):
         self.__sequence = sequence
         self.__sequence_length = len(sequence)
+        self.__trackers = {}
 
-    def get_sequence(self):
-        return self.__sequence
+    def get_sequence(self) -> str:
+        """The whole sequence as a string; decodes packed or memory-mapped storage in full."""
+        return str(self.__sequence)
+
+    def encode(self, table: np.ndarray) -> np.ndarray:
+        """Every base mapped through a 256-entry byte table, decoding one chunk at a time."""
+        codes = np.empty(self.__sequence_length, dtype=table.dtype)
+        for start, text in self.iter_chunks():
+            codes[start:start+len(text)] = table[to_bytes_array(text)]
+        return codes
 
     def get_sequence_length(self):
         return self.__sequence_length
 
+    def get_storage(self) -> str | PackedSequence | MappedFastaSequence:
+        return self.__sequence
+
+    def add_tracker(self, key, tracker):
+        """Keep tracker (see biolib.core.edits) up to date through edits, under key."""
+        self.__trackers[key] = tracker
+        return tracker
+
+    def get_tracker(self, key):
+        return self.__trackers.get(key)
+
+    def apply_edits(self, edits: list[Edit]):
+        """
+        Apply non-overlapping edits, positioned on the sequence before any of
+        them, and update the trackers from the windows around each edit.
+        Only the tracked statistics are incremental: the sequence is an
+        immutable string, rebuilt in one pass per call, so batch edits
+        rather than applying them one at a time.
+        """
+        if not isinstance(self.__sequence, str):
+            raise TypeError("Only genomes with plain string storage can be edited")
+        old = self.__sequence
+        edits = check_edits(old, edits)
+        self.__sequence = apply_edits(old, edits)
+        self.__sequence_length = len(self.__sequence)
+        for tracker in self.__trackers.values():
+            tracker.update(old, self.__sequence, edits)
+
+    def apply_substitution(self, position: int, bases: str):
+        if not 0 <= position <= self.__sequence_length - len(bases):
+            raise ValueError("Substitution runs past the sequence end")
+        self.apply_edits([Edit(position, str(self.__sequence[position:position+len(bases)]), bases)])
+
+    def apply_insertion(self, position: int, bases: str):
+        self.apply_edits([Edit(position, '', bases)])
+
+    def apply_deletion(self, position: int, length: int):
+        if not 0 <= position <= self.__sequence_length - length or length < 0:
+            raise ValueError("Deletion runs past the sequence end")
+        self.apply_edits([Edit(position, str(self.__sequence[position:position+length]), '')])
+
+    def iter_chunks(self, overlap: int = 0, chunk_size: int = CHUNK_SIZE):
+        """
+        Yield (start, text) pairs covering the sequence in order, where text
+        holds chunk_size bases from start plus overlap bases of the next chunk.
+        Only one chunk is decoded at a time, so lazy storage stays lazy.
+        """
+        for start in range(0, self.__sequence_length, chunk_size):
+            yield start, self.__sequence[start:start+chunk_size+overlap]
+
     @abstractmethod
-    def get_extended_sequence(self):
+    def get_extended_sequence(self) -> str:
+        pass
+
+    @abstractmethod
+    def get_extended_view(self, extension: int | None = None):
         pass
 
 class LinearGenome(Genome):
     def get_extended_sequence(self):
-        return self.__sequence
+        return self.get_sequence()
+
+    def get_extended_view(self, extension: int | None = None):
+        return self.get_storage()
 
 class CircularGenome(Genome):
     def get_extended_sequence(self):
-        return self.__sequence+self.__sequence[:self.__sequence_length//2]
+        return self.get_extended_view()[:]
+
+    def get_extended_view(self, extension: int | None = None):
+        """Sequence followed by extension bases wrapped from its start (half the length by default)."""
+        length = self.get_sequence_length()
+        if extension is None:
+            extension = length//2
+        return CircularView(self.get_storage(), length + extension)
+
+
+STORAGE_BACKENDS = {
+    'plain': str,
+    'packed': PackedSequence,
+}
 
 
 class GenomeFactory:
     @staticmethod
-    def create_genome(genome_type: str, sequence: str) -> None | CircularGenome | LinearGenome:
+    @instrumented
+    def create_genome(genome_type: str, sequence: str, storage: str = 'plain') -> None | CircularGenome | LinearGenome:
+        backend = STORAGE_BACKENDS.get(storage)
+        if backend is None:
+            return None
+        if isinstance(sequence, str):
+            sequence = backend(sequence)
         if genome_type == "linear":
             return LinearGenome(sequence)
         elif genome_type == "circular":
-            return CircularGenome(sequence)
\ No newline at end of file
+            return CircularGenome(sequence)
+
+    @staticmethod
+    def from_file(genome_type: str, path: str, name: str | None = None, mmap: bool = True) -> None | CircularGenome | LinearGenome:
+        """
+        Create a genome from a FASTA or .2bit file.
+        With mmap the file is memory-mapped and bases are read on access.
+        """
+        return GenomeFactory.create_genome(genome_type, open_sequence(path, name, mmap))
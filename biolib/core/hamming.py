@@ -0,0 +1,250 @@
+import math
+
+import numpy as np
+
+from biolib.core.encoding import ENCODE_TABLE, INVALID_CODE, to_bytes_array
+
+SEED_MIN_LENGTH = 6
+
+
+def mismatch_counts(text: np.ndarray, pattern: np.ndarray) -> np.ndarray:
+    """
+    Hamming distance between pattern and every window of text, accumulated
+    one pattern column at a time over all windows at once.
+    """
+    windows = len(text) - len(pattern) + 1
+    if windows <= 0:
+        return np.zeros(0, dtype=np.int32)
+    mismatches = np.zeros(windows, dtype=np.uint8 if len(pattern) < 256 else np.int32)
+    for j, symbol in enumerate(pattern.tolist()):
+        np.add(mismatches, text[j:j+windows] != symbol, out=mismatches, casting='unsafe')
+    return mismatches
+
+
+def seed_pieces(pattern_length: int, max_difference: int) -> list[tuple[int, int]]:
+    """Split a pattern into max_difference + 1 pieces; one must match exactly (pigeonhole)."""
+    pieces = max_difference + 1
+    bounds = [pattern_length * i // pieces for i in range(pieces + 1)]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def find_all(text: str, pattern: str, windows: int | None = None) -> list[int]:
+    """Start positions of pattern in text, only those below windows when given."""
+    windows = len(text) + 1 if windows is None else windows
+    positions = []
+    position = text.find(pattern)
+    while 0 <= position < windows:
+        positions.append(position)
+        position = text.find(pattern, position + 1)
+    return positions
+
+
+def seed_candidates(text: str, pattern: str, max_difference: int, locate=None) -> np.ndarray:
+    locate = locate or (lambda piece: find_all(text, piece))
+    windows = len(text) - len(pattern) + 1
+    candidates = []
+    for start, end in seed_pieces(len(pattern), max_difference):
+        hits = np.asarray(locate(pattern[start:end]), dtype=np.int64) - start
+        candidates.append(hits[(hits >= 0) & (hits < windows)])
+    return np.unique(np.concatenate(candidates))
+
+
+def resolve_method(pattern_length: int, max_difference: int, method: str) -> str:
+    """The method 'auto' stands for: seeds when the pigeonhole pieces are long enough to be selective."""
+    if method == 'auto':
+        return 'seed' if pattern_length // (max_difference + 1) >= SEED_MIN_LENGTH else 'vector'
+    return method
+
+
+def match_approximate(text: str, pattern: str, max_difference: int, method: str = 'auto', locate=None) -> np.ndarray:
+    """
+    Start positions of windows of text within max_difference mismatches of pattern.
+    method is 'vector' (mismatch accumulation over all windows), 'seed'
+    (pigeonhole seeds verified against the pattern) or 'auto'.
+    locate optionally finds exact seed occurrences, e.g. through a SuffixIndex;
+    with locate and the seed method, text may be lazy storage such as a PackedSequence.
+    """
+    windows = len(text) - len(pattern) + 1
+    if windows <= 0 or max_difference < 0:
+        return np.zeros(0, dtype=np.int64)
+    if max_difference >= len(pattern):
+        return np.arange(windows, dtype=np.int64)
+    method = resolve_method(len(pattern), max_difference, method)
+
+    pattern_bytes = to_bytes_array(pattern)
+    if method == 'vector':
+        return np.flatnonzero(mismatch_counts(to_bytes_array(str(text)), pattern_bytes) <= max_difference)
+    if method == 'seed':
+        candidates = seed_candidates(text, pattern, max_difference, locate)
+        if isinstance(text, str):
+            windows = to_bytes_array(text)[candidates[:, None] + np.arange(len(pattern))]
+        else:
+            # lazy storage: decode only the candidate windows
+            windows = to_bytes_array(''.join(text[c:c+len(pattern)] for c in candidates.tolist()))
+            windows = windows.reshape(len(candidates), len(pattern))
+        distances = np.count_nonzero(windows != pattern_bytes, axis=1)
+        return candidates[distances <= max_difference]
+    raise ValueError(f"Unknown approximate matching method: {method}")
+
+
+# about the bytes each compared pair takes while a tile is computed (products or XOR words, counts)
+PAIR_BYTES = 24
+DEFAULT_MEMORY_BUDGET = 1 << 27
+BASES_PER_WORD = 64
+POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def hamming_distance(sequence_1: str, sequence_2: str) -> int:
+    if len(sequence_1) != len(sequence_2):
+        raise ValueError("Sequences must have equal length")
+    return int(np.count_nonzero(to_bytes_array(sequence_1) != to_bytes_array(sequence_2)))
+
+
+def encode_batch(sequences: list[str]) -> np.ndarray:
+    """Equal-length sequences as rows of a byte matrix."""
+    lengths = {len(sequence) for sequence in sequences}
+    if len(lengths) > 1:
+        raise ValueError("Sequences must have equal length")
+    length = lengths.pop() if lengths else 0
+    return to_bytes_array(''.join(sequences)).reshape(len(sequences), length)
+
+
+def distance_dtype(length: int) -> type:
+    return np.uint8 if length < 256 else np.uint16 if length < 65536 else np.uint32
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(words)
+    return POPCOUNT_TABLE[words.view(np.uint8)].reshape(*words.shape, 8).sum(axis=-1, dtype=np.uint8)
+
+
+def pack_rows(rows: np.ndarray) -> np.ndarray:
+    """
+    ACGT byte rows as two bit planes of their 2-bit codes, low bits then high
+    bits, BASES_PER_WORD bases to a uint64 word.
+    """
+    words = -(-rows.shape[1] // BASES_PER_WORD)
+    codes = np.zeros((len(rows), words * BASES_PER_WORD), dtype=np.uint8)
+    codes[:, :rows.shape[1]] = ENCODE_TABLE[rows]
+    planes = np.concatenate((np.packbits(codes & 1, axis=1), np.packbits(codes >> 1, axis=1)), axis=1)
+    return planes.view(np.uint64)
+
+
+def packed_distances(queries: np.ndarray, targets: np.ndarray, length: int) -> np.ndarray:
+    """Distances between packed rows: a base differs when either of its bit planes differs."""
+    words = queries.shape[1] // 2
+    distances = np.zeros((len(queries), len(targets)), dtype=distance_dtype(length))
+    for word in range(words):
+        differ = queries[:, word, None] ^ targets[None, :, word]
+        differ |= queries[:, words + word, None] ^ targets[None, :, words + word]
+        np.add(distances, popcount(differ), out=distances, casting='unsafe')
+    return distances
+
+
+def one_hot_rows(rows: np.ndarray, alphabet: np.ndarray) -> np.ndarray:
+    """Byte rows as flattened one-hot vectors over alphabet, so a dot product counts matches."""
+    lookup = np.zeros(256, dtype=np.intp)
+    lookup[alphabet] = np.arange(len(alphabet))
+    vectors = np.zeros((len(rows), rows.shape[1], len(alphabet)), dtype=np.float32)
+    np.put_along_axis(vectors, lookup[rows][:, :, None], 1, axis=2)
+    return vectors.reshape(len(rows), -1)
+
+
+def one_hot_distances(queries: np.ndarray, targets: np.ndarray, length: int) -> np.ndarray:
+    # float32 sums of 0/1 products are exact below 2**24
+    return (length - queries @ targets.T).astype(distance_dtype(length))
+
+
+def choose_method(queries: np.ndarray, targets: np.ndarray, method: str) -> str:
+    # the matrix product runs on BLAS, faster than XOR and popcount passes even over 2-bit words
+    if method == 'auto':
+        return 'one_hot'
+    if method == 'packed':
+        if (ENCODE_TABLE[queries] == INVALID_CODE).any() or (ENCODE_TABLE[targets] == INVALID_CODE).any():
+            raise ValueError("The packed method needs sequences of A, C, G and T only")
+        return method
+    if method != 'one_hot':
+        raise ValueError(f"Unknown Hamming distance method: {method}")
+    return method
+
+
+def tile_size(rows: int, columns: int, row_bytes: int, memory_budget: int) -> tuple[int, int]:
+    """Rows and columns per tile so a tile and its encoded rows fit in memory_budget."""
+    tile_rows = min(rows, max(1, math.isqrt(memory_budget // PAIR_BYTES)))
+    tile_columns = (memory_budget - tile_rows * row_bytes) // (tile_rows * PAIR_BYTES + row_bytes)
+    return tile_rows, min(columns, max(1, tile_columns))
+
+
+def distance_tiles(queries: np.ndarray, targets: np.ndarray | None = None, method: str = 'auto',
+                   memory_budget: int = DEFAULT_MEMORY_BUDGET):
+    """
+    Yield (row, column, distances) tiles covering the queries x targets
+    distance matrix, each within about memory_budget bytes. Without
+    targets the queries are compared with each other and only tiles on or
+    above the diagonal are yielded.
+    """
+    symmetric = targets is None
+    targets = queries if symmetric else targets
+    if not len(queries) or not len(targets):
+        return
+    if queries.shape[1] != targets.shape[1]:
+        raise ValueError("Sequences must have equal length")
+    length = queries.shape[1]
+    method = choose_method(queries, targets, method)
+    if method == 'packed':
+        encode, distances = pack_rows, packed_distances
+        row_bytes = 16 * -(-length // BASES_PER_WORD)
+    else:
+        alphabet = np.union1d(np.unique(queries), np.unique(targets)).astype(np.uint8)
+        encode, distances = (lambda rows: one_hot_rows(rows, alphabet)), one_hot_distances
+        row_bytes = 4 * length * len(alphabet)
+    tile_rows, tile_columns = tile_size(len(queries), len(targets), row_bytes, memory_budget)
+    for row in range(0, len(queries), tile_rows):
+        encoded_rows = encode(queries[row:row+tile_rows])
+        for column in range(row if symmetric else 0, len(targets), tile_columns):
+            yield row, column, distances(encoded_rows, encode(targets[column:column+tile_columns]), length)
+
+
+def distance_matrix(queries: list[str], targets: list[str] | None = None, method: str = 'auto',
+                    memory_budget: int = DEFAULT_MEMORY_BUDGET) -> np.ndarray:
+    """
+    Hamming distances between every query and every target, or between all
+    pairs of queries without targets. method is 'one_hot' (match counts by
+    matrix product; any symbols), 'packed' (2-bit bit planes, XOR and
+    popcount; ACGT only, with 64 times smaller encoded rows) or 'auto'.
+    Only the tiles, not the result, count against memory_budget.
+    """
+    query_rows = encode_batch(queries)
+    target_rows = encode_batch(targets) if targets is not None else None
+    columns = len(queries) if targets is None else len(targets)
+    matrix = np.zeros((len(queries), columns), dtype=distance_dtype(query_rows.shape[1]))
+    for row, column, tile in distance_tiles(query_rows, target_rows, method, memory_budget):
+        matrix[row:row+tile.shape[0], column:column+tile.shape[1]] = tile
+        if target_rows is None:
+            matrix[column:column+tile.shape[1], row:row+tile.shape[0]] = tile.T
+    return matrix
+
+
+def pairs_within(queries: list[str], max_difference: int, targets: list[str] | None = None, method: str = 'auto',
+                 memory_budget: int = DEFAULT_MEMORY_BUDGET) -> dict[str, np.ndarray]:
+    """
+    Pairs within max_difference mismatches as query index, target index and
+    distance columns, without holding the whole distance matrix. Without
+    targets each pair of distinct queries is reported once, query < target.
+    """
+    query_rows = encode_batch(queries)
+    target_rows = encode_batch(targets) if targets is not None else None
+    found_queries, found_targets, found_distances = [np.zeros(0, dtype=np.intp)], [np.zeros(0, dtype=np.intp)], []
+    for row, column, tile in distance_tiles(query_rows, target_rows, method, memory_budget):
+        within = tile <= max_difference
+        if target_rows is None:
+            within &= np.arange(row, row + tile.shape[0])[:, None] < np.arange(column, column + tile.shape[1])
+        rows, columns = np.nonzero(within)
+        found_queries.append(rows + row)
+        found_targets.append(columns + column)
+        found_distances.append(tile[rows, columns])
+    query_ids, target_ids = np.concatenate(found_queries), np.concatenate(found_targets)
+    distances = np.concatenate(found_distances or [np.zeros(0, dtype=np.uint8)])
+    order = np.lexsort((target_ids, query_ids))
+    return {'query': query_ids[order], 'target': target_ids[order], 'distance': distances[order]}
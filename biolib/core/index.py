@@ -0,0 +1,84 @@
+import numpy as np
+
+
+def build_suffix_array(data: bytes) -> np.ndarray:
+    """
+    Build the suffix array of data terminated with a zero sentinel.
+    Uses prefix doubling, so construction is O(n log n) numpy sorts.
+    """
+    text = np.frombuffer(data + b'\x00', dtype=np.uint8)
+    length = len(text)
+    rank = np.unique(text, return_inverse=True)[1].astype(np.int64)
+    step = 1
+    while True:
+        second = np.zeros(length, dtype=np.int64)
+        if step < length:
+            second[:length-step] = rank[step:] + 1
+        keys = rank * (length + 1) + second
+        suffix_array = np.argsort(keys)
+        sorted_keys = keys[suffix_array]
+        new_rank = np.empty(length, dtype=np.int64)
+        new_rank[0] = 0
+        np.cumsum(sorted_keys[1:] != sorted_keys[:-1], out=new_rank[1:])
+        rank[suffix_array] = new_rank
+        if new_rank[-1] == length - 1 or step >= length:
+            break
+        step *= 2
+
+    dtype = np.int32 if length < 2**31 else np.int64
+    return suffix_array.astype(dtype)
+
+
+class SuffixIndex:
+    """
+    Suffix array plus BWT/FM-index over a fixed text.
+    Counting is O(m) backward search, locating is O(m + occ).
+    """
+    OCC_STEP = 128
+
+    def __init__(self, text: str, suffix_array: np.ndarray | None = None):
+        """suffix_array may be given when it was built before, e.g. loaded from a cache."""
+        data = text.encode('ascii')
+        self.text_length = len(data)
+        self.suffix_array = build_suffix_array(data) if suffix_array is None else suffix_array
+
+        text_array = np.frombuffer(data + b'\x00', dtype=np.uint8)
+        bwt = text_array[self.suffix_array - 1]
+        self.bwt = bwt.tobytes()
+
+        symbols, counts = np.unique(bwt, return_counts=True)
+        self.first_occurrence = {}
+        self.occ_samples = {}
+        total = 0
+        for symbol, count in zip(symbols.tolist(), counts.tolist()):
+            self.first_occurrence[symbol] = total
+            total += count
+            cumulative = np.cumsum(bwt == symbol, dtype=np.int64)
+            samples = cumulative[self.OCC_STEP-1::self.OCC_STEP]
+            self.occ_samples[symbol] = [0] + samples.tolist()
+
+    def occurrences(self, symbol: int, end: int) -> int:
+        """Number of symbol occurrences in bwt[:end]."""
+        block = end // self.OCC_STEP
+        start = block * self.OCC_STEP
+        return self.occ_samples[symbol][block] + self.bwt.count(symbol, start, end)
+
+    def get_range(self, pattern: str) -> tuple[int, int]:
+        low, high = 0, self.text_length + 1
+        for symbol in reversed(pattern.encode('ascii')):
+            if symbol not in self.first_occurrence:
+                return 0, 0
+            first = self.first_occurrence[symbol]
+            low = first + self.occurrences(symbol, low)
+            high = first + self.occurrences(symbol, high)
+            if low >= high:
+                return 0, 0
+        return low, high
+
+    def count(self, pattern: str) -> int:
+        low, high = self.get_range(pattern)
+        return high - low
+
+    def locate(self, pattern: str) -> list[int]:
+        low, high = self.get_range(pattern)
+        return np.sort(self.suffix_array[low:high]).tolist()
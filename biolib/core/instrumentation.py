@@ -0,0 +1,302 @@
+import contextlib
+import functools
+import inspect
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from bisect import bisect_left
+from collections.abc import Sized
+from contextvars import ContextVar
+from typing import Callable, NamedTuple
+
+TIME_BUCKETS = (1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0, 100.0)
+SIZE_BUCKETS = tuple(10 ** exponent for exponent in range(1, 11))
+DEFAULT_DUMP_INTERVAL = 10.0
+
+
+class CallEvent(NamedTuple):
+    """One instrumented call; allocated_bytes is None unless memory is tracked."""
+    method: str
+    wall_seconds: float
+    cpu_seconds: float
+    input_size: int
+    allocated_bytes: int | None
+    error: bool
+
+
+class Histogram:
+    """Counts of observations per upper bound, with an overflow bucket."""
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        bounds = [repr(float(bound)) for bound in self.buckets] + ['+Inf']
+        total, rows = 0, []
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            rows.append((bound, total))
+        return rows
+
+
+class MethodStats:
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.wall = Histogram(TIME_BUCKETS)
+        self.cpu = Histogram(TIME_BUCKETS)
+        self.input_size = Histogram(SIZE_BUCKETS)
+        self.allocated = Histogram(SIZE_BUCKETS)
+
+    def record(self, event: CallEvent):
+        self.calls += 1
+        self.errors += event.error
+        self.wall.observe(event.wall_seconds)
+        self.cpu.observe(event.cpu_seconds)
+        self.input_size.observe(event.input_size)
+        if event.allocated_bytes is not None:
+            self.allocated.observe(event.allocated_bytes)
+
+    def summary(self) -> dict:
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'wall_seconds': self.wall.sum,
+            'cpu_seconds': self.cpu.sum,
+            'input_size': self.input_size.sum,
+            'allocated_bytes': self.allocated.sum,
+        }
+
+
+class MemorySink:
+    """Per-method call counts and histograms kept in memory."""
+    def __init__(self):
+        self.stats: dict[str, MethodStats] = {}
+        self.lock = threading.Lock()
+
+    def record(self, event: CallEvent):
+        with self.lock:
+            stats = self.stats.get(event.method)
+            if stats is None:
+                stats = self.stats[event.method] = MethodStats()
+            stats.record(event)
+
+    def flush(self):
+        pass
+
+    def clear(self):
+        with self.lock:
+            self.stats.clear()
+
+    def summary(self) -> dict[str, dict]:
+        """Totals per method: calls, errors, seconds, input size and bytes allocated."""
+        with self.lock:
+            return {method: stats.summary() for method, stats in self.stats.items()}
+
+    def to_prometheus(self) -> str:
+        """The stats in the Prometheus text exposition format."""
+        lines = []
+        with self.lock:
+            items = sorted(self.stats.items())
+            for metric, attribute in (('calls_total', 'calls'), ('errors_total', 'errors')):
+                lines.append(f"# TYPE biolib_{metric} counter")
+                lines.extend(f'biolib_{metric}{{method="{method}"}} {getattr(stats, attribute)}' for method, stats in items)
+            for metric, attribute in (('wall_seconds', 'wall'), ('cpu_seconds', 'cpu'),
+                                      ('input_size', 'input_size'), ('allocated_bytes', 'allocated')):
+                lines.append(f"# TYPE biolib_{metric} histogram")
+                for method, stats in items:
+                    histogram = getattr(stats, attribute)
+                    for bound, count in histogram.cumulative():
+                        lines.append(f'biolib_{metric}_bucket{{method="{method}",le="{bound}"}} {count}')
+                    lines.append(f'biolib_{metric}_sum{{method="{method}"}} {histogram.sum}')
+                    lines.append(f'biolib_{metric}_count{{method="{method}"}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+class PrometheusFileSink(MemorySink):
+    """
+    In-memory stats written to a Prometheus text file, e.g. for the node
+    exporter textfile collector, at most every interval seconds and on flush.
+    """
+    def __init__(self, path: str, interval: float = DEFAULT_DUMP_INTERVAL):
+        super().__init__()
+        self.path = path
+        self.interval = interval
+        self.dumped = time.monotonic()
+
+    def record(self, event: CallEvent):
+        super().record(event)
+        if time.monotonic() - self.dumped >= self.interval:
+            self.flush()
+
+    def flush(self):
+        self.dumped = time.monotonic()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.tmp', delete=False) as handle:
+            handle.write(self.to_prometheus())
+        os.replace(handle.name, self.path)
+
+
+class CallbackSink:
+    """Pass every call event to callback."""
+    def __init__(self, callback: Callable[[CallEvent], None]):
+        self.callback = callback
+
+    def record(self, event: CallEvent):
+        self.callback(event)
+
+    def flush(self):
+        pass
+
+
+# checked by every instrumented call; true while any sink is enabled or any scope is open
+_enabled = False
+_sinks: list = []
+_memory_sinks: list = []
+_scopes: ContextVar[tuple] = ContextVar('biolib_instrumentation_scopes', default=())
+_active_scopes = 0
+_memory_users = 0
+_started_tracing = False
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def _update():
+    global _enabled
+    _enabled = bool(_sinks) or _active_scopes > 0
+
+
+def _track_memory(delta: int):
+    global _memory_users, _started_tracing
+    _memory_users += delta
+    if _memory_users and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    elif not _memory_users and _started_tracing:
+        tracemalloc.stop()
+        _started_tracing = False
+
+
+def enable(sink=None, track_memory: bool = False):
+    """
+    Send events of every instrumented call to sink (a new MemorySink by
+    default) until disabled, and return the sink. Tracking memory starts
+    tracemalloc, which slows calls down considerably.
+    """
+    sink = MemorySink() if sink is None else sink
+    with _lock:
+        _sinks.append(sink)
+        if track_memory:
+            _memory_sinks.append(sink)
+            _track_memory(1)
+        _update()
+    return sink
+
+
+def disable(sink=None):
+    """Stop sending events to sink, or to every enabled sink, and flush it."""
+    with _lock:
+        removed = [entry for entry in _sinks if sink is None or entry is sink]
+        for entry in removed:
+            _sinks.remove(entry)
+            if entry in _memory_sinks:
+                _memory_sinks.remove(entry)
+                _track_memory(-1)
+        _update()
+    for entry in removed:
+        entry.flush()
+
+
+@contextlib.contextmanager
+def measure(sink=None, track_memory: bool = False):
+    """
+    Record the instrumented calls made in this context only (this thread or
+    task, not others running concurrently) to sink, a new MemorySink by default.
+    """
+    global _active_scopes
+    sink = MemorySink() if sink is None else sink
+    with _lock:
+        _active_scopes += 1
+        if track_memory:
+            _track_memory(1)
+        _update()
+    token = _scopes.set(_scopes.get() + (sink,))
+    try:
+        yield sink
+    finally:
+        _scopes.reset(token)
+        with _lock:
+            _active_scopes -= 1
+            if track_memory:
+                _track_memory(-1)
+            _update()
+        sink.flush()
+
+
+def input_size(args: tuple, kwargs: dict) -> int:
+    """Length of the largest sequence argument or of the genome the method works on."""
+    sizes = [len(value) for value in (*args, *kwargs.values()) if isinstance(value, Sized)]
+    genome = getattr(args[0], 'genome', None) if args else None
+    if genome is not None:
+        sizes.append(genome.get_sequence_length())
+    return max(sizes, default=0)
+
+
+def _call(name: str, function, args: tuple, kwargs: dict):
+    sinks = (*_sinks, *_scopes.get())
+    if not sinks:
+        return function(*args, **kwargs)
+    depth = getattr(_local, 'depth', 0)
+    # allocations are measured at the outermost call only, since nested calls would reset its peak
+    memory = _memory_users > 0 and depth == 0 and tracemalloc.is_tracing()
+    if memory:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+    _local.depth = depth + 1
+    error = False
+    wall, cpu = time.perf_counter(), time.thread_time()
+    try:
+        return function(*args, **kwargs)
+    except BaseException:
+        error = True
+        raise
+    finally:
+        wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+        _local.depth = depth
+        allocated = max(tracemalloc.get_traced_memory()[1] - before, 0) if memory else None
+        event = CallEvent(name, wall, cpu, input_size(args, kwargs), allocated, error)
+        for sink in sinks:
+            sink.record(event)
+
+
+def instrumented(function):
+    """
+    Report calls of function to the enabled sinks; while instrumentation is
+    disabled this costs one flag check. Methods returning iterators are
+    timed up to the iterator's creation.
+    """
+    name = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return function(*args, **kwargs)
+        return _call(name, function, args, kwargs)
+    return wrapper
+
+
+def instrument_methods(cls):
+    """Class decorator instrumenting every public method defined on cls."""
+    for name, value in list(vars(cls).items()):
+        if not name.startswith('_') and inspect.isfunction(value):
+            setattr(cls, name, instrumented(value))
+    return cls
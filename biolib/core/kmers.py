@@ -0,0 +1,230 @@
+from itertools import combinations, product
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from biolib.core.encoding import DECODE_TABLE, INVALID_CODE, encode
+
+MAX_KMER_LENGTH = 32
+DENSE_KMER_LENGTH = 12
+NEIGHBOR_BATCH_SIZE = 1 << 22
+REVERSE_COMPLEMENT_TABLE = str.maketrans('ACGT', 'TGCA')
+
+
+def encode_kmer(kmer: str) -> int:
+    value = 0
+    for code in encode(kmer).tolist():
+        if code == INVALID_CODE:
+            raise ValueError(f"K-mer {kmer!r} contains symbols other than ACGT")
+        value = (value << 2) | code
+    return value
+
+
+def decode_kmer(value: int, k: int) -> str:
+    return decode_kmers(np.array([value], dtype=np.uint64), k)[0]
+
+
+def decode_kmers(values: np.ndarray, k: int) -> list[str]:
+    shifts = np.arange(2 * (k - 1), -1, -2, dtype=np.uint64)
+    codes = (values.astype(np.uint64)[:, None] >> shifts) & np.uint64(3)
+    text = DECODE_TABLE[codes].tobytes().decode('ascii')
+    return [text[i:i+k] for i in range(0, len(text), k)]
+
+
+def kmer_values(codes: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the 2-bit integer value of every k-mer window of codes and a mask
+    of the windows made only of ACGT. Values of other windows are meaningless.
+    """
+    windows = max(len(codes) - k + 1, 0)
+    values = np.zeros(windows, dtype=np.uint64)
+    bases = (codes & 3).astype(np.uint64)
+    for j in range(k):
+        values <<= np.uint64(2)
+        values |= bases[j:j+windows]
+    invalid = np.zeros(len(codes) + 1, dtype=np.int64)
+    np.cumsum(codes == INVALID_CODE, out=invalid[1:])
+    valid = invalid[k:k+windows] == invalid[:windows]
+    return values, valid
+
+
+def reverse_complement_values(codes: np.ndarray, k: int) -> np.ndarray:
+    """Values of the reverse complement of every k-mer window of codes."""
+    complement = (3 - (codes & 3)).astype(np.uint8)
+    return kmer_values(complement[::-1], k)[0][::-1]
+
+
+def canonical_values(codes: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    values, valid = kmer_values(codes, k)
+    return np.minimum(values, reverse_complement_values(codes, k)), valid
+
+
+def count_values(values: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Count k-mer values, returning distinct values in ascending order with their counts.
+    Small k uses bincount over all 4^k k-mers, large k sorts.
+    """
+    if k <= DENSE_KMER_LENGTH and 4 ** k <= max(2 * len(values), 1 << 16):
+        counts = np.bincount(values.astype(np.int64), minlength=4 ** k)
+        kmers = np.flatnonzero(counts)
+        return kmers.astype(np.uint64), counts[kmers]
+    return np.unique(values, return_counts=True)
+
+
+def count_kmers(text: str, k: int, canonical: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """Count the k-mers of text made only of ACGT."""
+    codes = encode(text)
+    values, valid = canonical_values(codes, k) if canonical else kmer_values(codes, k)
+    return count_values(values[valid], k)
+
+
+def count_chunk_kmers(chunks: Iterable[tuple[int, str]], k: int, canonical: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """Count the k-mers of chunks overlapping by k - 1 bases, merging one chunk at a time."""
+    values, counts = np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+    for _, text in chunks:
+        chunk_values, chunk_counts = count_kmers(text, k, canonical)
+        if not len(values):
+            values, counts = chunk_values, chunk_counts
+            continue
+        values, inverse = np.unique(np.concatenate((values, chunk_values)), return_inverse=True)
+        counts = np.bincount(inverse, weights=np.concatenate((counts, chunk_counts))).astype(np.int64)
+    return values, counts
+
+
+def canonical_kmer(kmer: str) -> str:
+    return min(kmer, kmer.translate(REVERSE_COMPLEMENT_TABLE)[::-1])
+
+
+def count_windows(text: str, k: int, canonical: bool = False) -> tuple[np.ndarray, np.ndarray, dict[str, int]]:
+    """
+    Count every k-mer window of text. ACGT windows are counted as integers,
+    any window with another symbol falls back to counting its string.
+    """
+    codes = encode(text)
+    values, valid = canonical_values(codes, k) if canonical else kmer_values(codes, k)
+    kmers, counts = count_values(values[valid], k)
+    fallback = {}
+    for i in np.flatnonzero(~valid).tolist():
+        kmer = text[i:i+k]
+        if canonical:
+            kmer = canonical_kmer(kmer)
+        fallback[kmer] = fallback.get(kmer, 0) + 1
+    return kmers, counts, fallback
+
+
+def frequency_map(text: str, k: int, canonical: bool = False) -> dict[str, int]:
+    kmers, counts, fallback = count_windows(text, k, canonical)
+    frequencies = dict(zip(decode_kmers(kmers, k), counts.tolist()))
+    frequencies.update(fallback)
+    return frequencies
+
+
+def frequent_words(text: str, k: int, canonical: bool = False) -> list[str]:
+    """Most frequent k-mers of text, in order of their first occurrence."""
+    codes = encode(text)
+    values, valid = canonical_values(codes, k) if canonical else kmer_values(codes, k)
+    positions = np.flatnonzero(valid)
+    kmers, first, counts = np.unique(values[valid], return_index=True, return_counts=True)
+    fallback = {}
+    for i in np.flatnonzero(~valid).tolist():
+        kmer = text[i:i+k]
+        if canonical:
+            kmer = canonical_kmer(kmer)
+        count, position = fallback.get(kmer, (0, i))
+        fallback[kmer] = (count + 1, position)
+    max_frequency = max(int(counts.max()) if len(counts) else 0, max((c for c, _ in fallback.values()), default=0))
+    if max_frequency == 0:
+        return []
+    tied = counts == max_frequency
+    words = list(zip(positions[first[tied]].tolist(), decode_kmers(kmers[tied], k)))
+    words += [(position, kmer) for kmer, (count, position) in fallback.items() if count == max_frequency]
+    return [kmer for _, kmer in sorted(words)]
+
+
+def reverse_complement_kmers(values: np.ndarray, k: int) -> np.ndarray:
+    """Reverse complements of integer-encoded k-mers."""
+    values = values.astype(np.uint64)
+    complements = np.zeros_like(values)
+    for j in range(k):
+        complements = (complements << np.uint64(2)) | (np.uint64(3) - ((values >> np.uint64(2*j)) & np.uint64(3)))
+    return complements
+
+
+def substitution_masks(k: int, d: int) -> np.ndarray:
+    """
+    XOR masks turning a k-mer into each of its neighbors within Hamming
+    distance d: every choice of up to d positions times the 3 other bases.
+    """
+    masks = [0]
+    for distance in range(1, min(d, k) + 1):
+        for positions in combinations(range(k), distance):
+            for substitutions in product((1, 2, 3), repeat=distance):
+                mask = 0
+                for position, substitution in zip(positions, substitutions):
+                    mask |= substitution << 2*(k - 1 - position)
+                masks.append(mask)
+    return np.array(masks, dtype=np.uint64)
+
+
+def iter_neighbors(value: int, k: int, d: int) -> Iterator[int]:
+    """Yield every k-mer within Hamming distance d of value once, the k-mer itself first."""
+    yield value
+    for distance in range(1, min(d, k) + 1):
+        for positions in combinations(range(k), distance):
+            for substitutions in product((1, 2, 3), repeat=distance):
+                neighbor = value
+                for position, substitution in zip(positions, substitutions):
+                    neighbor ^= substitution << 2*(k - 1 - position)
+                yield neighbor
+
+
+def neighbor_counts(kmers: np.ndarray, counts: np.ndarray, k: int, d: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Spread the count of every distinct k-mer to all k-mers within distance d,
+    giving for each k-mer the number of windows it matches with at most d
+    mismatches. Work is tiled so at most NEIGHBOR_BATCH_SIZE neighbors are held at once.
+    """
+    masks = substitution_masks(k, d)
+    batch = max(NEIGHBOR_BATCH_SIZE // len(masks), 1)
+    dense = k <= DENSE_KMER_LENGTH
+    totals = np.zeros(4 ** k if dense else 0, dtype=np.int64)
+    partials = []
+    for start in range(0, len(kmers), batch):
+        neighbors = (kmers[start:start+batch, None] ^ masks).ravel()
+        weights = np.repeat(counts[start:start+batch], len(masks))
+        if dense:
+            totals += np.bincount(neighbors.astype(np.int64), weights=weights, minlength=4 ** k).astype(np.int64)
+        else:
+            distinct, inverse = np.unique(neighbors, return_inverse=True)
+            partials.append((distinct, np.bincount(inverse, weights=weights).astype(np.int64)))
+    if dense:
+        distinct = np.flatnonzero(totals)
+        return distinct.astype(np.uint64), totals[distinct]
+    if not partials:
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+    distinct, inverse = np.unique(np.concatenate([values for values, _ in partials]), return_inverse=True)
+    weights = np.concatenate([values for _, values in partials])
+    return distinct, np.bincount(inverse, weights=weights).astype(np.int64)
+
+
+def frequent_words_with_mismatches(text: str, k: int, d: int, reverse_complement: bool = False) -> list[str]:
+    """
+    Most frequent k-mers of text counting windows with at most d mismatches,
+    in lexicographic order. With reverse_complement, a k-mer also counts the
+    approximate occurrences of its reverse complement. Windows with symbols
+    other than ACGT are skipped. One counting pass over text is followed by
+    spreading the distinct k-mer counts over their neighborhoods.
+    """
+    kmers, counts = count_kmers(text, k)
+    kmers, counts = neighbor_counts(kmers, counts, k, d)
+    if not len(kmers):
+        return []
+    if reverse_complement:
+        complements = reverse_complement_kmers(kmers, k)
+        positions = np.minimum(np.searchsorted(kmers, complements), len(kmers) - 1)
+        counts = counts + np.where(kmers[positions] == complements, counts[positions], 0)
+        # k-mers seen only through their reverse complement
+        missing = kmers[positions] != complements
+        kmers = np.concatenate((kmers, complements[missing]))
+        counts = np.concatenate((counts, counts[missing]))
+    return decode_kmers(np.sort(kmers[counts == counts.max()]), k)
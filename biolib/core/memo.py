@@ -0,0 +1,85 @@
+import copy
+import functools
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+DEFAULT_MEMO_SIZE = 1024
+
+MISSING = object()
+
+
+class MemoStats(NamedTuple):
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+
+class ResultCache:
+    """
+    Thread-safe LRU map of call results. Results are computed outside the lock;
+    clearing bumps a generation so a result computed against a replaced genome
+    is never stored.
+    """
+    def __init__(self, max_size: int = DEFAULT_MEMO_SIZE):
+        if max_size < 1:
+            raise ValueError("Memo size must be positive")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key) -> tuple[object, int]:
+        """Cached value for key (MISSING if absent) and the current generation."""
+        with self.lock:
+            value = self.entries.get(key, MISSING)
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return value, self.generation
+
+    def put(self, key, value, generation: int):
+        with self.lock:
+            if generation != self.generation:
+                return
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.generation += 1
+
+    def stats(self) -> MemoStats:
+        with self.lock:
+            return MemoStats(self.hits, self.misses, len(self.entries), self.max_size)
+
+
+def memoized(method):
+    """
+    Serve repeated calls of a BioLib method from its memo, when one is enabled.
+    Calls with unhashable arguments bypass the memo; mutable results are
+    copied so callers cannot alter the cached value.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        memo = self.memo
+        if memo is None:
+            return method(self, *args, **kwargs)
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            value, generation = memo.get(key)
+        except TypeError:
+            return method(self, *args, **kwargs)
+        if value is MISSING:
+            value = method(self, *args, **kwargs)
+            memo.put(key, value, generation)
+        return copy.copy(value)
+    return wrapper
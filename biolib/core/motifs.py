@@ -0,0 +1,271 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from biolib.core.encoding import INVALID_CODE, NUCLEOTIDES, decode, encode
+
+
+class MotifSearchResult(NamedTuple):
+    motifs: list[str]
+    positions: list[int]
+    score: int
+
+
+def encode_sequences(sequences: list[str], k: int) -> np.ndarray:
+    """
+    Encode sequences into one (t, n) code matrix, padding shorter ones with
+    INVALID_CODE so their missing k-mers are never chosen.
+    """
+    if not sequences:
+        raise ValueError("At least one sequence is required")
+    if k < 1 or min(len(sequence) for sequence in sequences) < k:
+        raise ValueError("Motif length must be between 1 and the shortest sequence length")
+    codes = np.full((len(sequences), max(len(sequence) for sequence in sequences)), INVALID_CODE, dtype=np.uint8)
+    for row, sequence in enumerate(sequences):
+        codes[row, :len(sequence)] = encode(sequence.upper())
+    return codes
+
+
+def motif_counts(motifs: np.ndarray) -> np.ndarray:
+    """(4, k) nucleotide counts per column of a (t, k) motif matrix, in a single bincount."""
+    k = motifs.shape[1]
+    columns = 4 * np.arange(k)
+    return np.bincount((motifs + columns).ravel(), minlength=4*k).reshape(k, 4).T
+
+
+class MotifSet:
+    """
+    Motifs encoded once as a (t, k) uint8 matrix. Column counts are kept up to
+    date as motifs are replaced, and the profile, consensus, score and entropy
+    derived from them are cached until the next replacement.
+    """
+    def __init__(self, motifs: list[str]):
+        if not motifs:
+            raise ValueError("At least one motif is required")
+        k = len(motifs[0])
+        if any(len(motif) != k for motif in motifs):
+            raise ValueError("Motifs must all have the same length")
+        self.__codes = encode(''.join(motifs).upper()).reshape(len(motifs), k).copy()
+        if (self.__codes == INVALID_CODE).any():
+            raise ValueError("Motifs may only contain A, C, G and T")
+        self.__counts = motif_counts(self.__codes)
+        self.__cache = {}
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray) -> 'MotifSet':
+        """MotifSet of an already encoded (t, k) ACGT code matrix, which is copied."""
+        if len(codes) == 0 or (codes == INVALID_CODE).any():
+            raise ValueError("At least one ACGT motif is required")
+        motif_set = cls.__new__(cls)
+        motif_set.__codes = np.array(codes, dtype=np.uint8)
+        motif_set.__counts = motif_counts(motif_set.__codes)
+        motif_set.__cache = {}
+        return motif_set
+
+    def __len__(self):
+        return len(self.__codes)
+
+    def __getitem__(self, index: int) -> str:
+        return decode(self.__codes[index])
+
+    @property
+    def codes(self) -> np.ndarray:
+        return self.__codes
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self.__counts
+
+    def counts_without(self, index: int) -> np.ndarray:
+        """Column counts of every motif but the one at index."""
+        counts = self.__counts.copy()
+        counts[self.__codes[index], np.arange(self.__codes.shape[1])] -= 1
+        return counts
+
+    def replace(self, index: int, motif: str | np.ndarray):
+        """
+        Replace one motif, given as a string or as codes, updating the column
+        counts by its removed and added symbols only.
+        """
+        codes = encode(motif.upper()) if isinstance(motif, str) else motif
+        if len(codes) != self.__codes.shape[1] or (codes == INVALID_CODE).any():
+            raise ValueError("Replacement must be an ACGT motif of the same length")
+        columns = np.arange(len(codes))
+        self.__counts[self.__codes[index], columns] -= 1
+        self.__counts[codes, columns] += 1
+        self.__codes[index] = codes
+        self.__cache.clear()
+
+    def cached(self, name: str, compute):
+        if name not in self.__cache:
+            self.__cache[name] = compute()
+        return self.__cache[name]
+
+    def profile(self) -> np.ndarray:
+        return self.cached('profile', lambda: self.__counts / len(self.__codes))
+
+    def consensus(self) -> str:
+        """Most frequent nucleotide of each column, ties going to the first in ACGT order."""
+        return self.cached('consensus', lambda: decode(self.__counts.argmax(axis=0)))
+
+    def score(self) -> int:
+        return self.cached('score', lambda: motifs_score(self.__counts))
+
+    def entropy(self) -> float:
+        def compute():
+            profile = self.profile()
+            nonzero = profile[profile > 0]
+            return float(-(nonzero * np.log2(nonzero)).sum())
+        return self.cached('entropy', compute)
+
+    def counts_dict(self) -> dict[str, list[int]]:
+        return {symbol: counts for symbol, counts in zip(NUCLEOTIDES, self.__counts.tolist())}
+
+    def profile_dict(self) -> dict[str, list[float]]:
+        return {symbol: profile for symbol, profile in zip(NUCLEOTIDES, self.profile().tolist())}
+
+
+def motifs_score(counts: np.ndarray) -> int:
+    """Mismatches against the consensus: t*k minus the top count of each column."""
+    return int(counts.sum() - counts.max(axis=0).sum())
+
+
+def log_profile(counts: np.ndarray, pseudocount: float) -> np.ndarray:
+    """
+    Log probabilities of a profile, with a fifth row of -inf so windows that
+    cover invalid symbols score -inf.
+    """
+    smoothed = counts + pseudocount
+    with np.errstate(divide='ignore'):
+        profile = np.log(smoothed / smoothed.sum(axis=0))
+    return np.vstack((profile, np.full(counts.shape[1], -np.inf)))
+
+
+def window_log_probabilities(windows: np.ndarray, profile: np.ndarray) -> np.ndarray:
+    """Log probability of every k-mer window under profile, summed over columns in one pass."""
+    return profile[windows, np.arange(windows.shape[-1])].sum(axis=-1)
+
+
+def most_probable(windows: np.ndarray, profile: np.ndarray) -> np.ndarray:
+    """Start of the profile-most-probable k-mer of every sequence; ties go to the first."""
+    return window_log_probabilities(windows, profile).argmax(axis=-1)
+
+
+def random_positions(generator: np.random.Generator, windows: np.ndarray) -> np.ndarray:
+    """Random start of a valid k-mer in every sequence."""
+    valid = (windows != INVALID_CODE).all(axis=-1)
+    return np.array([generator.choice(np.flatnonzero(row)) for row in valid])
+
+
+def run_randomized(codes: np.ndarray, k: int, pseudocount: float, seed) -> tuple[np.ndarray, int]:
+    """One randomized motif search run, iterated until the score stops improving."""
+    generator = np.random.default_rng(seed)
+    windows = sliding_window_view(codes, k, axis=1)
+    rows = np.arange(len(codes))
+    positions = random_positions(generator, windows)
+    counts = motif_counts(windows[rows, positions])
+    best_positions, best_score = positions, motifs_score(counts)
+    while True:
+        positions = most_probable(windows, log_profile(counts, pseudocount))
+        counts = motif_counts(windows[rows, positions])
+        score = motifs_score(counts)
+        if score >= best_score:
+            return best_positions, best_score
+        best_positions, best_score = positions, score
+
+
+def run_gibbs(codes: np.ndarray, k: int, iterations: int, pseudocount: float, patience: int | None, seed) -> tuple[np.ndarray, int]:
+    """
+    One Gibbs sampler run. Each iteration drops one motif from a MotifSet,
+    resamples it from the profile of the others and replaces it, and the run
+    stops early once the best score has not improved for patience iterations.
+    """
+    generator = np.random.default_rng(seed)
+    windows = sliding_window_view(codes, k, axis=1)
+    positions = random_positions(generator, windows)
+    motif_set = MotifSet.from_codes(windows[np.arange(len(codes)), positions])
+    best_positions, best_score = positions.copy(), motif_set.score()
+    stale = 0
+    for _ in range(iterations):
+        row = generator.integers(len(codes))
+        profile = log_profile(motif_set.counts_without(row), pseudocount)
+        probabilities = window_log_probabilities(windows[row], profile)
+        probabilities = np.exp(probabilities - probabilities.max())
+        positions[row] = generator.choice(len(probabilities), p=probabilities / probabilities.sum())
+        motif_set.replace(row, windows[row, positions[row]])
+
+        score = motif_set.score()
+        if score < best_score:
+            best_positions, best_score = positions.copy(), score
+            stale = 0
+        else:
+            stale += 1
+            if patience is not None and stale >= patience:
+                break
+    return best_positions, best_score
+
+
+def run_restarts(function, args: tuple, restarts: int, seed: int | None, workers: int) -> list[tuple[np.ndarray, int]]:
+    """
+    Run independent restarts, each with its own child seed, so results do not
+    depend on the number of workers.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(restarts)
+    if workers > 1 and restarts > 1:
+        with ProcessPoolExecutor(workers) as executor:
+            return list(executor.map(function, *zip(*[args + (child,) for child in seeds])))
+    return [function(*args, child) for child in seeds]
+
+
+def best_result(codes: np.ndarray, k: int, runs: list[tuple[np.ndarray, int]]) -> MotifSearchResult:
+    positions, score = min(runs, key=lambda run: run[1])
+    motifs = [decode(codes[row, position:position+k]) for row, position in enumerate(positions.tolist())]
+    return MotifSearchResult(motifs, positions.tolist(), score)
+
+
+def randomized_motif_search(sequences: list[str], k: int, restarts: int = 1000, pseudocount: float = 1.0,
+                            seed: int | None = None, workers: int = 1) -> MotifSearchResult:
+    codes = encode_sequences(sequences, k)
+    return best_result(codes, k, run_restarts(run_randomized, (codes, k, pseudocount), restarts, seed, workers))
+
+
+def gibbs_sampler(sequences: list[str], k: int, iterations: int = 1000, restarts: int = 20, pseudocount: float = 1.0,
+                  seed: int | None = None, workers: int = 1, patience: int | None = None) -> MotifSearchResult:
+    codes = encode_sequences(sequences, k)
+    return best_result(codes, k, run_restarts(run_gibbs, (codes, k, iterations, pseudocount, patience), restarts, seed, workers))
+
+
+def median_string(sequences: list[str], k: int) -> tuple[str, int]:
+    """
+    k-mer minimizing the summed distance to its closest k-mer in every sequence,
+    with that distance; ties go to the lexicographically first k-mer.
+
+    Prefixes are extended depth-first while keeping, per sequence, the
+    mismatches of every window against the prefix. The summed best window
+    distance of a prefix can only grow as it is extended, so branches whose
+    bound already reaches the best distance found are pruned.
+    """
+    codes = encode_sequences(sequences, k)
+    windows = sliding_window_view(codes, k, axis=1)
+    lengths = np.array([len(sequence) for sequence in sequences])
+    # windows running into padding can never be chosen
+    padding = np.arange(windows.shape[1]) > (lengths - k)[:, None]
+    best_pattern, best_distance = [], k * len(sequences) + 1
+
+    def extend(prefix: list[int], mismatches: np.ndarray):
+        nonlocal best_pattern, best_distance
+        depth = len(prefix)
+        for code in range(4):
+            extended = mismatches + (windows[:, :, depth] != code)
+            distance = int(extended.min(axis=1).sum())
+            if distance >= best_distance:
+                continue
+            if depth + 1 == k:
+                best_pattern, best_distance = prefix + [code], distance
+            else:
+                extend(prefix + [code], extended)
+
+    extend([], np.where(padding, k + 1, 0))
+    return decode(np.array(best_pattern, dtype=np.uint8)), best_distance
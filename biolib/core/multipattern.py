@@ -0,0 +1,66 @@
+from collections import deque
+from typing import Iterable
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over a set of keywords.
+    Transitions are completed into a DFA at build time, so scanning costs one
+    dict lookup per character however many keywords there are.
+    """
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = list(dict.fromkeys(keywords))
+        self.transitions: list[dict[str, int]] = [{}]
+        self.outputs: list[tuple[int, ...]] = [()]
+        terminals = [[]]
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for symbol in keyword:
+                if symbol not in self.transitions[state]:
+                    self.transitions.append({})
+                    terminals.append([])
+                    self.transitions[state][symbol] = len(self.transitions) - 1
+                state = self.transitions[state][symbol]
+            terminals[state].append(keyword_id)
+        self.__complete(terminals)
+
+    def __complete(self, terminals: list[list[int]]):
+        alphabet = {symbol for transitions in self.transitions for symbol in transitions}
+        fail = [0] * len(self.transitions)
+        self.outputs = [tuple(keyword_ids) for keyword_ids in terminals]
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            self.outputs[state] += self.outputs[fail[state]]
+            for symbol in alphabet:
+                child = self.transitions[state].get(symbol)
+                fallback = self.transitions[fail[state]].get(symbol, 0)
+                if child is None:
+                    if fallback:
+                        self.transitions[state][symbol] = fallback
+                else:
+                    fail[child] = fallback
+                    queue.append(child)
+
+    def scan(self, text: str, state: int = 0, offset: int = 0, matches: list | None = None):
+        """
+        Feed text to the automaton starting from state and collect
+        (end_position, keyword_id) hits, end_position being exclusive and
+        shifted by offset. Returns the final state so scans can be chained.
+        """
+        transitions, outputs = self.transitions, self.outputs
+        for i, symbol in enumerate(text):
+            state = transitions[state].get(symbol, 0)
+            if outputs[state]:
+                end = offset + i + 1
+                matches.extend((end, keyword_id) for keyword_id in outputs[state])
+        return state
+
+    def search(self, text: str) -> dict[str, list[int]]:
+        matches = []
+        self.scan(text, matches=matches)
+        positions = {keyword: [] for keyword in self.keywords}
+        for end, keyword_id in matches:
+            keyword = self.keywords[keyword_id]
+            positions[keyword].append(end - len(keyword))
+        return positions
@@ -0,0 +1,102 @@
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+from biolib.core.complement import reverse_complement
+from biolib.core.translation import (
+    codon_amino_acids, encode_nucleotides, reverse_complement_codes, translate_batch
+)
+
+START = ord('M')
+STOP = ord('*')
+
+
+class Orf(NamedTuple):
+    """
+    Open reading frame as a forward-strand interval [start, end), stop codon
+    included. On circular genomes end <= start means the ORF wraps the origin.
+    frame is the ORF's start position modulo 3 on its own strand.
+    """
+    start: int
+    end: int
+    strand: str
+    frame: int
+
+
+def strand_orfs(codes: np.ndarray, min_length: int, genetic_code: int, circular: bool) -> Iterator[tuple[int, int]]:
+    """
+    Yield (start, end) of ORFs on one strand, in strand coordinates.
+    A circular sequence is scanned as three copies. Candidate starts lie in
+    the middle copy and are at most one genome length upstream of their stop,
+    so in-frame stops on both sides of the origin are seen; each stop of the
+    genome ends at most one ORF, the longest.
+    """
+    length = len(codes)
+    if circular and length:
+        codes = np.concatenate((codes, codes, codes))
+        offset = length
+    else:
+        offset = 0
+    amino_acids = codon_amino_acids(codes, genetic_code)
+    frame_starts, frame_ends = [], []
+    for frame in range(3):
+        frame_amino_acids = amino_acids[frame::3]
+        stops = np.flatnonzero(frame_amino_acids == STOP)
+        starts = np.flatnonzero(frame_amino_acids == START)
+        next_stops = np.searchsorted(stops, starts)
+        closed = next_stops < len(stops)
+        starts, next_stops = starts[closed], next_stops[closed]
+        start_positions = frame + 3*starts
+        end_positions = frame + 3*stops[next_stops] + 3
+        candidates = (start_positions >= offset) & (start_positions < offset + length)
+        if circular:
+            candidates &= end_positions - start_positions <= length
+        # the first candidate start before each stop opens the longest ORF ending there
+        _, first = np.unique(next_stops[candidates], return_index=True)
+        frame_starts.append(start_positions[candidates][first])
+        frame_ends.append(end_positions[candidates][first])
+    starts, ends = np.concatenate(frame_starts), np.concatenate(frame_ends)
+    if circular and length:
+        # copies of one genome stop can end ORFs from neighbouring copies, in
+        # different frames when the length is not a multiple of 3; the longest
+        # one contains the others
+        order = np.lexsort((starts - ends, ends % length))
+        _, longest = np.unique(ends[order] % length, return_index=True)
+        selected = np.sort(order[longest])
+        starts, ends = starts[selected], ends[selected]
+    keep = (ends - starts) // 3 - 1 >= min_length
+    for start, end in zip(starts[keep].tolist(), ends[keep].tolist()):
+        yield start - offset, end - offset
+
+
+def find_orfs(sequence: str, min_length: int, genetic_code: int = 1, circular: bool = False) -> Iterator[Orf]:
+    """
+    Yield ORFs of at least min_length codons (stop excluded) on both strands.
+    Each strand is translated once in a single vectorized pass.
+    """
+    return find_orfs_in_codes(encode_nucleotides(sequence), min_length, genetic_code, circular)
+
+
+def find_orfs_in_codes(codes: np.ndarray, min_length: int, genetic_code: int = 1, circular: bool = False) -> Iterator[Orf]:
+    """find_orfs over a sequence already encoded by encode_nucleotides."""
+    length = len(codes)
+    for start, end in strand_orfs(codes, min_length, genetic_code, circular):
+        yield Orf(start, end - length if end > length else end, '+', start % 3)
+    for start, end in strand_orfs(reverse_complement_codes(codes), min_length, genetic_code, circular):
+        forward_start = length - end
+        yield Orf(forward_start + length if forward_start < 0 else forward_start, length - start, '-', start % 3)
+
+
+def orf_sequence(sequence: str, orf: Orf) -> str:
+    """Nucleotides of an ORF read on its own strand, start codon to stop codon."""
+    if orf.end > orf.start:
+        nucleotides = sequence[orf.start:orf.end]
+    else:
+        nucleotides = sequence[orf.start:] + sequence[:orf.end]
+    return nucleotides if orf.strand == '+' else reverse_complement(nucleotides)
+
+
+def translate_orfs(sequence: str, orfs: list[Orf], genetic_code: int = 1) -> list[str]:
+    """Proteins of the given ORFs, without the stop codon."""
+    proteins = translate_batch([orf_sequence(sequence, orf) for orf in orfs], genetic_code)
+    return [protein[:-1] for protein in proteins]
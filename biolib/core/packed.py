@@ -0,0 +1,174 @@
+import numpy as np
+
+from biolib.core.encoding import (
+    DECODE_TABLE, ENCODE_TABLE, INVALID_CODE, NUCLEOTIDES, UPPER_TABLE, encode_range, find_runs, to_bytes_array
+)
+
+SHIFTS = np.array([6, 4, 2, 0], dtype=np.uint8)
+
+
+class PackedSequence:
+    """
+    Sequence stored at 2 bits per base.
+    Non-ACGT symbols are kept as runs in a side table and lowercase
+    (soft-masked) bases as mask runs, so decoding gives back the original text.
+    """
+    def __init__(self, sequence: str):
+        raw = to_bytes_array(sequence)
+        upper = UPPER_TABLE[raw]
+        codes = ENCODE_TABLE[upper]
+        invalid = codes == INVALID_CODE
+
+        self.__length = len(raw)
+        self.__alphabet = DECODE_TABLE
+        self.__exception_starts, self.__exception_ends = find_runs(invalid, upper)
+        self.__exception_symbols = upper[self.__exception_starts].tobytes()
+        self.__mask_starts, self.__mask_ends = find_runs(raw != upper)
+
+        codes[invalid] = 0
+        padded = np.zeros(-(-len(codes) // 4) * 4, dtype=np.uint8)
+        padded[:len(codes)] = codes
+        self.__packed = np.bitwise_or.reduce(padded.reshape(-1, 4) << SHIFTS, axis=1).astype(np.uint8)
+
+    @classmethod
+    def from_packed(cls, packed: np.ndarray, length: int, exception_starts: np.ndarray, exception_ends: np.ndarray,
+                    exception_symbols: bytes, mask_starts: np.ndarray, mask_ends: np.ndarray,
+                    alphabet: str = NUCLEOTIDES) -> 'PackedSequence':
+        """
+        Wrap already packed data, e.g. a memory-mapped .2bit record.
+        alphabet gives the nucleotide stored under each 2-bit value.
+        """
+        sequence = cls.__new__(cls)
+        sequence.__packed = packed
+        sequence.__length = length
+        sequence.__alphabet = to_bytes_array(alphabet)
+        sequence.__exception_starts = exception_starts
+        sequence.__exception_ends = exception_ends
+        sequence.__exception_symbols = exception_symbols
+        sequence.__mask_starts = mask_starts
+        sequence.__mask_ends = mask_ends
+        return sequence
+
+    def __len__(self):
+        return self.__length
+
+    def __str__(self):
+        return self.decode(0, self.__length)
+
+    def __repr__(self):
+        return f"PackedSequence(length={self.__length})"
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return slice_with(self.decode, range(*key.indices(self.__length)))
+        if key < 0:
+            key += self.__length
+        if not 0 <= key < self.__length:
+            raise IndexError("sequence index out of range")
+        return self.decode(key, key + 1)
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.__packed.nbytes + self.__exception_starts.nbytes + self.__exception_ends.nbytes
+            + len(self.__exception_symbols) + self.__mask_starts.nbytes + self.__mask_ends.nbytes
+        )
+
+    def unpack(self, start: int, stop: int) -> np.ndarray:
+        """Raw 2-bit codes in [start, stop), ignoring the side tables."""
+        first_byte, last_byte = start // 4, -(-stop // 4)
+        codes = (self.__packed[first_byte:last_byte, None] >> SHIFTS) & 3
+        offset = start - first_byte * 4
+        return codes.reshape(-1)[offset:offset + stop - start]
+
+    def codes(self, start: int, stop: int) -> np.ndarray:
+        """
+        2-bit codes in [start, stop), with INVALID_CODE for anything but
+        uppercase ACGT, matching encode() on the decoded text.
+        """
+        codes = ENCODE_TABLE[self.__alphabet[self.unpack(start, stop)]]
+        for run_start, run_end, _ in self.__overlapping_exceptions(start, stop):
+            codes[run_start-start:run_end-start] = INVALID_CODE
+        for run_start, run_end in self.__overlapping_masks(start, stop):
+            codes[run_start-start:run_end-start] = INVALID_CODE
+        return codes
+
+    def kmer(self, position: int, k: int) -> int:
+        """Integer encoding of the k-mer at position, two bits per base."""
+        codes = self.codes(position, position + k)
+        if len(codes) != k or (codes == INVALID_CODE).any():
+            raise ValueError(f"No ACGT k-mer of length {k} at position {position}")
+        value = 0
+        for code in codes.tolist():
+            value = (value << 2) | code
+        return value
+
+    def decode(self, start: int, stop: int) -> str:
+        chars = self.__alphabet[self.unpack(start, stop)]
+        for run_start, run_end, symbol in self.__overlapping_exceptions(start, stop):
+            chars[run_start-start:run_end-start] = symbol
+        for run_start, run_end in self.__overlapping_masks(start, stop):
+            chars[run_start-start:run_end-start] |= 0x20
+        return chars.tobytes().decode('ascii')
+
+    def __overlapping_masks(self, start: int, stop: int):
+        first = np.searchsorted(self.__mask_ends, start, side='right')
+        last = np.searchsorted(self.__mask_starts, stop, side='left')
+        for i in range(first, last):
+            yield max(int(self.__mask_starts[i]), start), min(int(self.__mask_ends[i]), stop)
+
+    def __overlapping_exceptions(self, start: int, stop: int):
+        first = np.searchsorted(self.__exception_ends, start, side='right')
+        last = np.searchsorted(self.__exception_starts, stop, side='left')
+        for i in range(first, last):
+            run_start = max(int(self.__exception_starts[i]), start)
+            run_end = min(int(self.__exception_ends[i]), stop)
+            yield run_start, run_end, self.__exception_symbols[i]
+
+
+class CircularView:
+    """Wrap-around view of length bases over a circular sequence, without copying it."""
+    def __init__(self, sequence, length: int):
+        self.sequence = sequence
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __str__(self):
+        return self[:]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return slice_with(self.decode, range(*key.indices(self.length)))
+        if key < 0:
+            key += self.length
+        if not 0 <= key < self.length:
+            raise IndexError("sequence index out of range")
+        return self.sequence[key % len(self.sequence)]
+
+    def decode(self, start: int, stop: int) -> str:
+        return ''.join(self.sequence[begin:end] for begin, end in self.__segments(start, stop))
+
+    def codes(self, start: int, stop: int) -> np.ndarray:
+        segments = [encode_range(self.sequence, begin, end) for begin, end in self.__segments(start, stop)]
+        return np.concatenate(segments) if segments else np.empty(0, dtype=np.uint8)
+
+    def __segments(self, start: int, stop: int):
+        sequence_length = len(self.sequence)
+        while start < stop:
+            offset = start % sequence_length
+            end = min(stop - start, sequence_length - offset)
+            yield offset, offset + end
+            start += end
+
+
+def slice_with(decode, indices: range) -> str:
+    """Resolve a slice over range indices by decoding only the covered span."""
+    if not indices:
+        return ''
+    if indices.step == 1:
+        return decode(indices.start, indices.stop)
+    low = min(indices[0], indices[-1])
+    high = max(indices[0], indices[-1]) + 1
+    return decode(low, high)[indices[0]-low::indices.step]
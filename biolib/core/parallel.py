@@ -0,0 +1,149 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from biolib.core import hamming, kmers, skew
+
+MIN_CHUNK_SIZE = 1 << 16
+COPY_CHUNK_SIZE = 1 << 22
+
+_attached: dict[str, shared_memory.SharedMemory] = {}
+
+
+def attach(name: str) -> shared_memory.SharedMemory:
+    """
+    Attach to the parent's shared memory once per worker. Workers share the
+    parent's resource tracker, so the segment stays registered exactly once
+    and is released by the parent's unlink.
+    """
+    if name not in _attached:
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            memory = shared_memory.SharedMemory(name=name)
+        _attached[name] = memory
+    return _attached[name]
+
+
+def chunk_match_pattern(text: str, windows: int, pattern: str) -> list[int]:
+    return hamming.find_all(text, pattern, windows)
+
+
+def chunk_match_approximate_pattern(text: str, windows: int, pattern: str, max_difference: int, method: str) -> list[int]:
+    positions = hamming.match_approximate(text, pattern, max_difference, method)
+    return positions[positions < windows].tolist()
+
+
+def chunk_frequency_map(text: str, windows: int, k: int, canonical: bool) -> dict[str, int]:
+    return kmers.frequency_map(text[:windows+k-1], k, canonical)
+
+
+def chunk_skew(text: str, windows: int) -> tuple[int, int, list[int]]:
+    return skew.chunk_minimum(text)
+
+
+CHUNK_OPERATIONS = {
+    'match_pattern': chunk_match_pattern,
+    'match_approximate_pattern': chunk_match_approximate_pattern,
+    'frequency_map': chunk_frequency_map,
+    'skew': chunk_skew,
+}
+
+
+def run_chunk(name: str, start: int, stop: int, end: int, operation: str, args: tuple):
+    memory = attach(name)
+    text = bytes(memory.buf[start:end]).decode('ascii')
+    return CHUNK_OPERATIONS[operation](text, stop - start, *args)
+
+
+class ParallelScanner:
+    """
+    Run genome-wide scans over overlapping chunks in a process pool.
+
+    The sequence is copied once into shared memory, so tasks only carry
+    chunk coordinates. A window-based scan with pattern length m reads
+    m - 1 bases past its chunk. Scans are linear, as are the serial scans
+    of BioLib: windows spanning the origin of a circular genome are not
+    scanned. The scanner can be reused across scans and holds its pool and
+    shared memory until closed.
+    """
+    def __init__(self, sequence, workers: int, chunk_size: int | None = None):
+        self.sequence = sequence
+        self.length = len(sequence)
+        self.workers = workers
+        self.chunk_size = chunk_size or max(-(-self.length // (workers * 4)), MIN_CHUNK_SIZE)
+        self.memory = None
+        self.executor = None
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self.lock:
+            self.release()
+
+    def release(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.memory is not None:
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+    def share(self):
+        """Copy the sequence into shared memory and start the pool, once."""
+        with self.lock:
+            if self.memory is not None:
+                return
+            self.memory = shared_memory.SharedMemory(create=True, size=max(self.length, 1))
+            for start in range(0, self.length, COPY_CHUNK_SIZE):
+                data = self.sequence[start:start+COPY_CHUNK_SIZE].encode('ascii')
+                self.memory.buf[start:start+len(data)] = data
+            self.executor = ProcessPoolExecutor(self.workers)
+
+    def map(self, operation: str, overlap: int, *args) -> list:
+        """Run operation over every chunk and return the partial results in sequence order."""
+        self.share()
+        windows_end = self.length - overlap
+        tasks = []
+        for start in range(0, max(windows_end, 0), self.chunk_size):
+            stop = min(start + self.chunk_size, windows_end)
+            end = min(stop + overlap, self.length)
+            tasks.append((self.memory.name, start, stop, end, operation, args))
+        futures = [self.executor.submit(run_chunk, *task) for task in tasks]
+        return [(task[1], future.result()) for task, future in zip(tasks, futures)]
+
+    def match_pattern(self, pattern: str) -> list[int]:
+        return [
+            start + position
+            for start, positions in self.map('match_pattern', len(pattern) - 1, pattern)
+            for position in positions
+        ]
+
+    def count_pattern(self, pattern: str) -> int:
+        return len(self.match_pattern(pattern))
+
+    def match_approximate_pattern(self, pattern: str, max_difference: int, method: str = 'auto') -> list[int]:
+        return [
+            start + position
+            for start, positions in self.map('match_approximate_pattern', len(pattern) - 1, pattern, max_difference, method)
+            for position in positions
+        ]
+
+    def count_approximate_pattern(self, pattern: str, max_difference: int, method: str = 'auto') -> int:
+        return len(self.match_approximate_pattern(pattern, max_difference, method))
+
+    def frequency_map(self, k: int, canonical: bool = False) -> dict[str, int]:
+        frequencies = {}
+        for _, partial in self.map('frequency_map', k - 1, k, canonical):
+            for kmer, count in partial.items():
+                frequencies[kmer] = frequencies.get(kmer, 0) + count
+        return frequencies
+
+    def get_minimum_skew(self) -> list[int]:
+        return skew.merge_minimum(self.map('skew', 0))
@@ -0,0 +1,207 @@
+import gzip
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple, TextIO
+
+import numpy as np
+
+from biolib.core import hamming, kmers
+from biolib.core.complement import reverse_complement
+from biolib.core.hamming import find_all
+
+GZIP_MAGIC = b'\x1f\x8b'
+DEFAULT_BATCH_SIZE = 1 << 14
+# joins the reads of a batch; never part of a pattern, so no match spans two reads
+SEPARATOR = '\n'
+
+
+class Read(NamedTuple):
+    name: str
+    sequence: str
+    quality: str | None = None
+
+
+class ApproximateMatches(NamedTuple):
+    reads: int
+    matches: int
+
+
+def open_reads(path: str) -> TextIO:
+    """Open a FASTA or FASTQ file for reading text, decompressing gzip transparently."""
+    with open(path, 'rb') as handle:
+        magic = handle.read(2)
+    if magic == GZIP_MAGIC:
+        return gzip.open(path, 'rt')
+    return open(path)
+
+
+def parse_reads(lines: Iterable[str]) -> Iterator[Read]:
+    """
+    Yield reads from FASTA or FASTQ text, detected from the first header.
+    Blank lines between records are skipped. Only the record being parsed is
+    held in memory.
+    """
+    lines = enumerate((line.rstrip('\r\n') for line in lines), 1)
+    for number, line in lines:
+        if line:
+            break
+    else:
+        return
+    if line.startswith('@'):
+        while True:
+            if not line.startswith('@'):
+                raise ValueError(f"Expected a FASTQ header ('@') on line {number}")
+            sequence = next(lines, (0, ''))[1]
+            next(lines, None)
+            quality = next(lines, (0, ''))[1]
+            if len(quality) != len(sequence):
+                raise ValueError(f"Truncated FASTQ record {line[1:]!r}")
+            yield Read(line[1:], sequence, quality)
+            for number, line in lines:
+                if line:
+                    break
+            else:
+                return
+    elif line.startswith('>'):
+        name, parts = line[1:], []
+        for _, line in lines:
+            if line.startswith('>'):
+                yield Read(name, ''.join(parts))
+                name, parts = line[1:], []
+            else:
+                parts.append(line)
+        yield Read(name, ''.join(parts))
+    else:
+        raise ValueError("Expected a FASTA ('>') or FASTQ ('@') header")
+
+
+def read_file(path: str) -> Iterator[Read]:
+    with open_reads(path) as handle:
+        yield from parse_reads(handle)
+
+
+def batch_reads(reads: Iterable[Read], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[list[Read]]:
+    reads = iter(reads)
+    while batch := list(islice(reads, batch_size)):
+        yield batch
+
+
+def reverse_complement_reads(reads: Iterable[Read]) -> Iterator[Read]:
+    for read in reads:
+        quality = read.quality[::-1] if read.quality is not None else None
+        yield Read(read.name, reverse_complement(read.sequence), quality)
+
+
+def write_reads(reads: Iterable[Read], output: TextIO):
+    """Write reads as FASTQ when they carry qualities, FASTA otherwise."""
+    for read in reads:
+        if read.quality is not None:
+            output.write(f"@{read.name}\n{read.sequence}\n+\n{read.quality}\n")
+        else:
+            output.write(f">{read.name}\n{read.sequence}\n")
+
+
+def join_batch(batch: list[Read]) -> tuple[str, np.ndarray]:
+    """Sequences of a batch joined by SEPARATOR, with the start offset of each read."""
+    lengths = np.fromiter((len(read.sequence) + 1 for read in batch), dtype=np.int64, count=len(batch))
+    starts = np.zeros(len(batch), dtype=np.int64)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    return SEPARATOR.join(read.sequence for read in batch), starts
+
+
+class PatternCount:
+    """Total exact occurrences of pattern over all reads."""
+    def __init__(self, pattern: str):
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+        self.pattern = pattern
+        self.count = 0
+
+    def process(self, batch: list[Read]):
+        text, _ = join_batch(batch)
+        self.count += len(find_all(text, self.pattern, len(text)))
+
+    def result(self) -> int:
+        return self.count
+
+
+class ApproximateMatch:
+    """
+    Reads holding pattern with at most max_difference mismatches, e.g. adapter
+    contamination, and the total number of such matches.
+    """
+    def __init__(self, pattern: str, max_difference: int, method: str = 'auto'):
+        if not pattern:
+            raise ValueError("Pattern must not be empty")
+        self.pattern = pattern
+        self.max_difference = max_difference
+        self.method = method
+        self.reads = 0
+        self.matches = 0
+
+    def process(self, batch: list[Read]):
+        text, starts = join_batch(batch)
+        positions = hamming.match_approximate(text, self.pattern, self.max_difference, self.method)
+        # drop windows running over a separator into the next read
+        first = np.searchsorted(starts, positions, side='right')
+        last = np.searchsorted(starts, positions + len(self.pattern) - 1, side='right')
+        read_ids = first[first == last]
+        self.matches += len(read_ids)
+        self.reads += len(np.unique(read_ids))
+
+    def result(self) -> ApproximateMatches:
+        return ApproximateMatches(self.reads, self.matches)
+
+
+class KmerFrequencies:
+    """k-mer counts over all reads; k-mers with symbols other than ACGT are skipped."""
+    def __init__(self, k: int, canonical: bool = False):
+        if not 0 < k <= kmers.MAX_KMER_LENGTH:
+            raise ValueError(f"k must be between 1 and {kmers.MAX_KMER_LENGTH}")
+        self.k = k
+        self.canonical = canonical
+        # small k accumulates into a table of all 4^k k-mers, large k merges sorted batches
+        self.dense = np.zeros(4 ** k, dtype=np.int64) if k <= kmers.DENSE_KMER_LENGTH else None
+        self.kmers = np.zeros(0, dtype=np.uint64)
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def process(self, batch: list[Read]):
+        text, _ = join_batch(batch)
+        batch_kmers, batch_counts = kmers.count_kmers(text, self.k, self.canonical)
+        if self.dense is not None:
+            self.dense[batch_kmers.astype(np.int64)] += batch_counts
+            return
+        merged, inverse = np.unique(np.concatenate((self.kmers, batch_kmers)), return_inverse=True)
+        self.counts = np.bincount(inverse, weights=np.concatenate((self.counts, batch_counts))).astype(np.int64)
+        self.kmers = merged
+
+    def result(self) -> dict[str, int]:
+        if self.dense is not None:
+            self.kmers = np.flatnonzero(self.dense).astype(np.uint64)
+            self.counts = self.dense[self.kmers.astype(np.int64)]
+        return dict(zip(kmers.decode_kmers(self.kmers, self.k), self.counts.tolist()))
+
+
+class ReadCount:
+    """Number of reads and bases seen."""
+    def __init__(self):
+        self.reads = 0
+        self.bases = 0
+
+    def process(self, batch: list[Read]):
+        self.reads += len(batch)
+        self.bases += sum(len(read.sequence) for read in batch)
+
+    def result(self) -> tuple[int, int]:
+        return self.reads, self.bases
+
+
+def process_reads(reads: Iterable[Read], operations: list, batch_size: int = DEFAULT_BATCH_SIZE) -> list:
+    """
+    Feed reads to every operation one batch at a time and return their
+    aggregated results, in the order of operations. At most one batch of
+    reads is held in memory.
+    """
+    for batch in batch_reads(reads, batch_size):
+        for operation in operations:
+            operation.process(batch)
+    return [operation.result() for operation in operations]
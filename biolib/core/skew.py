@@ -0,0 +1,82 @@
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from biolib.core.encoding import to_bytes_array
+
+SKEW_TABLE = np.zeros(256, dtype=np.int8)
+SKEW_TABLE[ord('G')] = 1
+SKEW_TABLE[ord('C')] = -1
+
+
+class SkewProfile(NamedTuple):
+    positions: np.ndarray
+    skew: np.ndarray
+    gc_skew: np.ndarray
+
+
+def skew_steps(text: str) -> np.ndarray:
+    return SKEW_TABLE[to_bytes_array(text)]
+
+
+def skew_array(chunks: Iterable[tuple[int, str]]) -> np.ndarray:
+    """Running skew (length n + 1, starting at 0) as one cumulative sum over the chunks."""
+    steps = [np.zeros(1, dtype=np.int8)] + [skew_steps(text) for _, text in chunks]
+    return np.cumsum(np.concatenate(steps), dtype=np.int64)
+
+
+def chunk_minimum(text: str) -> tuple[int, int, list[int]]:
+    """Total skew change of a chunk, its lowest running skew and where that occurs (1-based)."""
+    skew = np.cumsum(skew_steps(text), dtype=np.int64)
+    if not len(skew):
+        return 0, 0, []
+    minimum = int(skew.min())
+    return int(skew[-1]), minimum, (np.flatnonzero(skew == minimum) + 1).tolist()
+
+
+def merge_minimum(partials: Iterable[tuple[int, tuple[int, int, list[int]]]]) -> list[int]:
+    """Combine per-chunk chunk_minimum results, given in sequence order with their start offsets."""
+    minimum, positions, offset = 0, [0], 0
+    for start, (total, chunk_minimum_value, chunk_positions) in partials:
+        if offset + chunk_minimum_value < minimum:
+            minimum, positions = offset + chunk_minimum_value, []
+        if offset + chunk_minimum_value == minimum:
+            positions.extend(start + position for position in chunk_positions)
+        offset += total
+    return positions
+
+
+def minimum_skew(chunks: Iterable[tuple[int, str]]) -> list[int]:
+    """Positions of the minimum skew, holding only one chunk's skew at a time."""
+    return merge_minimum((start, chunk_minimum(text)) for start, text in chunks)
+
+
+def skew_profile(chunks: Iterable[tuple[int, str]], resolution: int) -> SkewProfile:
+    """
+    Summarize skew every resolution bases for plotting: the running skew at
+    each window end and the window's GC skew (G - C) / (G + C).
+    """
+    g_counts, c_counts = [], []
+    length = 0
+    for start, text in chunks:
+        data = to_bytes_array(text)
+        if not len(data):
+            continue
+        windows = (start + np.arange(len(data))) // resolution
+        first = int(windows[0])
+        g = np.bincount(windows - first, weights=data == ord('G')).astype(np.int64)
+        c = np.bincount(windows - first, weights=data == ord('C')).astype(np.int64)
+        if g_counts and first * resolution < start:
+            g_counts[-1][-1] += g[0]
+            c_counts[-1][-1] += c[0]
+            g, c = g[1:], c[1:]
+        if len(g):
+            g_counts.append(g)
+            c_counts.append(c)
+        length = start + len(data)
+
+    g = np.concatenate(g_counts) if g_counts else np.zeros(0, dtype=np.int64)
+    c = np.concatenate(c_counts) if c_counts else np.zeros(0, dtype=np.int64)
+    ends = np.minimum(resolution * np.arange(1, len(g) + 1), length)
+    gc_skew = np.divide(g - c, g + c, out=np.zeros(len(g)), where=g + c > 0)
+    return SkewProfile(ends, np.cumsum(g - c), gc_skew)
@@ -0,0 +1,120 @@
+import numpy as np
+
+from biolib.core.encoding import ENCODE_TABLE, INVALID_CODE, to_bytes_array
+
+# NCBI translation tables, amino acids listed in TCAG codon order
+NCBI_GENETIC_CODES = {
+    1: 'FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG',
+    2: 'FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSS**VVVVAAAADDEEGGGG',
+    3: 'FFLLSSSSYY**CCWWTTTTPPPPHHQQRRRRIIMMTTTTNNKKSSRRVVVVAAAADDEEGGGG',
+    4: 'FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG',
+    5: 'FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSSSVVVVAAAADDEEGGGG',
+    6: 'FFLLSSSSYYQQCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG',
+    9: 'FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG',
+    10: 'FFLLSSSSYY**CCCWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG',
+    11: 'FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG',
+    12: 'FFLLSSSSYY**CC*WLLLSPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG',
+    13: 'FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSGGVVVVAAAADDEEGGGG',
+    14: 'FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG',
+}
+
+AMINO_ACIDS = {
+    'A': ('Alanine', 'Ala'),
+    'C': ('Cysteine', 'Cys'),
+    'D': ('Aspartic acid', 'Asp'),
+    'E': ('Glutamic acid', 'Glu'),
+    'F': ('Phenylalanine', 'Phe'),
+    'G': ('Glycine', 'Gly'),
+    'H': ('Histidine', 'His'),
+    'I': ('Isoleucine', 'Ile'),
+    'K': ('Lysine', 'Lys'),
+    'L': ('Leucine', 'Leu'),
+    'M': ('Methionine', 'Met'),
+    'N': ('Asparagine', 'Asn'),
+    'P': ('Proline', 'Pro'),
+    'Q': ('Glutamine', 'Gln'),
+    'R': ('Arginine', 'Arg'),
+    'S': ('Serine', 'Ser'),
+    'T': ('Threonine', 'Thr'),
+    'V': ('Valine', 'Val'),
+    'W': ('Tryptophan', 'Trp'),
+    'Y': ('Tyrosine', 'Tyr'),
+    '*': ('Stop codon', 'Stop'),
+}
+
+UNKNOWN_AMINO_ACID = ord('X')
+
+# DNA or RNA, either case -> 2-bit ACGT code (U reads as T)
+NUCLEOTIDE_TABLE = ENCODE_TABLE.copy()
+for nucleotide, code in (('a', 0), ('c', 1), ('g', 2), ('t', 3), ('U', 3), ('u', 3)):
+    NUCLEOTIDE_TABLE[ord(nucleotide)] = code
+
+
+def build_codon_table(amino_acids: str) -> np.ndarray:
+    """Reorder an NCBI TCAG-ordered table into a 64-entry lookup indexed by packed ACGT codons."""
+    tcag_index = [2, 1, 3, 0]
+    table = np.empty(64, dtype=np.uint8)
+    for codon in range(64):
+        first, second, third = codon >> 4, (codon >> 2) & 3, codon & 3
+        table[codon] = ord(amino_acids[16*tcag_index[first] + 4*tcag_index[second] + tcag_index[third]])
+    return table
+
+
+CODON_TABLES = {code: build_codon_table(amino_acids) for code, amino_acids in NCBI_GENETIC_CODES.items()}
+
+
+def get_codon_table(genetic_code: int) -> np.ndarray:
+    if genetic_code not in CODON_TABLES:
+        raise ValueError(f"Unsupported genetic code: {genetic_code}")
+    return CODON_TABLES[genetic_code]
+
+
+def encode_nucleotides(sequence: str) -> np.ndarray:
+    return NUCLEOTIDE_TABLE[to_bytes_array(sequence)]
+
+
+def codon_amino_acids(codes: np.ndarray, genetic_code: int = 1) -> np.ndarray:
+    """
+    Amino acid byte for the codon starting at every position of codes, in a
+    single vectorized pass; codons with non-nucleotide symbols give 'X'.
+    """
+    positions = max(len(codes) - 2, 0)
+    codons = (codes[:positions] & 3) << 4 | (codes[1:positions+1] & 3) << 2 | (codes[2:positions+2] & 3)
+    amino_acids = get_codon_table(genetic_code)[codons]
+    invalid = (codes == INVALID_CODE)
+    amino_acids[invalid[:positions] | invalid[1:positions+1] | invalid[2:positions+2]] = UNKNOWN_AMINO_ACID
+    return amino_acids
+
+
+def reverse_complement_codes(codes: np.ndarray) -> np.ndarray:
+    complemented = np.where(codes == INVALID_CODE, INVALID_CODE, 3 - (codes & 3)).astype(np.uint8)
+    return complemented[::-1]
+
+
+def translate(sequence: str, frame: int = 0, genetic_code: int = 1) -> str:
+    """Translate codons of sequence from frame on, dropping a trailing partial codon."""
+    return codon_amino_acids(encode_nucleotides(sequence), genetic_code)[frame::3].tobytes().decode('ascii')
+
+
+def translate_six_frames(sequence: str, genetic_code: int = 1) -> list[str]:
+    """Forward frames 0-2 followed by reverse-complement frames 0-2."""
+    return translate_six_frames_codes(encode_nucleotides(sequence), genetic_code)
+
+
+def translate_six_frames_codes(codes: np.ndarray, genetic_code: int = 1) -> list[str]:
+    forward = codon_amino_acids(codes, genetic_code)
+    reverse = codon_amino_acids(reverse_complement_codes(codes), genetic_code)
+    return [amino_acids[frame::3].tobytes().decode('ascii') for amino_acids in (forward, reverse) for frame in range(3)]
+
+
+def translate_batch(sequences: list[str], genetic_code: int = 1) -> list[str]:
+    """Translate many sequences (e.g. ORFs) from their first base in one vectorized pass."""
+    trimmed = [sequence[:len(sequence) - len(sequence) % 3] for sequence in sequences]
+    amino_acids = codon_amino_acids(encode_nucleotides(''.join(trimmed)), genetic_code)[::3]
+    text = amino_acids.tobytes().decode('ascii')
+    proteins = []
+    position = 0
+    for sequence in trimmed:
+        proteins.append(text[position:position + len(sequence)//3])
+        position += len(sequence)//3
+    return proteins
@@ -0,0 +1,58 @@
+import numpy as np
+
+from biolib import BioLib
+
+
+def patterns_argument(value) -> list[str]:
+    """A list of patterns, given as a list or as a comma-separated string."""
+    return value.split(',') if isinstance(value, str) else list(value)
+
+
+OPERATIONS = {
+    'count_pattern': lambda app, query: app.count_pattern(query['pattern']),
+    'match_pattern': lambda app, query: app.match_pattern(query['pattern']),
+    'count_approximate_pattern': lambda app, query: app.count_approximate_pattern(
+        query['pattern'], int(query['max_difference'])
+    ),
+    'match_approximate_pattern': lambda app, query: app.match_approximate_pattern(
+        query['pattern'], int(query['max_difference'])
+    ),
+    'count_patterns': lambda app, query: app.count_patterns(patterns_argument(query['patterns'])),
+    'frequency_map': lambda app, query: app.frequency_map(query['text'], int(query['pattern_length'])),
+    'frequent_words': lambda app, query: app.frequent_words(query['text'], int(query['pattern_length'])),
+    'complement': lambda app, query: app.complement(query['text']),
+    'reverse_complement': lambda app, query: app.reverse_complement(query['text']),
+    'get_minimum_skew': lambda app, query: app.get_minimum_skew(),
+    'calculate_hamming_distance': lambda app, query: app.calculate_hamming_distance(
+        query['sequence_1'], query['sequence_2']
+    ),
+    'calculate_hamming_distances': lambda app, query: app.calculate_hamming_distances(
+        query['sequence'], patterns_argument(query['sequences'])
+    ),
+    'hamming_pairs_within': lambda app, query: app.hamming_pairs_within(
+        patterns_argument(query['sequences']), int(query['max_difference'])
+    ),
+    'translate_rna_to_amino_acid': lambda app, query: app.translate_rna_to_amino_acid(),
+}
+
+
+def to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, tuple):
+        return [to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    return value
+
+
+def execute(app: BioLib, query: dict) -> dict:
+    """Run one query, reporting a bad query as an error instead of raising."""
+    try:
+        return {'result': to_json(OPERATIONS[query['operation']](app, query))}
+    except KeyError as error:
+        return {'error': f"Missing field or unknown operation: {error.args[0]}"}
+    except (TypeError, ValueError) as error:
+        return {'error': str(error)}
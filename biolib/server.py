@@ -0,0 +1,284 @@
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import NamedTuple
+
+import numpy as np
+
+from biolib import BioLib
+from biolib.queries import OPERATIONS, execute
+
+MAX_BODY_SIZE = 1 << 26
+LATENCY_SAMPLES = 1024
+
+
+class GenomeSpec(NamedTuple):
+    """A genome to preload: a file path, or the sequence itself when sequence is set."""
+    name: str
+    path: str | None = None
+    sequence: str | None = None
+    genome_type: str = 'linear'
+    index: bool = False
+
+
+_apps: dict[str, BioLib] = {}
+
+
+def load_genomes(specs: list[GenomeSpec]):
+    """Load every genome once into this process; run as the worker pool initializer."""
+    _apps.clear()
+    for spec in specs:
+        app = BioLib()
+        if spec.sequence is not None:
+            app.set_genome(spec.sequence, spec.genome_type, index=spec.index)
+        else:
+            app.load_genome(spec.path, spec.genome_type, index=spec.index)
+        _apps[spec.name] = app
+
+
+def run_query(query: dict) -> dict:
+    """Run one query against a preloaded genome, reporting errors in the result."""
+    name = query.get('genome')
+    if name is None and len(_apps) == 1:
+        name = next(iter(_apps))
+    if not isinstance(name, str) or name not in _apps:
+        return {'error': f"Unknown genome: {name}"}
+    return execute(_apps[name], query)
+
+
+def run_queries(queries: list[dict]) -> list[dict]:
+    return [run_query(query) for query in queries]
+
+
+class LatencyMetrics:
+    """Request count, error count and recent latencies of one endpoint."""
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, seconds: float, error: bool):
+        self.count += 1
+        self.errors += error
+        self.total += seconds
+        self.samples.append(seconds)
+
+    def summary(self) -> dict:
+        samples = np.array(self.samples) * 1000
+        percentiles = np.percentile(samples, [50, 95, 99]).tolist() if len(samples) else [0.0, 0.0, 0.0]
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'mean_ms': 1000 * self.total / self.count if self.count else 0.0,
+            'p50_ms': percentiles[0],
+            'p95_ms': percentiles[1],
+            'p99_ms': percentiles[2],
+            'max_ms': float(samples.max()) if len(samples) else 0.0,
+        }
+
+
+class BioLibServer:
+    """
+    HTTP/JSON service over preloaded genomes.
+
+    POST /<operation> runs one query, POST /batch runs a list of queries in
+    one task, GET /genomes, /health and /metrics report on the service.
+    Queries run in a worker pool so the event loop never blocks; queries
+    arriving within batch_window seconds of each other are submitted to the
+    pool together, up to max_batch at a time.
+    """
+    def __init__(self, genomes: list[GenomeSpec], host: str = '127.0.0.1', port: int = 8000, workers: int = 1,
+                 executor: str = 'process', batch_window: float = 0.002, max_batch: int = 64):
+        if executor not in ('process', 'thread'):
+            raise ValueError(f"Unknown executor: {executor}")
+        self.genomes = genomes
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.executor_type = executor
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.metrics: dict[str, LatencyMetrics] = {}
+        self.executor: Executor | None = None
+        self.server: asyncio.Server | None = None
+        self.queue: asyncio.Queue | None = None
+        self.batcher: asyncio.Task | None = None
+        # the event loop keeps only weak references to tasks
+        self.batches: set[asyncio.Task] = set()
+
+    async def start(self):
+        if self.executor_type == 'process':
+            self.executor = ProcessPoolExecutor(self.workers, initializer=load_genomes, initargs=(self.genomes,))
+        else:
+            # threads share this process' genomes
+            load_genomes(self.genomes)
+            self.executor = ThreadPoolExecutor(self.workers)
+        # start the workers before any socket is open, so forked workers hold no client connections
+        await self.submit([])
+        self.queue = asyncio.Queue()
+        self.batcher = asyncio.create_task(self.batch_queries())
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        if self.batcher is not None:
+            self.batcher.cancel()
+            self.batcher = None
+        if self.batches:
+            await asyncio.gather(*self.batches, return_exceptions=True)
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def serve_forever(self):
+        async with self:
+            await self.server.serve_forever()
+
+    async def submit(self, queries: list[dict]) -> list[dict]:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, run_queries, queries)
+
+    async def query(self, query: dict) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((query, future))
+        return await future
+
+    async def batch_queries(self):
+        """Collect queued queries for up to batch_window seconds and submit them as one task."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            task = asyncio.create_task(self.run_batch(batch))
+            self.batches.add(task)
+            task.add_done_callback(self.batches.discard)
+
+    async def run_batch(self, batch: list[tuple[dict, asyncio.Future]]):
+        try:
+            results = await self.submit([query for query, _ in batch])
+        except Exception as error:
+            results = [{'error': f"Worker failed: {error}"}] * len(batch)
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def route(self, method: str, path: str, body: bytes) -> tuple[HTTPStatus, object]:
+        endpoint = path.split('?', 1)[0].strip('/')
+        if method == 'GET' and endpoint == 'health':
+            return HTTPStatus.OK, {'status': 'ok'}
+        if method == 'GET' and endpoint == 'genomes':
+            return HTTPStatus.OK, [spec.name for spec in self.genomes]
+        if method == 'GET' and endpoint == 'metrics':
+            return HTTPStatus.OK, {name: metrics.summary() for name, metrics in self.metrics.items()}
+        if method != 'POST' or (endpoint != 'batch' and endpoint not in OPERATIONS):
+            return HTTPStatus.NOT_FOUND, {'error': f"No endpoint {method} /{endpoint}"}
+        try:
+            request = json.loads(body or b'{}')
+        except ValueError:
+            return HTTPStatus.BAD_REQUEST, {'error': "Body must be JSON"}
+        if endpoint == 'batch':
+            queries = request.get('queries') if isinstance(request, dict) else None
+            if not isinstance(queries, list) or not all(isinstance(query, dict) for query in queries):
+                return HTTPStatus.BAD_REQUEST, {'error': "Expected a list of queries"}
+            return HTTPStatus.OK, await self.submit(queries)
+        if not isinstance(request, dict):
+            return HTTPStatus.BAD_REQUEST, {'error': "Expected a JSON object"}
+        result = await self.query({**request, 'operation': endpoint})
+        return (HTTPStatus.BAD_REQUEST if 'error' in result else HTTPStatus.OK), result
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode('latin-1').split()
+                headers = {}
+                while (line := await reader.readline()).strip():
+                    key, _, value = line.decode('latin-1').partition(':')
+                    headers[key.strip().lower()] = value.strip()
+                length = int(headers.get('content-length', 0))
+                if length > MAX_BODY_SIZE:
+                    status, payload = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {'error': "Body too large"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length)
+                    started = time.perf_counter()
+                    status, payload = await self.route(method, path, body)
+                    endpoint = path.split('?', 1)[0].strip('/') or '/'
+                    if status != HTTPStatus.NOT_FOUND:
+                        self.metrics.setdefault(endpoint, LatencyMetrics()).record(
+                            time.perf_counter() - started, status != HTTPStatus.OK
+                        )
+                    connection = headers.get('connection', '').lower()
+                    keep_alive = connection == 'keep-alive' if version == 'HTTP/1.0' else connection != 'close'
+                data = json.dumps(payload).encode('utf-8')
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ValueError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def parse_genome(argument: str) -> GenomeSpec:
+    name, separator, path = argument.partition('=')
+    if not separator:
+        raise argparse.ArgumentTypeError("Expected NAME=PATH")
+    return GenomeSpec(name, path)
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description="Serve BioLib queries over HTTP/JSON.")
+    parser.add_argument('--genome', action='append', type=parse_genome, required=True,
+                        help="genome to preload as NAME=PATH (FASTA or .2bit), may be repeated")
+    parser.add_argument('--genome-type', choices=['linear', 'circular'], default='linear')
+    parser.add_argument('--index', action='store_true', help="build suffix indexes at startup")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=1)
+    parser.add_argument('--executor', choices=['process', 'thread'], default='process')
+    parser.add_argument('--batch-window', type=float, default=0.002, help="seconds to gather queries into one task")
+    parser.add_argument('--max-batch', type=int, default=64)
+    args = parser.parse_args(argv)
+
+    genomes = [spec._replace(genome_type=args.genome_type, index=args.index) for spec in args.genome]
+    server = BioLibServer(genomes, args.host, args.port, args.workers, args.executor, args.batch_window, args.max_batch)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -3,8 +3,8 @@ from setuptools import setup, find_packages
 setup(
     name="biolib",
     version="0.1.0",
-    packages=find_packages(),
-    install_requires=[],
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
+    install_requires=["numpy"],
     author="Dariusz Lenart",
     author_email="dariusz@lenart-it.pl",
     description="A library for biology computing and data manipulation",
@@ -20,6 +20,7 @@ setup(
     entry_points={
         "console_scripts": [
             "biolib-cli=biolib.cli:main",
+            "biolib-server=biolib.server:main",
         ],
     },
 )
\ No newline at end of file
@@ -0,0 +1,62 @@
+import unittest
+from benchmarks.bench_suite import CASES, compare_results, parse_size, run_suite
+
+
+def result(case, size, seconds, peak_bytes, **params):
+    return {'case': case, 'params': params, 'size': size, 'median_seconds': seconds, 'peak_bytes': peak_bytes}
+
+
+class TestBenchSuite(unittest.TestCase):
+    def test_parse_size(self):
+        """Test plain and suffixed sizes."""
+        self.assertEqual(parse_size("1000"), 1000)
+        self.assertEqual(parse_size(" 1k "), 1000)
+        self.assertEqual(parse_size("10M"), 10**7)
+        self.assertEqual(parse_size("1.5k"), 1500)
+        self.assertEqual(parse_size("2G"), 2 * 10**9)
+        with self.assertRaises(ValueError):
+            parse_size("10x")
+
+    def test_compare_thresholds(self):
+        """Test only slowdowns and memory growth past the tolerance and noise floors are flagged."""
+        baseline = [
+            result('count_pattern', 1000, 0.010, 10 << 20, k=12),
+            result('count_pattern', 10000, 0.010, 10 << 20, k=12),
+            result('frequency_map', 1000, 0.010, 10 << 20, k=3),
+            result('get_skew', 1000, 0.0001, 1000),
+            result('complement', 1000, 0.010, 1000),
+        ]
+        current = [
+            result('count_pattern', 1000, 0.0124, 10 << 20, k=12),
+            result('count_pattern', 10000, 0.0126, 10 << 20, k=12),
+            result('frequency_map', 1000, 0.010, 13 << 20, k=3),
+            result('get_skew', 1000, 0.0009, 1000),
+            result('complement', 1000, 0.010, 5000),
+        ]
+        regressions = compare_results(baseline, current, 0.25)
+        self.assertEqual([(entry['case'], entry['size']) for entry in regressions],
+                         [('count_pattern', 10000), ('frequency_map', 1000)])
+        self.assertAlmostEqual(regressions[0]['time_ratio'], 1.26)
+        self.assertAlmostEqual(regressions[1]['memory_ratio'], 1.3)
+        self.assertEqual(compare_results(baseline, current, 0.5), [])
+
+    def test_compare_missing(self):
+        """Test cases missing from either side, or run with other parameters, are not compared."""
+        baseline = [result('count_pattern', 1000, 0.010, 1000, k=12), result('build_index', 1000, 0.010, 1000)]
+        current = [result('count_pattern', 1000, 1.0, 1000, k=9), result('get_skew', 1000, 1.0, 1000)]
+        self.assertEqual(compare_results(baseline, current, 0.25), [])
+        self.assertEqual(compare_results([], current, 0.25), [])
+
+    def test_run_cases(self):
+        """Test every case runs on a small genome and reports times and peak memory."""
+        results = run_suite([1000], CASES, 1, 0)
+        self.assertEqual(len(results), len(CASES))
+        for entry in results:
+            self.assertGreaterEqual(entry['min_seconds'], 0)
+            self.assertGreater(entry['peak_bytes'], 0)
+        scans = [case for case in CASES if case.name in ('count_pattern', 'match_pattern', 'match_patterns')]
+        self.assertTrue(all(case.max_size < parse_size("100M") for case in scans))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from unittest.mock import patch
 from biolib.core.biolib import BioLib
 from biolib.core.genome import Genome, LinearGenome, CircularGenome
 
@@ -134,6 +135,35 @@ class TestBioLib(unittest.TestCase):
         # Test with a palindromic sequence
         self.assertEqual(self.biolib.reverse_complement("GGATCC"), "GGATCC")
 
+    def test_count_symbol(self):
+        """Test sliding-window symbol counts over the extended sequence."""
+        # Circular genome: one half-genome window per position, wrapping around
+        sequence = "GATTACAGGC"
+        self.biolib.set_genome(sequence, "circular")
+        extended = sequence + sequence
+        expected = [extended[i:i+5].count("A") for i in range(len(sequence))]
+        self.assertEqual(self.biolib.count_symbol("A").tolist(), expected)
+
+        # Arbitrary windows, including one longer than the genome
+        for window in (1, 3, 12):
+            extended = sequence * 3
+            expected = [extended[i:i+window].count("G") for i in range(len(sequence))]
+            self.assertEqual(self.biolib.count_symbol("G", window).tolist(), expected)
+
+        # Several symbols at once, and chunked over a longer genome
+        self.biolib.set_genome(self.dna_sequence * 40, "circular")
+        extended = self.dna_sequence * 80
+        with patch('biolib.core.biolib.CHUNK_SIZE', 64):
+            result = self.biolib.count_symbols(["C", "G"], 50)
+        for row, symbol in zip(result.tolist(), "CG"):
+            self.assertEqual(row, [extended[i:i+50].count(symbol) for i in range(len(self.dna_sequence) * 40)])
+
+        # Linear genome: only windows that fit
+        self.biolib.set_genome("ACCA")
+        self.assertEqual(self.biolib.count_symbol("C").tolist(), [1, 2, 1])
+        with self.assertRaises(ValueError):
+            self.biolib.count_symbol("C", 0)
+
     def test_get_skew(self):
         """Test calculation of GC skew."""
         # Simple case: G increases skew, C decreases skew
@@ -0,0 +1,82 @@
+import os
+import random
+import tempfile
+import unittest
+import numpy as np
+from unittest.mock import patch
+from biolib.core import kmers
+from biolib.core.biolib import BioLib
+from biolib.core.cache import IndexCache, hash_genome
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        """Set up a seeded random genome and a temporary cache directory."""
+        generator = random.Random(53)
+        self.sequence = ''.join(generator.choice("ACGT") for _ in range(2000))
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_hash_genome(self):
+        """Test keys depend on content and genome type but not on chunking."""
+        key = hash_genome([(0, self.sequence)], 'LinearGenome')
+        self.assertEqual(key, hash_genome([(0, self.sequence[:700]), (700, self.sequence[700:])], 'LinearGenome'))
+        self.assertNotEqual(key, hash_genome([(0, self.sequence)], 'CircularGenome'))
+        self.assertNotEqual(key, hash_genome([(0, self.sequence[1:])], 'LinearGenome'))
+
+    def test_get_put(self):
+        """Test arrays round trip through memory-mapped files."""
+        cache = IndexCache(self.directory.name)
+        self.assertIsNone(cache.get("key", "values"))
+        cache.put("key", "values", np.arange(10))
+        loaded = cache.get("key", "values")
+        self.assertIsInstance(loaded, np.memmap)
+        self.assertEqual(loaded.tolist(), list(range(10)))
+        built = []
+        self.assertEqual(cache.get_or_build("key", "values", lambda: built.append(1)).tolist(), list(range(10)))
+        self.assertEqual(built, [])
+
+    def test_lru_eviction(self):
+        """Test the least recently used files go first once the size bound is passed."""
+        cache = IndexCache(self.directory.name, max_bytes=3 * 1000)
+        for i, name in enumerate(("a", "b")):
+            cache.put("key", name, np.zeros(100))
+            os.utime(cache.path("key", name), (i, i))
+        cache.get("key", "a")
+        cache.put("key", "c", np.zeros(100))
+        cache.put("key", "d", np.zeros(100))
+        self.assertIsNone(cache.get("key", "b"))
+        self.assertIsNotNone(cache.get("key", "a"))
+        self.assertIsNotNone(cache.get("key", "d"))
+        self.assertLessEqual(cache.size(), 3 * 1000)
+
+    def test_biolib_cache(self):
+        """Test a second BioLib reuses the suffix array, skew and k-mer tables from disk."""
+        biolib = BioLib()
+        biolib.set_cache(self.directory.name)
+        biolib.set_genome(self.sequence, index=True)
+        skew = biolib.get_skew()
+        counts = biolib.kmer_counts(5)
+        positions = biolib.match_pattern("ACGT")
+
+        other = BioLib()
+        other.set_cache(self.directory.name)
+        with patch('biolib.core.biolib.build_suffix_array') as build, patch('biolib.core.skew.skew_array') as skew_array:
+            other.set_genome(self.sequence)
+            self.assertIsNotNone(other.index)
+            self.assertEqual(other.match_pattern("ACGT"), positions)
+            self.assertEqual(other.get_skew(), skew)
+            build.assert_not_called()
+            skew_array.assert_not_called()
+        self.assertEqual(other.kmer_counts(5)[1].tolist(), counts[1].tolist())
+        self.assertEqual(
+            dict(zip(kmers.decode_kmers(counts[0], 5), counts[1].tolist())), kmers.frequency_map(self.sequence, 5)
+        )
+
+        # a different genome type is a different entry
+        other.set_genome(self.sequence, 'circular')
+        self.assertIsNone(other.index)
+
+
+if __name__ == '__main__':
+    unittest.main()
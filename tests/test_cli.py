@@ -0,0 +1,120 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from biolib.cli import main, parse_queries, read_genome, run
+
+
+class TestCLI(unittest.TestCase):
+    def setUp(self):
+        """Set up a FASTA genome and query files in a temporary directory."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        self.genome = self.write("genome.fa", ">chr1 test\nACGTACGTTT\nACGTAGG\n>chr2\nGGGCCCAT\n")
+        self.queries = [
+            {"operation": "count_pattern", "pattern": "ACG"},
+            {"operation": "match_approximate_pattern", "pattern": "ACGA", "max_difference": 1},
+            {"operation": "get_minimum_skew"},
+            {"operation": "count_patterns", "patterns": ["ACG", "TT"]},
+        ]
+
+    def write(self, name, text):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w') as output:
+            output.write(text)
+        return path
+
+    def run_cli(self, argv, stdin=""):
+        """Run the batch command, returning its exit code and output lines."""
+        output = io.StringIO()
+        with patch('sys.stdin', io.StringIO(stdin)), patch('sys.stdout', output):
+            code = run(argv)
+        return code, output.getvalue().splitlines()
+
+    def test_parse_queries(self):
+        """Test JSON array, JSON Lines and TSV query files give the same queries."""
+        tsv = "operation\tpattern\tmax_difference\ncount_pattern\tACG\t\nmatch_approximate_pattern\tACGA\t1\n"
+        self.assertEqual(list(parse_queries(io.StringIO(tsv))), [
+            {"operation": "count_pattern", "pattern": "ACG"},
+            {"operation": "match_approximate_pattern", "pattern": "ACGA", "max_difference": "1"},
+        ])
+        self.assertEqual(list(parse_queries(io.StringIO(json.dumps(self.queries)))), self.queries)
+        lines = '\n'.join(json.dumps(query) for query in self.queries) + '\n\n'
+        self.assertEqual(list(parse_queries(io.StringIO(lines))), self.queries)
+        self.assertEqual(list(parse_queries(io.StringIO(""))), [])
+
+    def test_read_genome(self):
+        """Test genomes on stdin as FASTA records or bare sequence lines."""
+        self.assertEqual(read_genome(io.StringIO(">a\nAC\nGT\n>b\nTT\n")), "ACGT")
+        self.assertEqual(read_genome(io.StringIO(">a\nAC\n>b x\nTT\n"), "b"), "TT")
+        self.assertEqual(read_genome(io.StringIO("ACG\nTTA\n")), "ACGTTA")
+        with self.assertRaises(ValueError):
+            read_genome(io.StringIO(">a\nAC\n"), "c")
+
+    def test_run_jsonl(self):
+        """Test a JSON query batch against a FASTA file streams JSON Lines."""
+        path = self.write("queries.json", json.dumps(self.queries))
+        code, lines = self.run_cli(["--genome", self.genome, "--queries", path, "--index"])
+        self.assertEqual(code, 0)
+        self.assertEqual([json.loads(line) for line in lines], [
+            {"query": 0, "operation": "count_pattern", "result": 3},
+            {"query": 1, "operation": "match_approximate_pattern", "result": [0, 4, 10]},
+            {"query": 2, "operation": "get_minimum_skew", "result": [2, 6, 12]},
+            {"query": 3, "operation": "count_patterns", "result": {"ACG": 3, "TT": 2}},
+        ])
+
+    def test_run_tsv(self):
+        """Test TSV queries from stdin against a named record, with TSV output and errors."""
+        stdin = "operation\tpattern\tpatterns\ncount_pattern\tGG\t\ncount_patterns\t\tGG,CC\ncount_pattern\t\t\n"
+        code, lines = self.run_cli(["--genome", self.genome, "--name", "chr2", "--queries", "-", "--format", "tsv"], stdin)
+        self.assertEqual(code, 1)
+        self.assertEqual(lines[:3], [
+            "query\toperation\tresult\terror",
+            "0\tcount_pattern\t2\t",
+            '1\tcount_patterns\t{"GG": 2, "CC": 2}\t',
+        ])
+        self.assertTrue(lines[3].startswith("2\tcount_pattern\t\tMissing field"))
+
+    def test_run_malformed_lines(self):
+        """Test a malformed JSON line fails only its own query."""
+        stdin = '{"operation": "count_pattern", "pattern": "GG"}\n\n{"operation": "count_pattern",\n[1]\n' \
+                '{"operation": "count_pattern", "pattern": "CC"}\n'
+        code, lines = self.run_cli(["--genome", self.genome, "--name", "chr2", "--queries", "-"], stdin)
+        self.assertEqual(code, 1)
+        results = [json.loads(line) for line in lines]
+        self.assertEqual(results[0], {"query": 0, "operation": "count_pattern", "result": 2})
+        self.assertEqual(results[1], {"query": 1, "operation": None, "error": results[1]["error"]})
+        self.assertTrue(results[1]["error"].startswith("Invalid JSON on line 3"))
+        self.assertEqual(results[2], {"query": 2, "operation": None, "error": "Query must be an object"})
+        self.assertEqual(results[3], {"query": 3, "operation": "count_pattern", "result": 2})
+
+        code, lines = self.run_cli(["--genome", self.genome, "--queries", "-"], '\n[{"operation": "count_pattern"},\n\n{')
+        self.assertEqual(code, 1)
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(json.loads(lines[0])["error"].startswith("Invalid JSON on line 4"))
+
+    def test_genome_from_stdin(self):
+        """Test the genome can come from stdin, written to an output file."""
+        path = self.write("queries.jsonl", json.dumps({"operation": "count_pattern", "pattern": "CG"}) + "\n")
+        output = os.path.join(self.directory, "out.jsonl")
+        code, lines = self.run_cli(["--genome", "-", "--queries", path, "--output", output], "ACGCG\n")
+        self.assertEqual((code, lines), (0, []))
+        with open(output) as handle:
+            self.assertEqual(json.loads(handle.read()), {"query": 0, "operation": "count_pattern", "result": 2})
+        with patch('sys.stderr', io.StringIO()), self.assertRaises(SystemExit):
+            self.run_cli(["--genome", "-", "--queries", "-"])
+
+    def test_main_dispatch(self):
+        """Test main runs the batch subcommand and exits with its code."""
+        path = self.write("queries.jsonl", json.dumps({"operation": "count_pattern", "pattern": "T"}) + "\n")
+        with patch('sys.stdout', io.StringIO()) as output, self.assertRaises(SystemExit) as exit:
+            main(["run", "--genome", self.genome, "--queries", path])
+        self.assertEqual(exit.exception.code, 0)
+        self.assertEqual(json.loads(output.getvalue())["result"], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+from biolib.core.biolib import BioLib
+from biolib.core.collection import GenomeCollection
+from biolib.core.genome import CircularGenome, LinearGenome
+
+
+class TestCollection(unittest.TestCase):
+    def setUp(self):
+        """Set up seeded random genomes of uneven lengths, including an empty one."""
+        generator = random.Random(61)
+        self.sequences = [
+            ''.join(generator.choice("ACGT") for _ in range(generator.randrange(50, 2000)))
+            for _ in range(9)
+        ] + ["", "ACG"]
+        self.collection = GenomeCollection.from_sequences(self.sequences, names=[f"g{i}" for i in range(11)])
+
+    def expected(self, method, *args):
+        """Per-genome results of a BioLib holding each genome alone."""
+        results = []
+        biolib = BioLib()
+        for sequence in self.sequences:
+            biolib.set_genome(sequence)
+            results.append(getattr(biolib, method)(*args))
+        return results
+
+    def flatten(self, results):
+        return (
+            [i for i, positions in enumerate(results) for _ in positions],
+            [p for positions in results for p in positions],
+        )
+
+    def test_buffer(self):
+        """Test genomes round trip through the shared buffer and offset table."""
+        self.assertEqual(len(self.collection), 11)
+        self.assertEqual(self.collection.get_lengths().tolist(), [len(s) for s in self.sequences])
+        self.assertEqual([self.collection.get_sequence(i) for i in range(11)], self.sequences)
+        collection = GenomeCollection([LinearGenome("ACGT"), CircularGenome("GGCC")])
+        self.assertIsInstance(collection.get_genome(1), CircularGenome)
+        self.assertEqual(collection.names, ["0", "1"])
+        with self.assertRaises(ValueError):
+            GenomeCollection.from_sequences(["ACGT"], 'helical')
+
+    def test_batch_queries(self):
+        """Test columnar batch results against one BioLib per genome."""
+        self.assertEqual(self.collection.count_pattern("ACG").tolist(), self.expected('count_pattern', "ACG"))
+        matches = self.collection.match_pattern("GAT")
+        self.assertEqual((matches['genome'].tolist(), matches['position'].tolist()), self.flatten(self.expected('match_pattern', "GAT")))
+        skews = self.collection.get_minimum_skew()
+        self.assertEqual((skews['genome'].tolist(), skews['position'].tolist()), self.flatten(self.expected('get_minimum_skew')))
+
+        frequencies = self.collection.frequency_map(3)
+        rebuilt = [{} for _ in self.sequences]
+        for genome, kmer, count in zip(frequencies['genome'].tolist(), frequencies['kmer'].tolist(), frequencies['count'].tolist()):
+            rebuilt[genome][kmer] = count
+        self.assertEqual(rebuilt, [BioLib().frequency_map(sequence, 3) for sequence in self.sequences])
+        with self.assertRaises(ValueError):
+            self.collection.count_pattern("")
+
+    def test_parallel(self):
+        """Test the process pool gives the same columns as the serial path."""
+        with GenomeCollection.from_sequences(self.sequences, workers=2) as collection:
+            self.assertEqual(collection.count_pattern("ACG").tolist(), self.collection.count_pattern("ACG").tolist())
+            self.assertEqual(collection.match_pattern("TT")['position'].tolist(), self.collection.match_pattern("TT")['position'].tolist())
+            self.assertEqual(collection.frequency_map(2)['count'].tolist(), self.collection.frequency_map(2)['count'].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
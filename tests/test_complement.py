@@ -0,0 +1,27 @@
+import unittest
+from biolib.core.complement import IUPAC_COMPLEMENTS, complement, reverse_complement
+
+
+class TestComplement(unittest.TestCase):
+    def test_iupac(self):
+        """Every IUPAC code complements back to itself."""
+        for symbol, complemented in IUPAC_COMPLEMENTS.items():
+            if symbol != 'U':
+                self.assertEqual(IUPAC_COMPLEMENTS[complemented], symbol)
+        self.assertEqual(complement("ACGTRYSWKMBDHVN"), "TGCAYRSWMKVHDBN")
+        self.assertEqual(complement("ACGU"), "TGCA")
+
+    def test_lowercase_and_other_symbols(self):
+        """Lowercase complements to uppercase; anything else is kept."""
+        self.assertEqual(complement("acgtn"), "TGCAN")
+        self.assertEqual(complement("AC-G.*"), "TG-C.*")
+        self.assertEqual(complement("ACGé"), "TGCé")
+
+    def test_reverse_complement(self):
+        """Test reverse complement of a sequence."""
+        self.assertEqual(reverse_complement("AAGCTN"), "NAGCTT")
+        self.assertEqual(reverse_complement(""), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
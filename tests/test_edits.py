@@ -0,0 +1,98 @@
+import random
+import unittest
+from biolib.core import kmers, skew
+from biolib.core.biolib import BioLib
+from biolib.core.edits import Edit, SkewSummary, affected_segments
+
+
+class TestEdits(unittest.TestCase):
+    def setUp(self):
+        """Set up a BioLib tracking pattern counts, k-mer counts and skew."""
+        self.biolib = BioLib()
+        self.biolib.set_genome("ACGTACGTTTACGTAGGACGT")
+        self.biolib.track_pattern("ACG")
+        self.biolib.track_kmers(3)
+        self.biolib.track_kmers(4, canonical=True)
+        self.biolib.genome.add_tracker(('skew',), SkewSummary(self.biolib.genome.get_sequence(), block_size=4))
+
+    def check_tracked(self):
+        sequence = self.biolib.genome.get_sequence()
+        expected_count = sum(sequence.startswith("ACG", i) for i in range(len(sequence)))
+        self.assertEqual(self.biolib.count_pattern("ACG"), expected_count)
+        for k, canonical in ((3, False), (4, True)):
+            values, counts = self.biolib.kmer_counts(k, canonical)
+            expected_values, expected_counts = kmers.count_kmers(sequence, k, canonical)
+            self.assertEqual(values.tolist(), expected_values.tolist())
+            self.assertEqual(counts.tolist(), expected_counts.tolist())
+        self.assertEqual(self.biolib.get_minimum_skew(), skew.minimum_skew([(0, sequence)]))
+        skew_values = skew.skew_array([(0, sequence)]).tolist()
+        tracker = self.biolib.genome.get_tracker(('skew',))
+        self.assertEqual([tracker.skew_at(p) for p in range(len(sequence) + 1)], skew_values)
+
+    def test_single_edits(self):
+        """Test substitution, insertion and deletion keep tracked statistics exact."""
+        self.biolib.apply_substitution(8, "CG")
+        self.assertEqual(self.biolib.genome.get_sequence(), "ACGTACGTCGACGTAGGACGT")
+        self.check_tracked()
+        self.biolib.apply_insertion(0, "ACGCC")
+        self.biolib.apply_insertion(26, "A")
+        self.assertEqual(self.biolib.genome.get_sequence(), "ACGCCACGTACGTCGACGTAGGACGTA")
+        self.check_tracked()
+        self.biolib.apply_deletion(3, 10)
+        self.assertEqual(self.biolib.genome.get_sequence(), "ACGCGACGTAGGACGTA")
+        self.check_tracked()
+        self.assertEqual(self.biolib.count_pattern("ACG"), 3)
+
+    def test_batch_edits(self):
+        """Test random batches positioned on the sequence before the batch."""
+        generator = random.Random(5)
+        for _ in range(30):
+            sequence = self.biolib.genome.get_sequence()
+            edits, position = [], 0
+            while position < len(sequence) and generator.random() < 0.8:
+                position = generator.randint(position, len(sequence))
+                reference = sequence[position:position+generator.randint(0, 3)]
+                alternate = ''.join(generator.choice("ACGTN") for _ in range(generator.randint(0, 3)))
+                edits.append(Edit(position, reference, alternate))
+                position += len(reference) + 1
+            expected = sequence
+            for edit in reversed(edits):
+                expected = expected[:edit.position] + edit.alternate + expected[edit.position+len(edit.reference):]
+            self.biolib.apply_edits(edits[::-1])
+            self.assertEqual(self.biolib.genome.get_sequence(), expected)
+            self.check_tracked()
+
+    def test_affected_segments(self):
+        """Test windows around nearby edits merge into one segment."""
+        edits = [Edit(5, "A", "CC"), Edit(7, "", "T"), Edit(20, "AA", "")]
+        self.assertEqual(affected_segments(edits, 2, 30), [(3, 9, 3, 11), (18, 24, 20, 24)])
+        self.assertEqual(affected_segments([Edit(0, "", "AC")], 3, 2), [(0, 2, 0, 4)])
+
+    def test_invalid_edits(self):
+        """Test mismatching references, overlaps, bounds and non-string storage."""
+        with self.assertRaises(ValueError):
+            self.biolib.apply_edits([Edit(0, "T", "A")])
+        with self.assertRaises(ValueError):
+            self.biolib.apply_edits([Edit(0, "AC", "A"), Edit(1, "C", "G")])
+        with self.assertRaises(ValueError):
+            self.biolib.apply_substitution(20, "AA")
+        with self.assertRaises(ValueError):
+            self.biolib.apply_deletion(-1, 2)
+        self.assertEqual(self.biolib.genome.get_sequence(), "ACGTACGTTTACGTAGGACGT")
+        self.biolib.set_genome("ACGT", storage='packed')
+        with self.assertRaises(TypeError):
+            self.biolib.apply_insertion(0, "A")
+
+    def test_invalidation(self):
+        """Test edits drop the index and memoized results."""
+        self.biolib.set_genome("ACGTACGT", index=True)
+        self.biolib.enable_memoization()
+        self.assertEqual(self.biolib.match_pattern("ACGT"), [0, 4])
+        self.biolib.apply_substitution(4, "T")
+        self.assertIsNone(self.biolib.index)
+        self.assertEqual(self.biolib.match_pattern("ACGT"), [0])
+        self.assertEqual(self.biolib.count_pattern("TCGT"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import io
+import os
+import random
+import struct
+import tempfile
+import unittest
+from biolib.core.biolib import BioLib
+from biolib.core.complement import reverse_complement
+from biolib.core.fasta import (
+    MappedFastaSequence, build_fai, open_fasta, open_sequence, read_fai, reverse_complement_fasta
+)
+from biolib.core.genome import GenomeFactory, LinearGenome
+from biolib.core.packed import PackedSequence
+
+
+def write_two_bit(path, records):
+    """Write records as a little-endian UCSC .2bit file."""
+    codes = {'T': 0, 'C': 1, 'A': 2, 'G': 3}
+    header = struct.pack('<IIII', 0x1A412743, 0, len(records), 0)
+    index_size = sum(1 + len(name) + 4 for name in records)
+    bodies = []
+    offset = len(header) + index_size
+    index = b''
+    for name, sequence in records.items():
+        n_blocks = [(i, 1) for i, base in enumerate(sequence) if base.upper() == 'N']
+        mask_blocks = [(i, 1) for i, base in enumerate(sequence) if base.islower()]
+        body = struct.pack('<II', len(sequence), len(n_blocks))
+        body += b''.join(struct.pack('<I', start) for start, _ in n_blocks)
+        body += b''.join(struct.pack('<I', size) for _, size in n_blocks)
+        body += struct.pack('<I', len(mask_blocks))
+        body += b''.join(struct.pack('<I', start) for start, _ in mask_blocks)
+        body += b''.join(struct.pack('<I', size) for _, size in mask_blocks)
+        body += struct.pack('<I', 0)
+        padded = [codes.get(base.upper(), 0) for base in sequence] + [0] * (-len(sequence) % 4)
+        body += bytes(
+            padded[i] << 6 | padded[i+1] << 4 | padded[i+2] << 2 | padded[i+3]
+            for i in range(0, len(padded), 4)
+        )
+        index += bytes([len(name)]) + name.encode('ascii') + struct.pack('<I', offset)
+        offset += len(body)
+        bodies.append(body)
+    with open(path, 'wb') as handle:
+        handle.write(header + index + b''.join(bodies))
+
+
+class TestFasta(unittest.TestCase):
+    def setUp(self):
+        """Write FASTA and .2bit fixtures into a temporary directory."""
+        generator = random.Random(5)
+        self.records = {
+            'chr1': ''.join(generator.choice("ACGT") for _ in range(253)),
+            'chr2': ''.join(generator.choice("ACGTN") for _ in range(97)) + "acgtn",
+        }
+        self.directory = tempfile.TemporaryDirectory()
+        self.fasta_path = os.path.join(self.directory.name, 'genome.fa')
+        with open(self.fasta_path, 'w') as handle:
+            for name, sequence in self.records.items():
+                handle.write(f">{name} description\n")
+                for i in range(0, len(sequence), 60):
+                    handle.write(sequence[i:i+60] + "\n")
+        self.two_bit_path = os.path.join(self.directory.name, 'genome.2bit')
+        write_two_bit(self.two_bit_path, self.records)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_build_fai(self):
+        """Test .fai records and that the index is written on first open."""
+        with open(self.fasta_path, 'rb') as handle:
+            entries = build_fai(handle.read())
+        self.assertEqual(list(entries), ['chr1', 'chr2'])
+        self.assertEqual(entries['chr1'].length, 253)
+        self.assertEqual(entries['chr1'].line_bases, 60)
+        self.assertEqual(entries['chr1'].line_width, 61)
+
+        open_fasta(self.fasta_path)
+        self.assertEqual(read_fai(self.fasta_path + '.fai'), entries)
+
+    def test_mapped_fasta(self):
+        """Test lazy FASTA slices across line breaks."""
+        for name, sequence in self.records.items():
+            mapped = open_fasta(self.fasta_path, name)
+            self.assertIsInstance(mapped, MappedFastaSequence)
+            self.assertEqual(len(mapped), len(sequence))
+            self.assertEqual(str(mapped), sequence)
+            for key in [slice(0, 1), slice(55, 130), slice(59, 61), slice(-7, None), slice(None, None, 5)]:
+                self.assertEqual(mapped[key], sequence[key])
+            self.assertEqual(mapped[60], sequence[60])
+        self.assertEqual(open_fasta(self.fasta_path, use_mmap=False), self.records['chr1'])
+
+    def test_two_bit(self):
+        """Test .2bit records decode to the original sequences."""
+        for name, sequence in self.records.items():
+            packed = open_sequence(self.two_bit_path, name)
+            self.assertIsInstance(packed, PackedSequence)
+            self.assertEqual(str(packed), sequence)
+            self.assertEqual(packed[90:102], sequence[90:102])
+
+    def test_reverse_complement_fasta(self):
+        """Test streamed reverse complements keep headers and line wrapping."""
+        output = io.StringIO()
+        reverse_complement_fasta(self.fasta_path, output, line_width=50, chunk_size=70)
+        expected = ''
+        for name, sequence in self.records.items():
+            complemented = reverse_complement(sequence)
+            expected += f">{name} description\n"
+            expected += ''.join(complemented[i:i+50] + "\n" for i in range(0, len(complemented), 50))
+        self.assertEqual(output.getvalue(), expected)
+
+    def test_genome_from_file(self):
+        """Test BioLib queries on file-backed genomes match in-memory ones."""
+        genome = GenomeFactory.from_file("linear", self.fasta_path, "chr2")
+        self.assertIsInstance(genome, LinearGenome)
+        self.assertEqual(genome.get_sequence(), self.records['chr2'])
+
+        in_memory = BioLib()
+        in_memory.set_genome(self.records['chr1'])
+        for path in (self.fasta_path, self.two_bit_path):
+            mapped = BioLib()
+            mapped.load_genome(path)
+            self.assertEqual(mapped.match_pattern("ACG"), in_memory.match_pattern("ACG"))
+            self.assertEqual(mapped.count_approximate_pattern("ACGT", 1), in_memory.count_approximate_pattern("ACGT", 1))
+            self.assertEqual(mapped.get_skew(), in_memory.get_skew())
+
+
+if __name__ == '__main__':
+    unittest.main()
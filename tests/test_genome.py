@@ -52,6 +52,14 @@ class TestGenome(unittest.TestCase):
         invalid_genome = GenomeFactory.create_genome("invalid", sequence)
         self.assertIsNone(invalid_genome)
 
+    def test_iter_chunks(self):
+        """Test chunks cover the sequence once with the requested overlap."""
+        sequence = "ATGCATGCATG"
+        genome = LinearGenome(sequence)
+        chunks = list(genome.iter_chunks(2, chunk_size=4))
+        self.assertEqual(chunks, [(0, "ATGCAT"), (4, "ATGCAT"), (8, "ATG")])
+        self.assertEqual(list(LinearGenome("").iter_chunks(2)), [])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,120 @@
+import random
+import unittest
+from biolib.core import hamming
+from biolib.core.biolib import BioLib
+from biolib.core.encoding import to_bytes_array
+
+
+def reference_matches(text, pattern, max_difference):
+    """Window-by-window Hamming distance scan, used as the oracle."""
+    return [
+        i for i in range(len(text)-len(pattern)+1)
+        if sum(a != b for a, b in zip(text[i:i+len(pattern)], pattern)) <= max_difference
+    ]
+
+
+class TestHamming(unittest.TestCase):
+    def setUp(self):
+        """Set up a seeded random text and patterns sampled from it."""
+        generator = random.Random(13)
+        self.text = ''.join(generator.choice("ACGT") for _ in range(5000))
+        self.patterns = [self.text[i:i+length] for i, length in [(10, 5), (700, 12), (2000, 20), (4990, 10)]]
+
+    def test_mismatch_counts(self):
+        """Test per-window distances against a direct comparison."""
+        counts = hamming.mismatch_counts(to_bytes_array("ACGTAC"), to_bytes_array("AGG"))
+        self.assertEqual(counts.tolist(), [1, 2, 3, 3])
+        self.assertEqual(len(hamming.mismatch_counts(to_bytes_array("AC"), to_bytes_array("ACG"))), 0)
+
+    def test_seed_pieces(self):
+        """Pieces cover the pattern without gaps."""
+        self.assertEqual(hamming.seed_pieces(20, 2), [(0, 6), (6, 13), (13, 20)])
+        self.assertEqual(hamming.seed_pieces(5, 0), [(0, 5)])
+
+    def test_find_all(self):
+        """Overlapping occurrences, optionally limited to starts below windows."""
+        self.assertEqual(hamming.find_all("AAAACAAA", "AA"), [0, 1, 2, 5, 6])
+        self.assertEqual(hamming.find_all("AAAACAAA", "AA", 5), [0, 1, 2])
+        self.assertEqual(hamming.find_all("ACGT", "TT"), [])
+
+    def test_methods_agree(self):
+        """Test vector and seed methods against the reference scan."""
+        for pattern in self.patterns:
+            for max_difference in range(0, 4):
+                expected = reference_matches(self.text, pattern, max_difference)
+                for method in ('vector', 'seed', 'auto'):
+                    self.assertEqual(
+                        hamming.match_approximate(self.text, pattern, max_difference, method).tolist(),
+                        expected
+                    )
+
+    def test_edge_cases(self):
+        """Test patterns longer than the text and distances covering the pattern."""
+        self.assertEqual(hamming.match_approximate("AC", "ACG", 1).tolist(), [])
+        self.assertEqual(hamming.match_approximate("ACGT", "TT", 2).tolist(), [0, 1, 2])
+        self.assertEqual(hamming.match_approximate("ACGT", "TT", -1).tolist(), [])
+        with self.assertRaises(ValueError):
+            hamming.match_approximate("ACGT", "AC", 0, 'unknown')
+
+    def test_biolib_approximate(self):
+        """Test BioLib results with and without an index."""
+        biolib = BioLib()
+        for index in (False, True):
+            biolib.set_genome(self.text, index=index)
+            for pattern in self.patterns:
+                expected = reference_matches(self.text, pattern, 2)
+                self.assertEqual(biolib.match_approximate_pattern(pattern, 2), expected)
+                self.assertEqual(biolib.count_approximate_pattern(pattern, 2, 'vector'), len(expected))
+
+    def test_hamming_distance(self):
+        """Test the pairwise distance rejects unequal lengths."""
+        self.assertEqual(hamming.hamming_distance("ATGC", "ATCC"), 1)
+        with self.assertRaises(ValueError):
+            hamming.hamming_distance("ATGC", "ATG")
+        with self.assertRaises(ValueError):
+            BioLib().calculate_hamming_distance("ATGC", "ATG")
+
+    def test_distance_matrix(self):
+        """Test both methods and small tiles against pairwise distances."""
+        generator = random.Random(7)
+        for length in (1, 12, 70):
+            queries = [''.join(generator.choice("ACGT") for _ in range(length)) for _ in range(40)]
+            targets = [''.join(generator.choice("ACGT") for _ in range(length)) for _ in range(15)]
+            expected = [[hamming.hamming_distance(query, target) for target in targets] for query in queries]
+            expected_all = [[hamming.hamming_distance(query, other) for other in queries] for query in queries]
+            for method in ('packed', 'one_hot'):
+                for memory_budget in (hamming.DEFAULT_MEMORY_BUDGET, 2000):
+                    self.assertEqual(hamming.distance_matrix(queries, targets, method, memory_budget).tolist(), expected)
+                    self.assertEqual(hamming.distance_matrix(queries, None, method, memory_budget).tolist(), expected_all)
+
+    def test_distance_matrix_symbols(self):
+        """Test non-ACGT symbols, unequal lengths and empty batches."""
+        self.assertEqual(hamming.distance_matrix(["ACN", "NNN"], ["ACG"]).tolist(), [[1], [3]])
+        self.assertEqual(hamming.distance_matrix([], ["AC"]).shape, (0, 1))
+        with self.assertRaises(ValueError):
+            hamming.distance_matrix(["ACN"], ["ACG"], 'packed')
+        with self.assertRaises(ValueError):
+            hamming.distance_matrix(["AC", "ACG"])
+        with self.assertRaises(ValueError):
+            hamming.distance_matrix(["AC"], ["ACG"])
+        with self.assertRaises(ValueError):
+            hamming.distance_matrix(["AC"], ["AG"], 'unknown')
+
+    def test_pairs_within(self):
+        """Test radius queries return each pair within the distance once, in order."""
+        barcodes = [self.text[i:i+8] for i in range(0, 800, 8)] + ["ACGTACGT", "ACGTACGA"]
+        distances = hamming.distance_matrix(barcodes)
+        for method in ('packed', 'one_hot'):
+            pairs = hamming.pairs_within(barcodes, 3, method=method, memory_budget=1000)
+            expected = [(i, j) for i in range(len(barcodes)) for j in range(i + 1, len(barcodes)) if distances[i, j] <= 3]
+            self.assertEqual(list(zip(pairs['query'].tolist(), pairs['target'].tolist())), expected)
+            self.assertEqual(pairs['distance'].tolist(), [distances[i, j] for i, j in expected])
+        pairs = BioLib().hamming_pairs_within(["ACGT", "TCGA"], 1, targets=["ACGA", "TTTT", "ACGT"])
+        self.assertEqual(pairs['query'].tolist(), [0, 0, 1])
+        self.assertEqual(pairs['target'].tolist(), [0, 2, 0])
+        self.assertEqual(pairs['distance'].tolist(), [1, 0, 1])
+        self.assertEqual(BioLib().calculate_hamming_distances("ACGT", ["ACGA", "TTTT"]).tolist(), [1, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import random
+import unittest
+from biolib.core.biolib import BioLib
+from biolib.core.index import SuffixIndex, build_suffix_array
+
+
+class TestSuffixIndex(unittest.TestCase):
+    def setUp(self):
+        """Set up a seeded random genome shared by the tests."""
+        generator = random.Random(7)
+        self.sequence = ''.join(generator.choice("ACGT") for _ in range(2000))
+
+    def test_build_suffix_array(self):
+        """Test suffix array against a naive sort of all suffixes."""
+        for text in ["", "A", "banana", "ATATATAT", "GGGGGG", self.sequence[:300]]:
+            terminated = text + '\x00'
+            expected = sorted(range(len(terminated)), key=lambda i: terminated[i:])
+            self.assertEqual(build_suffix_array(text.encode('ascii')).tolist(), expected)
+
+    def test_count_and_locate(self):
+        """Test index queries against a plain scan of the text."""
+        index = SuffixIndex(self.sequence)
+        for pattern in ["A", "ACG", "TTTT", "GATTACA", self.sequence[100:120], "N"]:
+            expected = [
+                i for i in range(len(self.sequence)-len(pattern)+1)
+                if self.sequence[i:i+len(pattern)] == pattern
+            ]
+            self.assertEqual(index.locate(pattern), expected)
+            self.assertEqual(index.count(pattern), len(expected))
+
+    def test_empty_pattern(self):
+        """Empty pattern matches at every offset, like the scan does."""
+        index = SuffixIndex("ACGT")
+        self.assertEqual(index.count(""), 5)
+        self.assertEqual(index.locate(""), [0, 1, 2, 3, 4])
+
+    def test_biolib_index(self):
+        """Test BioLib results are identical with and without the index."""
+        biolib = BioLib()
+        biolib.set_genome(self.sequence)
+        self.assertIsNone(biolib.index)
+        expected = [biolib.match_pattern(p) for p in ["AC", "CGT", "TTAG"]]
+
+        biolib.set_genome(self.sequence, index=True)
+        self.assertIsNotNone(biolib.index)
+        self.assertEqual([biolib.match_pattern(p) for p in ["AC", "CGT", "TTAG"]], expected)
+        self.assertEqual([biolib.count_pattern(p) for p in ["AC", "CGT", "TTAG"]], [len(e) for e in expected])
+
+        # Replacing the genome invalidates the index
+        biolib.set_genome("ATGATGATG")
+        self.assertIsNone(biolib.index)
+        self.assertEqual(biolib.count_pattern("ATG"), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
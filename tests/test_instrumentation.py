@@ -0,0 +1,77 @@
+import os
+import tempfile
+import threading
+import unittest
+from biolib.core import instrumentation
+from biolib.core.biolib import BioLib
+from biolib.core.genome import GenomeFactory
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        """Set up a BioLib holding a short genome."""
+        self.biolib = BioLib()
+        self.biolib.set_genome("ACGTACGTTTACGTAGGACGT")
+
+    def tearDown(self):
+        instrumentation.disable()
+
+    def test_disabled(self):
+        """Test nothing is recorded while instrumentation is off."""
+        events = []
+        sink = instrumentation.enable(instrumentation.CallbackSink(events.append))
+        instrumentation.disable(sink)
+        self.assertEqual(self.biolib.count_pattern("ACGT"), 4)
+        self.assertEqual(events, [])
+        self.assertFalse(instrumentation._enabled)
+
+    def test_memory_sink(self):
+        """Test call counts, errors, input sizes and histograms per method."""
+        sink = instrumentation.enable()
+        self.biolib.count_pattern("ACGT")
+        self.biolib.count_pattern("GT")
+        with self.assertRaises(ValueError):
+            self.biolib.count_pattern("")
+        GenomeFactory.create_genome("linear", "ACGTA")
+        summary = sink.summary()
+        self.assertEqual(summary["BioLib.count_pattern"]["calls"], 3)
+        self.assertEqual(summary["BioLib.count_pattern"]["errors"], 1)
+        self.assertEqual(summary["BioLib.count_pattern"]["input_size"], 3 * 21)
+        self.assertEqual(summary["GenomeFactory.create_genome"]["input_size"], 6)
+        stats = sink.stats["BioLib.count_pattern"]
+        self.assertEqual(stats.wall.count, 3)
+        self.assertEqual(stats.input_size.counts[1], 3)
+        self.assertEqual(stats.allocated.count, 0)
+
+    def test_measure_scope(self):
+        """Test a scope records its own calls only, including allocated bytes."""
+        events = []
+        other = threading.Thread(target=lambda: [self.biolib.count_pattern("A") for _ in range(100)])
+        with instrumentation.measure(instrumentation.CallbackSink(events.append), track_memory=True):
+            other.start()
+            self.biolib.match_pattern("ACGT")
+            other.join()
+        self.assertEqual([event.method for event in events], ["BioLib.get_scanner", "BioLib.match_pattern"])
+        self.assertIsNone(events[0].allocated_bytes)
+        self.assertGreaterEqual(events[1].allocated_bytes, 0)
+        self.assertGreaterEqual(events[1].wall_seconds, events[0].wall_seconds)
+        self.assertFalse(instrumentation._enabled)
+
+    def test_prometheus_file(self):
+        """Test the Prometheus text dump holds cumulative histogram buckets."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "biolib.prom")
+            sink = instrumentation.enable(instrumentation.PrometheusFileSink(path))
+            self.biolib.count_pattern("ACGT")
+            self.biolib.count_pattern("ACGT")
+            instrumentation.disable()
+            with open(path) as handle:
+                text = handle.read()
+        self.assertIn('biolib_calls_total{method="BioLib.count_pattern"} 2', text)
+        self.assertIn('biolib_wall_seconds_bucket{method="BioLib.count_pattern",le="+Inf"} 2', text)
+        self.assertIn('biolib_input_size_bucket{method="BioLib.count_pattern",le="100.0"} 2', text)
+        self.assertEqual(text, sink.to_prometheus())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import random
+import unittest
+from unittest.mock import patch
+from biolib.core import kmers
+from biolib.core.biolib import BioLib
+
+
+def reference_frequency_map(text, k, canonical=False):
+    """Plain dictionary count over every window, used as the oracle."""
+    frequencies = {}
+    for i in range(len(text)-k+1):
+        kmer = text[i:i+k]
+        if canonical:
+            kmer = kmers.canonical_kmer(kmer)
+        frequencies[kmer] = frequencies.get(kmer, 0) + 1
+    return frequencies
+
+
+def reference_frequent_words_with_mismatches(text, k, d, reverse_complement=False):
+    """Approximate count of all 4^k k-mers, used as the oracle."""
+    def count(pattern):
+        return sum(
+            sum(a != b for a, b in zip(pattern, text[i:i+k])) <= d
+            for i in range(len(text)-k+1)
+        )
+    scores = {}
+    for value in range(4 ** k):
+        pattern = kmers.decode_kmer(value, k)
+        scores[pattern] = count(pattern)
+        if reverse_complement:
+            scores[pattern] += count(pattern.translate(kmers.REVERSE_COMPLEMENT_TABLE)[::-1])
+    best = max(scores.values())
+    return sorted(pattern for pattern, score in scores.items() if score == best)
+
+
+class TestKmers(unittest.TestCase):
+    def setUp(self):
+        """Set up a seeded random text with a few non-ACGT symbols."""
+        generator = random.Random(11)
+        self.text = ''.join(generator.choice("ACGT") for _ in range(3000))
+        self.mixed = self.text[:1000] + "NNRY" + self.text[1000:1500].lower() + self.text[1500:]
+
+    def test_encode_decode_kmer(self):
+        """Test k-mer encoding round trips."""
+        self.assertEqual(kmers.encode_kmer("ACGT"), 0b00011011)
+        self.assertEqual(kmers.decode_kmer(0b00011011, 4), "ACGT")
+        self.assertEqual(kmers.decode_kmers(kmers.kmer_values(kmers.encode("TTGCA"), 3)[0], 3), ["TTG", "TGC", "GCA"])
+        with self.assertRaises(ValueError):
+            kmers.encode_kmer("ACN")
+
+    def test_frequency_map(self):
+        """Test the k-mer engine against the reference count, dense and sorted paths."""
+        for text in (self.text, self.mixed, "ATGATGATG", "AC"):
+            for k in (1, 2, 3, 7, 13, 32):
+                for canonical in (False, True):
+                    self.assertEqual(
+                        kmers.frequency_map(text, k, canonical),
+                        reference_frequency_map(text, k, canonical)
+                    )
+
+    def test_count_kmers(self):
+        """Test counts of ACGT-only k-mers and canonical merging."""
+        values, counts = kmers.count_kmers("ACGTNACGT", 2)
+        self.assertEqual(dict(zip(kmers.decode_kmers(values, 2), counts.tolist())), {"AC": 2, "CG": 2, "GT": 2})
+        values, counts = kmers.count_kmers("AAATTT", 3, canonical=True)
+        self.assertEqual(dict(zip(kmers.decode_kmers(values, 3), counts.tolist())), {"AAA": 2, "AAT": 2})
+        text = self.text[:300]
+        for k, canonical in ((3, False), (5, True)):
+            chunks = [(start, text[start:start+7+k-1]) for start in range(0, len(text), 7)]
+            expected = kmers.count_kmers(text, k, canonical)
+            for result, counted in zip(kmers.count_chunk_kmers(chunks, k, canonical), expected):
+                self.assertEqual(result.tolist(), counted.tolist())
+
+    def test_frequent_words(self):
+        """Test most frequent words come back in order of first occurrence."""
+        self.assertEqual(kmers.frequent_words("ACGTTGCATGTCGCATGATGCATGAGAGCT", 4), ["GCAT", "CATG"])
+        self.assertEqual(kmers.frequent_words("NNNNACG", 2), ["NN"])
+        self.assertEqual(kmers.frequent_words("", 3), [])
+        self.assertEqual(kmers.frequent_words("TTNAACGNAAC", 2), ["NA", "AA", "AC"])
+        self.assertEqual(kmers.frequent_words("CGTTGACGNCGNAC", 2, canonical=True), ["CG", "AC", "GN"])
+        # ties are ordered by first occurrence, matching a window-by-window scan
+        text = self.text[:2000]
+        for canonical in (False, True):
+            windows = [text[i:i+6] for i in range(len(text) - 5)]
+            if canonical:
+                windows = [kmers.canonical_kmer(window) for window in windows]
+            counts = {window: windows.count(window) for window in set(windows)}
+            best = max(counts.values())
+            expected = list(dict.fromkeys(window for window in windows if counts[window] == best))
+            self.assertEqual(kmers.frequent_words(text, 6, canonical), expected)
+
+    def test_biolib_fallback(self):
+        """Test BioLib uses the reference loop beyond the packed k-mer length."""
+        biolib = BioLib()
+        text = "A" * 40 + "C"
+        self.assertEqual(biolib.frequency_map(text, 35), {"A" * 35: 6, "A" * 34 + "C": 1})
+        self.assertEqual(biolib.frequent_words(text, 35), ["A" * 35])
+        self.assertEqual(biolib.frequency_map(self.mixed, 5), reference_frequency_map(self.mixed, 5))
+
+    def test_neighbors(self):
+        """Test d-neighborhoods are complete and free of duplicates."""
+        value = kmers.encode_kmer("ACGTA")
+        for d in (0, 1, 2, 5):
+            neighbors = list(kmers.iter_neighbors(value, 5, d))
+            self.assertEqual(len(neighbors), len(set(neighbors)))
+            expected = [
+                v for v in range(4 ** 5)
+                if sum(a != b for a, b in zip("ACGTA", kmers.decode_kmer(v, 5))) <= d
+            ]
+            self.assertEqual(sorted(neighbors), expected)
+            self.assertEqual(sorted((value ^ kmers.substitution_masks(5, d)).tolist()), expected)
+        self.assertEqual(BioLib().neighbors("AC", 1), ["AC", "CC", "GC", "TC", "AA", "AT", "AG"])
+
+    def test_reverse_complement_kmers(self):
+        """Test integer reverse complements."""
+        values = kmers.kmer_values(kmers.encode(self.text[:200]), 7)[0]
+        self.assertEqual(
+            kmers.decode_kmers(kmers.reverse_complement_kmers(values, 7), 7),
+            [kmer.translate(kmers.REVERSE_COMPLEMENT_TABLE)[::-1] for kmer in kmers.decode_kmers(values, 7)]
+        )
+
+    def test_frequent_words_with_mismatches(self):
+        """Test mismatch-tolerant frequent words against brute force over all k-mers."""
+        text = "ACGTTGCATGTCGCATGATGCATGAGAGCT"
+        self.assertEqual(kmers.frequent_words_with_mismatches(text, 4, 1), ["ATGC", "ATGT", "GATG"])
+        self.assertEqual(kmers.frequent_words_with_mismatches(text, 4, 1, True), ["ACAT", "ATGT"])
+        for k, d in ((3, 1), (4, 2), (5, 1)):
+            for reverse_complement in (False, True):
+                self.assertEqual(
+                    kmers.frequent_words_with_mismatches(self.text[:300], k, d, reverse_complement),
+                    reference_frequent_words_with_mismatches(self.text[:300], k, d, reverse_complement)
+                )
+        # windows with other symbols are skipped
+        self.assertEqual(kmers.frequent_words_with_mismatches("AANAA", 2, 0), ["AA"])
+
+    def test_sparse_neighbor_counts(self):
+        """Test the sorted path for k above the dense limit agrees with the dense one."""
+        text = self.text[:400]
+        dense = kmers.neighbor_counts(*kmers.count_kmers(text, 8), 8, 1)
+        with patch('biolib.core.kmers.DENSE_KMER_LENGTH', 4), \
+                patch('biolib.core.kmers.NEIGHBOR_BATCH_SIZE', 1000):
+            sparse = kmers.neighbor_counts(*kmers.count_kmers(text, 8), 8, 1)
+        self.assertEqual(dense[0].tolist(), sparse[0].tolist())
+        self.assertEqual(dense[1].tolist(), sparse[1].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import threading
+import unittest
+from unittest.mock import patch
+from biolib.core.biolib import BioLib
+from biolib.core.memo import ResultCache
+
+
+class TestMemo(unittest.TestCase):
+    def setUp(self):
+        """Set up a BioLib with memoization enabled."""
+        self.biolib = BioLib()
+        self.biolib.set_genome("ACGTACGTTTACGTAGGACGT")
+        self.biolib.enable_memoization(max_size=2)
+
+    def test_result_cache(self):
+        """Test LRU order, counters and that stale generations are not stored."""
+        cache = ResultCache(2)
+        _, generation = cache.get("a")
+        cache.put("a", 1, generation)
+        cache.put("b", 2, generation)
+        cache.get("a")
+        cache.put("c", 3, generation)
+        self.assertEqual(list(cache.entries), ["a", "c"])
+        cache.clear()
+        cache.put("d", 4, generation)
+        self.assertEqual(len(cache.entries), 0)
+        self.assertEqual(cache.stats()[:2], (1, 1))
+        with self.assertRaises(ValueError):
+            ResultCache(0)
+
+    def test_memoized_queries(self):
+        """Test repeated queries are served from the memo and results are copies."""
+        positions = self.biolib.match_pattern("ACGT")
+        positions.append(-1)
+        with patch.object(self.biolib.genome, 'iter_chunks') as iter_chunks:
+            self.assertEqual(self.biolib.match_pattern("ACGT"), [0, 4, 10, 17])
+            iter_chunks.assert_not_called()
+        self.assertEqual(self.biolib.get_memo_stats()[:3], (1, 1, 1))
+
+        self.assertEqual(self.biolib.count_approximate_pattern("ACGT", 1), 4)
+        self.assertEqual(self.biolib.count_approximate_pattern("ACGT", 1), 4)
+        self.assertEqual(self.biolib.frequency_map("AAAT", 2), {"AA": 2, "AT": 1})
+        self.assertLessEqual(self.biolib.get_memo_stats().size, 2)
+
+    def test_invalidation(self):
+        """Test set_genome drops memoized results."""
+        self.assertEqual(self.biolib.count_pattern("ACGT"), 4)
+        self.biolib.set_genome("ACGT")
+        self.assertEqual(self.biolib.count_pattern("ACGT"), 1)
+        self.biolib.disable_memoization()
+        self.assertIsNone(self.biolib.get_memo_stats())
+
+    def test_threads(self):
+        """Test concurrent callers share one memo consistently."""
+        results = []
+
+        def query():
+            for pattern in ("ACGT", "GT", "ACGT", "TTA"):
+                results.append(self.biolib.count_pattern(pattern))
+
+        threads = [threading.Thread(target=query) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(set(results)), [1, 4])
+        self.assertEqual(results.count(4), 24)
+        stats = self.biolib.get_memo_stats()
+        self.assertEqual(stats.hits + stats.misses, 32)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import itertools
+import random
+import unittest
+import numpy as np
+from biolib.core import motifs
+from biolib.core.biolib import BioLib
+
+
+class TestMotifs(unittest.TestCase):
+    def setUp(self):
+        """Set up seeded upstream regions, each with a mutated copy of one motif implanted."""
+        generator = random.Random(41)
+        self.motif = "ATGCGTACGTTA"
+        self.sequences = []
+        self.implanted = []
+        for _ in range(12):
+            sequence = [generator.choice("ACGT") for _ in range(120)]
+            copy = list(self.motif)
+            copy[generator.randrange(len(copy))] = generator.choice("ACGT")
+            position = generator.randrange(len(sequence) - len(copy) + 1)
+            sequence[position:position+len(copy)] = copy
+            self.sequences.append(''.join(sequence))
+            self.implanted.append(position)
+
+    def test_profile_scoring(self):
+        """Test vectorized log probabilities and scores against direct products."""
+        codes = motifs.encode_sequences(["ACGTAC", "GGTA"], 3)
+        counts = motifs.motif_counts(codes[:, :3])
+        self.assertEqual(counts.tolist(), [[1, 0, 0], [0, 1, 0], [1, 1, 1], [0, 0, 1]])
+        self.assertEqual(motifs.motifs_score(counts), 3)
+
+        profile = motifs.log_profile(counts, 0)
+        windows = np.lib.stride_tricks.sliding_window_view(codes, 3, axis=1)
+        probabilities = np.exp(motifs.window_log_probabilities(windows, profile))
+        self.assertAlmostEqual(probabilities[0, 0], 0.5 * 0.5 * 0.5)
+        self.assertEqual(probabilities[1, 2], 0)  # window covers padding
+        self.assertEqual(motifs.most_probable(windows, profile).tolist(), [0, 0])
+
+        with self.assertRaises(ValueError):
+            motifs.encode_sequences(["ACG"], 4)
+
+    def test_motif_set(self):
+        """Test cached statistics match direct counting and follow replacements."""
+        motif_set = motifs.MotifSet(["AACGTA", "CCCGTT", "CACCTT", "GGATTA", "TTCCGG"])
+        self.assertEqual(motif_set.counts_dict(), {
+            'A': [1, 2, 1, 0, 0, 2], 'C': [2, 1, 4, 2, 0, 0], 'G': [1, 1, 0, 2, 1, 1], 'T': [1, 1, 0, 1, 4, 2]
+        })
+        self.assertEqual(motif_set.consensus(), "CACCTA")
+        self.assertEqual(motif_set.score(), 14)
+        self.assertAlmostEqual(motif_set.profile_dict()['C'][2], 0.8)
+        self.assertIs(motif_set.profile(), motif_set.profile())
+
+        for index, motif in ((0, "GGGGGG"), (4, "GGAATA"), (0, "AACGTA")):
+            motif_set.replace(index, motif)
+            expected = motifs.MotifSet([motif_set[i] for i in range(len(motif_set))])
+            self.assertEqual(motif_set.counts.tolist(), expected.counts.tolist())
+            self.assertEqual(motif_set.consensus(), expected.consensus())
+            self.assertEqual(motif_set.score(), expected.score())
+            self.assertAlmostEqual(motif_set.entropy(), expected.entropy())
+        self.assertEqual(motif_set[4], "GGAATA")
+        coded = motifs.MotifSet.from_codes(motif_set.codes)
+        coded.replace(1, motif_set.codes[0])
+        self.assertEqual(coded[1], "AACGTA")
+        self.assertEqual(motif_set[1], "CCCGTT")
+        without = motifs.MotifSet([motif_set[i] for i in range(1, len(motif_set))])
+        self.assertEqual(motif_set.counts_without(0).tolist(), without.counts.tolist())
+
+        with self.assertRaises(ValueError):
+            motifs.MotifSet(["ACGT", "ACG"])
+        with self.assertRaises(ValueError):
+            motif_set.replace(0, "ACGTNA")
+        with self.assertRaises(ValueError):
+            motifs.MotifSet.from_codes(motifs.encode_sequences(["ACGT", "AC"], 2))
+
+    def test_median_string(self):
+        """Test branch-and-bound median string against exhaustive search."""
+        sequences = ["AAATTGACGCAT", "GACGACCACGTT", "CGTCAGCGCCTG", "GCTGAGCACCGG", "AGTTCGGGACAG"]
+        self.assertEqual(motifs.median_string(sequences, 3), ("GAC", 2))
+
+        sequences = [sequence[:30] for sequence in self.sequences[:4]] + ["ACGTAC"]
+
+        def distance(pattern):
+            return sum(
+                min(sum(a != b for a, b in zip(pattern, sequence[i:i+4])) for i in range(len(sequence)-3))
+                for sequence in sequences
+            )
+        distances = {kmer: distance(kmer) for kmer in map(''.join, itertools.product("ACGT", repeat=4))}
+        pattern, best = motifs.median_string(sequences, 4)
+        self.assertEqual(best, min(distances.values()))
+        self.assertEqual(pattern, min(kmer for kmer, value in distances.items() if value == best))
+        self.assertEqual(BioLib().median_string(sequences, 4), (pattern, best))
+
+    def test_randomized_motif_search(self):
+        """Test randomized search recovers the implanted motif and is reproducible."""
+        result = motifs.randomized_motif_search(self.sequences, len(self.motif), restarts=200, seed=7)
+        self.assertEqual(result.positions, self.implanted)
+        self.assertEqual(result, motifs.randomized_motif_search(self.sequences, len(self.motif), restarts=200, seed=7))
+        self.assertEqual(result.motifs, [sequence[p:p+len(self.motif)] for sequence, p in zip(self.sequences, self.implanted)])
+
+    def test_gibbs_sampler(self):
+        """Test Gibbs sampling recovers the implanted motif with early stopping."""
+        result = motifs.gibbs_sampler(self.sequences, len(self.motif), iterations=500, restarts=10, seed=3, patience=200)
+        self.assertEqual(result.positions, self.implanted)
+        self.assertLessEqual(result.score, len(self.sequences))
+
+    def test_parallel_restarts(self):
+        """Test restarts across processes give the same result as a serial run."""
+        biolib = BioLib()
+        serial = biolib.gibbs_sampler(self.sequences, len(self.motif), iterations=100, restarts=4, seed=11)
+        biolib.set_workers(2)
+        self.assertEqual(biolib.gibbs_sampler(self.sequences, len(self.motif), iterations=100, restarts=4, seed=11), serial)
+
+
+if __name__ == '__main__':
+    unittest.main()
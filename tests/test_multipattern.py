@@ -0,0 +1,57 @@
+import random
+import unittest
+from biolib.core.biolib import BioLib
+from biolib.core.multipattern import AhoCorasick
+
+
+def reference_positions(text, pattern):
+    """Plain scan used as the oracle."""
+    return [i for i in range(len(text)-len(pattern)+1) if text[i:i+len(pattern)] == pattern]
+
+
+class TestAhoCorasick(unittest.TestCase):
+    def setUp(self):
+        """Set up a seeded random text and overlapping keywords."""
+        generator = random.Random(17)
+        self.text = ''.join(generator.choice("ACGT") for _ in range(4000))
+        self.patterns = ["A", "AC", "ACG", "CGT", "GTACG", "TTTT", self.text[50:70], "NNN"]
+
+    def test_search(self):
+        """Test every keyword, including nested ones, is found at every offset."""
+        result = AhoCorasick(self.patterns).search(self.text)
+        for pattern in self.patterns:
+            self.assertEqual(result[pattern], reference_positions(self.text, pattern))
+
+    def test_classic_example(self):
+        """Test the textbook he/she/his/hers example."""
+        result = AhoCorasick(["he", "she", "his", "hers"]).search("ushers")
+        self.assertEqual(result, {"he": [2], "she": [1], "his": [], "hers": [2]})
+
+    def test_chained_scan(self):
+        """Test hits spanning two scanned chunks are found."""
+        automaton = AhoCorasick(["GATTACA"])
+        matches = []
+        state = automaton.scan("CCGAT", matches=matches)
+        automaton.scan("TACACC", state, 5, matches)
+        self.assertEqual(matches, [(9, 0)])
+
+    def test_biolib_match_patterns(self):
+        """Test batch queries agree with match_pattern and reverse complements."""
+        biolib = BioLib()
+        biolib.set_genome(self.text)
+        patterns = self.patterns[:-1]
+        result = biolib.match_patterns(patterns)
+        self.assertEqual(result, {pattern: biolib.match_pattern(pattern) for pattern in patterns})
+        self.assertEqual(biolib.count_patterns(patterns), {pattern: len(result[pattern]) for pattern in patterns})
+
+        biolib.set_genome("ACGTTTGCAAACGT")
+        result = biolib.match_patterns(["ACG", "TTGC", "ACGT"], reverse_complement=True)
+        self.assertEqual(result, {"ACG": [0, 1, 10, 11], "TTGC": [4, 6], "ACGT": [0, 10]})
+        self.assertEqual(biolib.match_patterns(["ACG", "ACG"]), {"ACG": [0, 10]})
+        self.assertEqual(biolib.count_patterns(["ACG", "CGT", "ACG"], reverse_complement=True), {"ACG": 4, "CGT": 4})
+        with self.assertRaises(ValueError):
+            biolib.match_patterns(["AC", ""])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import random
+import unittest
+from biolib.core import orfs
+from biolib.core.biolib import BioLib
+from biolib.core.complement import reverse_complement
+from biolib.core.orfs import Orf
+
+
+def reference_orfs(sequence, min_length):
+    """Codon walk over each linear frame, used as the oracle."""
+    stops = {"TAA", "TAG", "TGA"}
+    found = set()
+    for strand, text in (('+', sequence), ('-', reverse_complement(sequence))):
+        for frame in range(3):
+            start = None
+            for i in range(frame, len(text) - 2, 3):
+                codon = text[i:i+3]
+                if start is None and codon == "ATG":
+                    start = i
+                elif start is not None and codon in stops:
+                    if (i - start) // 3 >= min_length:
+                        if strand == '+':
+                            found.add(Orf(start, i + 3, '+', frame))
+                        else:
+                            found.add(Orf(len(text) - i - 3, len(text) - start, '-', frame))
+                    start = None
+    return found
+
+
+def reference_circular_orfs(sequence, min_length):
+    """Codon walk from every start around the origin, keeping the longest ORF per stop, used as the oracle."""
+    stops = {"TAA", "TAG", "TGA"}
+    length = len(sequence)
+    longest = {}
+    for strand, text in (('+', sequence), ('-', reverse_complement(sequence))):
+        doubled = text + text
+        for start in range(length):
+            if doubled[start:start+3] != "ATG":
+                continue
+            for end in range(start + 3, start + length + 1, 3):
+                if doubled[end-3:end] in stops:
+                    previous = longest.get((strand, end % length))
+                    if previous is None or end - start > previous[1] - previous[0]:
+                        longest[(strand, end % length)] = (start, end)
+                    break
+    found = set()
+    for (strand, _), (start, end) in longest.items():
+        if (end - start) // 3 - 1 < min_length:
+            continue
+        if strand == '+':
+            found.add(Orf(start, end - length if end > length else end, '+', start % 3))
+        else:
+            forward_start = length - end
+            found.add(Orf(forward_start + length if forward_start < 0 else forward_start, length - start, '-', start % 3))
+    return found
+
+
+class TestOrfs(unittest.TestCase):
+    def setUp(self):
+        """Set up a seeded random genome."""
+        generator = random.Random(31)
+        self.sequence = ''.join(generator.choice("ACGT") for _ in range(3000))
+
+    def test_linear_orfs(self):
+        """Test six-frame ORFs against the codon walk."""
+        for min_length in (0, 5, 20):
+            self.assertEqual(set(orfs.find_orfs(self.sequence, min_length)), reference_orfs(self.sequence, min_length))
+
+    def test_simple_orfs(self):
+        """Test nested starts give one ORF and unterminated ones are dropped."""
+        sequence = "CCATGAAAATGTAGCCATGCC"
+        self.assertEqual(list(orfs.find_orfs(sequence, 1)), [Orf(2, 14, '+', 2)])
+        self.assertEqual(orfs.translate_orfs(sequence, [Orf(2, 14, '+', 2)]), ["MKM"])
+        self.assertEqual(list(orfs.find_orfs("", 0)), [])
+
+    def test_circular_orfs(self):
+        """Test ORFs crossing the origin of a circular genome."""
+        sequence = "AAATAGCCATGCCC"
+        # ATG at 8 reads CCC AAA TAG across the origin
+        result = set(orfs.find_orfs(sequence, 1, circular=True))
+        self.assertIn(Orf(8, 6, '+', 2), result)
+        self.assertEqual(orfs.translate_orfs(sequence, [Orf(8, 6, '+', 2)]), ["MPK"])
+        self.assertNotIn(Orf(8, 6, '+', 2), set(orfs.find_orfs(sequence, 1)))
+
+        # The same ORF on the reverse strand
+        complemented = reverse_complement(sequence)
+        result = set(orfs.find_orfs(complemented, 1, circular=True))
+        self.assertIn(Orf(8, 6, '-', 2), result)
+        self.assertEqual(orfs.translate_orfs(complemented, [Orf(8, 6, '-', 2)]), ["MPK"])
+
+    def test_circular_brute_force(self):
+        """Test small circular genomes against the circular codon walk, one ORF per stop."""
+        self.assertIn(Orf(28, 5, '-', 0), set(orfs.find_orfs("TACATATACCTGCATGAACGGATGTGCCC", 1, circular=True)))
+        generator = random.Random(7)
+        for _ in range(2000):
+            sequence = ''.join(generator.choice("ACGT") for _ in range(generator.randint(3, 60)))
+            min_length = generator.randint(0, 3)
+            found = list(orfs.find_orfs(sequence, min_length, circular=True))
+            self.assertEqual(len(found), len(set(found)))
+            self.assertEqual(set(found), reference_circular_orfs(sequence, min_length))
+
+    def test_circular_matches_rotation(self):
+        """Rotating a circular genome only shifts its ORFs."""
+        sequence = self.sequence[:1500]
+        rotation = 700
+        rotated = sequence[rotation:] + sequence[:rotation]
+        length = len(sequence)
+
+        def shifted(orf):
+            return (orf.strand, (orf.start - rotation) % length, (orf.end - rotation) % length)
+
+        original = {shifted(orf) for orf in orfs.find_orfs(sequence, 10, circular=True)}
+        moved = {(orf.strand, orf.start % length, orf.end % length) for orf in orfs.find_orfs(rotated, 10, circular=True)}
+        self.assertEqual(original, moved)
+
+    def test_biolib_find_orfs(self):
+        """Test the BioLib entry point streams records for the current genome."""
+        biolib = BioLib()
+        biolib.set_genome(self.sequence)
+        found = biolib.find_orfs(30)
+        self.assertEqual(set(found), reference_orfs(self.sequence, 30))
+        some = list(biolib.find_orfs(30))[:3]
+        self.assertTrue(all(protein.startswith("M") for protein in biolib.translate_orfs(some)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import random
+import unittest
+from unittest.mock import patch
+from biolib.core.biolib import BioLib
+from biolib.core.encoding import INVALID_CODE, encode
+from biolib.core.genome import CircularGenome, GenomeFactory
+from biolib.core.packed import CircularView, PackedSequence
+
+
+class TestPackedSequence(unittest.TestCase):
+    def setUp(self):
+        """Set up a sequence mixing ACGT, IUPAC runs and soft-masked bases."""
+        generator = random.Random(3)
+        bases = ''.join(generator.choice("ACGT") for _ in range(500))
+        self.sequence = bases[:100] + "NNNNNN" + bases[100:200] + "RYK" + bases[200:300].lower() + bases[300:] + "N"
+
+    def test_round_trip(self):
+        """Test decoding gives back the original text."""
+        packed = PackedSequence(self.sequence)
+        self.assertEqual(len(packed), len(self.sequence))
+        self.assertEqual(str(packed), self.sequence)
+        self.assertEqual(str(PackedSequence("")), "")
+
+    def test_slicing(self):
+        """Test slices and indexes decode only the requested span correctly."""
+        packed = PackedSequence(self.sequence)
+        for key in [slice(0, 10), slice(95, 115), slice(205, 215), slice(300, 420), slice(-5, None),
+                    slice(None, None, 3), slice(400, 100, -7), slice(10, 5)]:
+            self.assertEqual(packed[key], self.sequence[key])
+        self.assertEqual(packed[101], "N")
+        self.assertEqual(packed[-1], "N")
+        with self.assertRaises(IndexError):
+            packed[len(self.sequence)]
+
+    def test_codes_and_kmers(self):
+        """Test code extraction agrees with encoding the decoded text."""
+        packed = PackedSequence(self.sequence)
+        self.assertEqual(packed.codes(90, 320).tolist(), encode(self.sequence[90:320]).tolist())
+        self.assertEqual(packed.kmer(0, 4), int(''.join(str(c) for c in encode(self.sequence[:4])), 4))
+        with self.assertRaises(ValueError):
+            packed.kmer(98, 4)
+        self.assertEqual(packed.codes(100, 101).tolist(), [INVALID_CODE])
+
+    def test_memory(self):
+        """Packed storage takes about a quarter of a byte per base."""
+        sequence = "ACGT" * 25000
+        self.assertLessEqual(PackedSequence(sequence).nbytes, len(sequence) // 4 + 64)
+
+    def test_circular_view(self):
+        """Test wrap-around view against the concatenated extended sequence."""
+        sequence = "ATGCATGCA"
+        extended = sequence + sequence[:len(sequence)//2]
+        for storage in (sequence, PackedSequence(sequence)):
+            view = CircularView(storage, len(extended))
+            self.assertEqual(len(view), len(extended))
+            self.assertEqual(view[:], extended)
+            self.assertEqual(view[7:12], extended[7:12])
+            self.assertEqual(view[-1], extended[-1])
+            self.assertEqual(view[::2], extended[::2])
+            self.assertEqual(view.codes(5, 13).tolist(), encode(extended[5:13]).tolist())
+
+    def test_packed_genome(self):
+        """Test genomes created with packed storage behave like plain ones."""
+        genome = GenomeFactory.create_genome("circular", self.sequence, "packed")
+        self.assertIsInstance(genome, CircularGenome)
+        self.assertIsInstance(genome.get_storage(), PackedSequence)
+        self.assertEqual(genome.get_sequence(), self.sequence)
+        self.assertEqual(
+            genome.get_extended_sequence(),
+            self.sequence + self.sequence[:len(self.sequence)//2]
+        )
+        self.assertIsNone(GenomeFactory.create_genome("linear", self.sequence, "invalid"))
+
+    def test_packed_queries(self):
+        """Test queries on packed storage match plain ones without decoding the whole genome."""
+        for genome_type in ("linear", "circular"):
+            plain, packed = BioLib(), BioLib()
+            plain.set_genome(self.sequence.upper(), genome_type)
+            packed.set_genome(self.sequence.upper(), genome_type, storage='packed')
+            plain.build_index()
+            packed.build_index()
+            with patch.object(PackedSequence, '__str__', side_effect=AssertionError("decoded in full")):
+                packed.track_pattern("ACG")
+                packed.track_kmers(4, canonical=True)
+                packed.track_skew()
+                self.assertEqual(packed.count_pattern("ACG"), plain.count_pattern("ACG"))
+                for k, canonical in ((3, False), (4, True)):
+                    for result, expected in zip(packed.kmer_counts(k, canonical), plain.kmer_counts(k, canonical)):
+                        self.assertEqual(result.tolist(), expected.tolist())
+                self.assertEqual(packed.get_minimum_skew(), plain.get_minimum_skew())
+                self.assertEqual(packed.translate_six_frames(), plain.translate_six_frames())
+                genome_orfs = list(packed.find_orfs(5))
+                self.assertEqual(genome_orfs, list(plain.find_orfs(5)))
+                self.assertEqual(packed.translate_orfs(genome_orfs), plain.translate_orfs(genome_orfs))
+                pattern = self.sequence[40:64].upper()
+                self.assertEqual(
+                    packed.match_approximate_pattern(pattern, 2), plain.match_approximate_pattern(pattern, 2)
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
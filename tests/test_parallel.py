@@ -0,0 +1,97 @@
+import gc
+import random
+import unittest
+import weakref
+from biolib.core.biolib import BioLib
+from biolib.core.packed import PackedSequence
+from biolib.core.parallel import ParallelScanner
+
+
+class TestParallelScanner(unittest.TestCase):
+    def setUp(self):
+        """Set up a seeded genome and a serial BioLib to compare against."""
+        generator = random.Random(19)
+        self.sequence = ''.join(generator.choice("ACGT") for _ in range(20000))
+        self.serial = BioLib()
+        self.serial.set_genome(self.sequence)
+
+    def test_scans_merge_exactly(self):
+        """Test chunked results equal the serial scans, including hits spanning chunks."""
+        pattern = self.sequence[999:1005]
+        with ParallelScanner(self.sequence, workers=2, chunk_size=1000) as scanner:
+            self.assertEqual(scanner.match_pattern(pattern), self.serial.match_pattern(pattern))
+            self.assertEqual(scanner.count_pattern("ACG"), self.serial.count_pattern("ACG"))
+            self.assertEqual(
+                scanner.match_approximate_pattern(pattern, 2),
+                self.serial.match_approximate_pattern(pattern, 2)
+            )
+            self.assertEqual(scanner.frequency_map(3), self.serial.frequency_map(self.sequence, 3))
+            self.assertEqual(scanner.get_minimum_skew(), self.serial.get_minimum_skew())
+
+    def test_packed_storage(self):
+        """Test lazy storage is copied into shared memory chunk by chunk."""
+        with ParallelScanner(PackedSequence(self.sequence), workers=2, chunk_size=3000) as scanner:
+            self.assertEqual(scanner.match_pattern("GATTA"), self.serial.match_pattern("GATTA"))
+
+    def test_biolib_workers(self):
+        """Test BioLib dispatches to the process pool once workers are set."""
+        biolib = BioLib()
+        biolib.set_genome(self.sequence)
+        biolib.set_workers(2)
+        biolib.parallel_min_length = 1000
+        self.assertEqual(biolib.match_pattern("ACGTA"), self.serial.match_pattern("ACGTA"))
+        self.assertEqual(biolib.count_approximate_pattern("ACGTACGT", 2), self.serial.count_approximate_pattern("ACGTACGT", 2))
+        self.assertEqual(biolib.get_minimum_skew(), self.serial.get_minimum_skew())
+        self.assertEqual(biolib.frequency_map(self.sequence, 3), self.serial.frequency_map(self.sequence, 3))
+
+    def test_circular_genome(self):
+        """Test parallel scans of a circular genome match the serial scans, which are linear."""
+        sequence = self.sequence[-3:] + self.sequence[:5000] + self.sequence[:3]
+        serial, parallel = BioLib(), BioLib()
+        serial.set_genome(sequence, 'circular')
+        parallel.set_genome(sequence, 'circular')
+        parallel.set_workers(2)
+        parallel.parallel_min_length = 1000
+        pattern = sequence[-3:] + sequence[:3]
+        self.assertEqual(parallel.count_pattern(pattern), serial.count_pattern(pattern))
+        self.assertEqual(parallel.count_pattern("ACG"), serial.count_pattern("ACG"))
+        self.assertEqual(parallel.match_pattern(pattern), serial.match_pattern(pattern))
+        self.assertIsNotNone(parallel.scanner)
+        parallel.close()
+
+    def test_biolib_scanner_reuse(self):
+        """Test one scanner serves every query until the genome changes."""
+        with BioLib() as biolib:
+            biolib.set_genome(self.sequence)
+            biolib.set_workers(2)
+            biolib.parallel_min_length = 1000
+            biolib.count_pattern("ACG")
+            scanner = biolib.scanner
+            memory = scanner.memory
+            biolib.match_pattern("GATTA")
+            self.assertIs(biolib.scanner, scanner)
+            self.assertIs(scanner.memory, memory)
+            biolib.set_genome(self.sequence[:5000])
+            self.assertIsNone(biolib.scanner)
+            self.assertIsNone(scanner.memory)
+            self.serial.set_genome(self.sequence[:5000])
+            self.assertEqual(biolib.count_pattern("ACG"), self.serial.count_pattern("ACG"))
+        self.assertIsNone(biolib.scanner)
+
+    def test_replaced_scanners_released(self):
+        """Test scanners of earlier genomes are not kept alive by their finalizers."""
+        with BioLib() as biolib:
+            biolib.set_workers(2)
+            biolib.parallel_min_length = 1000
+            scanners = []
+            for length in (5000, 6000, 7000):
+                biolib.set_genome(self.sequence[:length])
+                biolib.count_pattern("ACG")
+                scanners.append(weakref.ref(biolib.scanner))
+            biolib.set_genome(self.sequence[:4000])
+            gc.collect()
+            self.assertEqual([scanner() for scanner in scanners], [None, None, None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import gzip
+import io
+import os
+import random
+import tempfile
+import unittest
+from biolib.core import kmers, reads
+from biolib.core.biolib import BioLib
+from biolib.core.reads import Read
+
+
+class TestReads(unittest.TestCase):
+    def setUp(self):
+        """Set up seeded random reads, some carrying a mutated adapter, written as FASTQ and gzipped FASTA."""
+        generator = random.Random(71)
+        self.adapter = "AGATCGGAAGAGC"
+        self.reads = []
+        for i in range(500):
+            sequence = [generator.choice("ACGTN" if i % 50 == 0 else "ACGT") for _ in range(generator.randrange(20, 80))]
+            if i % 7 == 0:
+                copy = list(self.adapter)
+                copy[generator.randrange(len(copy))] = 'T'
+                position = generator.randrange(len(sequence) + 1)
+                sequence[position:position] = copy
+            quality = ''.join(generator.choice("#?I") for _ in sequence)
+            self.reads.append(Read(f"read{i} lane1", ''.join(sequence), quality))
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.fastq = os.path.join(directory.name, "reads.fastq")
+        with open(self.fastq, 'w') as output:
+            reads.write_reads(self.reads, output)
+        self.fasta = os.path.join(directory.name, "reads.fa.gz")
+        with gzip.open(self.fasta, 'wt') as output:
+            for read in self.reads:
+                # wrapped over several lines
+                lines = [read.sequence[i:i+30] for i in range(0, len(read.sequence), 30)]
+                output.write(f">{read.name}\n" + '\n'.join(lines) + '\n')
+
+    def test_parse_reads(self):
+        """Test FASTQ and multi-line gzipped FASTA parsing."""
+        self.assertEqual(list(reads.read_file(self.fastq)), self.reads)
+        self.assertEqual(list(reads.read_file(self.fasta)), [Read(r.name, r.sequence) for r in self.reads])
+        self.assertEqual(list(reads.parse_reads(io.StringIO(""))), [])
+        with self.assertRaises(ValueError):
+            list(reads.parse_reads(io.StringIO("ACGT\n")))
+        with self.assertRaises(ValueError):
+            list(reads.parse_reads(io.StringIO("@r\nACGT\n+\nII\n")))
+
+    def test_fastq_blank_lines(self):
+        """Test blank lines between FASTQ records are skipped and stray lines name their line."""
+        text = "@r1\nACGT\n+\nIIII\n\n@r2\nGG\n+\nII\n\n\n@r3\n\n+\n\n"
+        self.assertEqual(list(reads.parse_reads(io.StringIO(text))), [
+            Read("r1", "ACGT", "IIII"), Read("r2", "GG", "II"), Read("r3", "", ""),
+        ])
+        with self.assertRaisesRegex(ValueError, "line 6"):
+            list(reads.parse_reads(io.StringIO("@r1\nACGT\n+\nIIII\n\nACGT\n")))
+
+    def test_batches(self):
+        """Test reads are grouped into bounded batches."""
+        batches = list(reads.batch_reads(self.reads, 64))
+        self.assertEqual([len(batch) for batch in batches], [64] * 7 + [52])
+        self.assertEqual([read for batch in batches for read in batch], self.reads)
+
+    def test_reverse_complement_reads(self):
+        """Test reverse complementing reverses the qualities too."""
+        result = list(reads.reverse_complement_reads([Read("r", "AACG", "#?II")]))
+        self.assertEqual(result, [Read("r", "CGTT", "II?#")])
+        output = io.StringIO()
+        reads.write_reads(result, output)
+        self.assertEqual(output.getvalue(), "@r\nCGTT\n+\nII?#\n")
+
+    def test_process_reads(self):
+        """Test batched aggregation matches per-read computation."""
+        biolib = BioLib()
+        count, approximate, frequencies, totals = biolib.process_reads(self.fastq, [
+            reads.PatternCount("ACG"),
+            reads.ApproximateMatch(self.adapter, 1),
+            reads.KmerFrequencies(4),
+            reads.ReadCount(),
+        ], batch_size=37)
+
+        expected_count, expected_reads, expected_matches = 0, 0, 0
+        expected_frequencies = {}
+        for read in self.reads:
+            biolib.set_genome(read.sequence)
+            expected_count += biolib.count_pattern("ACG")
+            matches = biolib.count_approximate_pattern(self.adapter, 1) if len(read.sequence) >= len(self.adapter) else 0
+            expected_matches += matches
+            expected_reads += matches > 0
+            for kmer, value in biolib.frequency_map(read.sequence, 4).items():
+                if set(kmer) <= set("ACGT"):
+                    expected_frequencies[kmer] = expected_frequencies.get(kmer, 0) + value
+
+        self.assertEqual(count, expected_count)
+        self.assertEqual(approximate, (expected_reads, expected_matches))
+        self.assertGreaterEqual(approximate.reads, len(self.reads) // 7)
+        self.assertEqual(frequencies, expected_frequencies)
+        self.assertEqual(totals, (len(self.reads), sum(len(read.sequence) for read in self.reads)))
+
+    def test_sparse_kmer_frequencies(self):
+        """Test large k merges sorted batches to the same counts."""
+        k = kmers.DENSE_KMER_LENGTH + 1
+        frequencies = reads.KmerFrequencies(k)
+        self.assertIsNone(frequencies.dense)
+        sparse = reads.process_reads(self.reads, [frequencies], batch_size=50)[0]
+        expected = {}
+        for read in self.reads:
+            for i in range(len(read.sequence) - k + 1):
+                kmer = read.sequence[i:i+k]
+                if 'N' not in kmer:
+                    expected[kmer] = expected.get(kmer, 0) + 1
+        self.assertEqual(sparse, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
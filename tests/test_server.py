@@ -0,0 +1,130 @@
+import asyncio
+import json
+import unittest
+import urllib.error
+import urllib.request
+from biolib.server import BioLibServer, GenomeSpec, main, parse_genome
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        """Start a server on a free localhost port with two preloaded genomes."""
+        self.server = BioLibServer(
+            [GenomeSpec("a", sequence="ACGTACGTTTACGTAGG"), GenomeSpec("b", sequence="GGGCCCAT", index=True)],
+            port=0, workers=2, executor='thread', batch_window=0.01,
+        )
+        await self.server.start()
+        self.addAsyncCleanup(self.server.close)
+
+    async def request(self, path, payload=None):
+        """Send one request from a worker thread, returning status and decoded JSON."""
+        url = f"http://127.0.0.1:{self.server.port}/{path}"
+        data = json.dumps(payload).encode() if payload is not None else None
+
+        def send():
+            try:
+                with urllib.request.urlopen(urllib.request.Request(url, data=data)) as response:
+                    return response.status, json.loads(response.read())
+            except urllib.error.HTTPError as error:
+                return error.code, json.loads(error.read())
+        return await asyncio.to_thread(send)
+
+    async def test_queries(self):
+        """Test single queries against named genomes."""
+        self.assertEqual(await self.request("count_pattern", {"genome": "a", "pattern": "ACG"}), (200, {"result": 3}))
+        self.assertEqual(await self.request("match_pattern", {"genome": "b", "pattern": "CC"}), (200, {"result": [3, 4]}))
+        self.assertEqual(
+            await self.request("match_approximate_pattern", {"genome": "a", "pattern": "ACGA", "max_difference": 1}),
+            (200, {"result": [0, 4, 10]})
+        )
+        self.assertEqual(await self.request("reverse_complement", {"genome": "a", "text": "AAC"}), (200, {"result": "GTT"}))
+        self.assertEqual(await self.request("genomes"), (200, ["a", "b"]))
+        self.assertEqual(await self.request("health"), (200, {"status": "ok"}))
+
+    async def test_errors(self):
+        """Test bad requests are reported without stopping the service."""
+        self.assertEqual((await self.request("count_pattern", {"pattern": "A"}))[0], 400)
+        self.assertEqual((await self.request("count_pattern", {"genome": "a"}))[0], 400)
+        self.assertEqual((await self.request("count_pattern", {"genome": "a", "pattern": ""}))[0], 400)
+        self.assertEqual((await self.request("nothing", {}))[0], 404)
+        self.assertEqual((await self.request("batch", {"queries": 3}))[0], 400)
+
+        status, batch = await self.request("batch", {"queries": [
+            {"operation": "count_pattern", "genome": ["a"], "pattern": "A"},
+            {"operation": "count_pattern", "genome": "a", "pattern": "A"},
+        ]})
+        self.assertEqual(status, 200)
+        self.assertIn("error", batch[0])
+        self.assertEqual(batch[1], {"result": 4})
+        results = await asyncio.gather(
+            self.request("count_pattern", {"genome": {"name": "a"}, "pattern": "A"}),
+            self.request("count_pattern", {"genome": "a", "pattern": "A"}),
+        )
+        self.assertEqual(results[0][0], 400)
+        self.assertEqual(results[1], (200, {"result": 4}))
+
+    async def test_batching_and_metrics(self):
+        """Test concurrent queries are batched and /batch runs many at once."""
+        patterns = ["A", "AC", "ACG", "T", "GG"] * 4
+        results = await asyncio.gather(*(self.request("count_pattern", {"genome": "a", "pattern": p}) for p in patterns))
+        expected = {"A": 4, "AC": 3, "ACG": 3, "T": 5, "GG": 1}
+        self.assertEqual([result[1]["result"] for result in results], [expected[p] for p in patterns])
+
+        status, batch = await self.request("batch", {"queries": [
+            {"operation": "count_pattern", "genome": "b", "pattern": "G"},
+            {"operation": "get_minimum_skew", "genome": "b"},
+            {"operation": "frobnicate"},
+        ]})
+        self.assertEqual(status, 200)
+        self.assertEqual(batch[:2], [{"result": 3}, {"result": [0, 6, 7, 8]}])
+        self.assertIn("error", batch[2])
+
+        _, metrics = await self.request("metrics")
+        self.assertEqual(metrics["count_pattern"]["count"], len(patterns))
+        self.assertGreaterEqual(metrics["count_pattern"]["p95_ms"], metrics["count_pattern"]["p50_ms"])
+        self.assertEqual(metrics["batch"]["count"], 1)
+
+        queries = [{"operation": "count_pattern", "genome": "a", "pattern": p} for p in patterns]
+        results = await asyncio.gather(*(self.server.query(query) for query in queries))
+        self.assertEqual([result["result"] for result in results], [expected[p] for p in patterns])
+        # batch tasks stay referenced until they finish
+        await asyncio.gather(*self.server.batches)
+        self.assertEqual(self.server.batches, set())
+
+    async def test_keep_alive(self):
+        """Test several requests over one HTTP/1.1 connection."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        body = json.dumps({"genome": "a", "pattern": "TT"}).encode()
+        for _ in range(3):
+            writer.write(b"POST /count_pattern HTTP/1.1\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+            await writer.drain()
+            self.assertIn(b"200", await reader.readline())
+            headers = {}
+            while (line := await reader.readline()).strip():
+                key, _, value = line.decode().partition(':')
+                headers[key.lower()] = value.strip()
+            self.assertEqual(json.loads(await reader.readexactly(int(headers["content-length"]))), {"result": 2})
+        writer.close()
+        await writer.wait_closed()
+
+
+class TestProcessServer(unittest.IsolatedAsyncioTestCase):
+    async def test_process_pool(self):
+        """Test genomes are loaded in process workers."""
+        async with BioLibServer([GenomeSpec("a", sequence="ACGTACGT")], port=0, workers=1) as server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            body = b'{"pattern": "CG"}'
+            writer.write(b"POST /count_pattern HTTP/1.0\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+            response = await reader.read()
+            writer.close()
+        self.assertTrue(response.endswith(b'{"result": 2}'))
+
+    def test_arguments(self):
+        """Test genome arguments are parsed as NAME=PATH."""
+        self.assertEqual(parse_genome("chr1=/data/chr1.fa"), GenomeSpec("chr1", "/data/chr1.fa"))
+        with self.assertRaises(SystemExit):
+            main(["--genome", "chr1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import random
+import unittest
+from biolib.core import skew
+from biolib.core.biolib import BioLib
+from biolib.core.genome import LinearGenome
+
+
+def reference_skew(sequence):
+    """Running G - C count, used as the oracle."""
+    values = [0]
+    for nucleotide in sequence:
+        values.append(values[-1] + (nucleotide == 'G') - (nucleotide == 'C'))
+    return values
+
+
+class TestSkew(unittest.TestCase):
+    def setUp(self):
+        """Set up a seeded random genome split into uneven chunks."""
+        generator = random.Random(23)
+        self.sequence = ''.join(generator.choice("ACGTN") for _ in range(5003))
+        self.genome = LinearGenome(self.sequence)
+
+    def test_skew_array(self):
+        """Test the vectorized running skew."""
+        self.assertEqual(skew.skew_array(self.genome.iter_chunks(chunk_size=700)).tolist(), reference_skew(self.sequence))
+        self.assertEqual(skew.skew_array([]).tolist(), [0])
+
+    def test_minimum_skew(self):
+        """Test streaming minimum across chunk boundaries, including ties."""
+        values = reference_skew(self.sequence)
+        expected = [i for i, value in enumerate(values) if value == min(values)]
+        for chunk_size in (1, 64, 999, 10000):
+            self.assertEqual(skew.minimum_skew(self.genome.iter_chunks(chunk_size=chunk_size)), expected)
+        self.assertEqual(skew.minimum_skew(LinearGenome("GAGCC").iter_chunks()), [0, 5])
+        self.assertEqual(skew.minimum_skew(LinearGenome("CCGG").iter_chunks(chunk_size=1)), [2])
+
+    def test_skew_profile(self):
+        """Test windowed summaries do not depend on the chunking."""
+        values = reference_skew(self.sequence)
+        for chunk_size in (1, 333, 1000, 6000):
+            profile = skew.skew_profile(self.genome.iter_chunks(chunk_size=chunk_size), 100)
+            self.assertEqual(profile.positions.tolist(), list(range(100, 5001, 100)) + [5003])
+            self.assertEqual(profile.skew.tolist(), [values[end] for end in profile.positions.tolist()])
+
+        profile = skew.skew_profile(LinearGenome("GGGCAAAA").iter_chunks(), 4)
+        self.assertEqual(profile.gc_skew.tolist(), [0.5, 0.0])
+
+    def test_biolib_profile(self):
+        """Test the BioLib skew profile entry point."""
+        biolib = BioLib()
+        biolib.set_genome("GGCCGGAA")
+        profile = biolib.get_skew_profile(3)
+        self.assertEqual(profile.positions.tolist(), [3, 6, 8])
+        self.assertEqual(profile.skew.tolist(), [1, 2, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
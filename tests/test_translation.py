@@ -0,0 +1,78 @@
+import random
+import unittest
+from unittest.mock import patch
+from biolib.core import translation
+from biolib.core.biolib import BioLib
+from biolib.core.complement import reverse_complement
+
+
+def reference_translate(sequence, genetic_code=1):
+    """Codon-by-codon translation through the NCBI string, used as the oracle."""
+    order = "TCAG"
+    amino_acids = translation.NCBI_GENETIC_CODES[genetic_code]
+    sequence = sequence.upper().replace("U", "T")
+    protein = ""
+    for i in range(0, len(sequence) - 2, 3):
+        codon = sequence[i:i+3]
+        if all(base in order for base in codon):
+            protein += amino_acids[16*order.index(codon[0]) + 4*order.index(codon[1]) + order.index(codon[2])]
+        else:
+            protein += "X"
+    return protein
+
+
+class TestTranslation(unittest.TestCase):
+    def setUp(self):
+        """Set up a seeded random DNA sequence."""
+        generator = random.Random(29)
+        self.sequence = ''.join(generator.choice("ACGT") for _ in range(1001))
+
+    def test_codon_table(self):
+        """Test a few well-known codons of the standard and mitochondrial codes."""
+        self.assertEqual(translation.translate("ATGTGGTAATAGTGA"), "MW***")
+        self.assertEqual(translation.translate("AUGUGA", genetic_code=2), "MW")
+        self.assertEqual(translation.translate("AGA", genetic_code=2), "*")
+        with self.assertRaises(ValueError):
+            translation.translate("ATG", genetic_code=99)
+
+    def test_translate(self):
+        """Test frames, RNA and lowercase input, partial codons and unknown bases."""
+        for frame in range(3):
+            self.assertEqual(translation.translate(self.sequence, frame), reference_translate(self.sequence[frame:]))
+        rna = self.sequence.replace("T", "U").lower()
+        self.assertEqual(translation.translate(rna), reference_translate(self.sequence))
+        self.assertEqual(translation.translate("ATGCCNTA"), "MX")
+        self.assertEqual(translation.translate("AT"), "")
+
+    def test_other_genetic_codes(self):
+        """Test every supported genetic code against the reference."""
+        for genetic_code in translation.NCBI_GENETIC_CODES:
+            self.assertEqual(
+                translation.translate(self.sequence, genetic_code=genetic_code),
+                reference_translate(self.sequence, genetic_code)
+            )
+
+    def test_six_frames(self):
+        """Test six-frame translation against per-frame translation."""
+        complemented = reverse_complement(self.sequence)
+        expected = [reference_translate(self.sequence[frame:]) for frame in range(3)]
+        expected += [reference_translate(complemented[frame:]) for frame in range(3)]
+        self.assertEqual(translation.translate_six_frames(self.sequence), expected)
+        self.assertEqual(translation.translate_six_frames("ANG")[3], "X")
+
+    def test_batch(self):
+        """Test batch translation keeps sequences apart."""
+        sequences = ["ATGAAATAG", "ATGCC", "", "TGGTGGT", self.sequence]
+        self.assertEqual(translation.translate_batch(sequences), [reference_translate(s) for s in sequences])
+
+    def test_biolib_chunked_translation(self):
+        """Test genome translation is unchanged by chunking."""
+        biolib = BioLib()
+        biolib.set_genome(self.sequence)
+        with patch('biolib.core.biolib.CHUNK_SIZE', 100):
+            self.assertEqual(biolib.translate_rna_to_amino_acid(), reference_translate(self.sequence))
+        self.assertEqual(biolib.translate_six_frames()[1], reference_translate(self.sequence[1:]))
+
+
+if __name__ == '__main__':
+    unittest.main()